@@ -0,0 +1,91 @@
+"""Synthetic graphs for benchmarks
+
+Graph kinds:
+    - erdos_renyi: uniformly random couples (G(n, m) model)
+    - power_law: preferential attachment, a few hub nodes with large degree
+    - multi_edge: small number of couples with many edges in each couple
+    - loops: half of edges are loops
+
+Graph sizes (number of edges) are selected by `--graph-sizes` option, for
+example `--graph-sizes=small,medium,large` (default: small,medium).
+"""
+
+import random
+import pytest
+
+
+GRAPH_KINDS = ('erdos_renyi', 'power_law', 'multi_edge', 'loops')
+
+GRAPH_SIZES = {
+    'small': 1_000,
+    'medium': 10_000,
+    'large': 100_000,
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--graph-sizes', default='small,medium',
+        help=f'comma separated graph sizes: {", ".join(GRAPH_SIZES)}')
+
+
+def pytest_generate_tests(metafunc):
+    if 'graph_spec' in metafunc.fixturenames:
+        sizes = metafunc.config.getoption('graph_sizes').split(',')
+        specs = [(kind, size) for size in sizes for kind in GRAPH_KINDS]
+        metafunc.parametrize(
+            'graph_spec', specs, ids=[f'{kind}-{size}' for kind, size in specs],
+            scope='module')
+
+
+def _couples(kind: str, number_of_edges: int, generator: random.Random) -> list:
+    """Returns couples of synthetic graph"""
+    number_of_nodes = max(number_of_edges // 5, 2)
+    nodes = [f'node_{number}' for number in range(number_of_nodes)]
+
+    if kind == 'erdos_renyi':
+        return [
+            (generator.choice(nodes), generator.choice(nodes))
+            for _ in range(number_of_edges)]
+
+    if kind == 'power_law':
+        endpoints = nodes[:2]
+        couples = []
+        for number in range(number_of_edges):
+            node_l = nodes[number % number_of_nodes]
+            node_r = generator.choice(endpoints)
+            couples.append((node_l, node_r))
+            endpoints.extend((node_l, node_r))
+        return couples
+
+    if kind == 'multi_edge':
+        hubs = nodes[:max(number_of_nodes // 20, 2)]
+        return [
+            (generator.choice(hubs), generator.choice(hubs))
+            for _ in range(number_of_edges)]
+
+    if kind == 'loops':
+        couples = []
+        for number in range(number_of_edges):
+            node_l = generator.choice(nodes)
+            node_r = node_l if number % 2 == 0 else generator.choice(nodes)
+            couples.append((node_l, node_r))
+        return couples
+
+    raise ValueError(f'unknown graph kind: {kind}')
+
+
+def make_edges(kind: str, size: str, seed: int = 37) -> dict:
+    """Returns edges representation of synthetic graph"""
+    generator = random.Random(seed)
+    edges = {}
+    for number, couple in enumerate(_couples(kind, GRAPH_SIZES[size], generator)):
+        edges.setdefault(couple, {})[f'e{number}'] = {
+            'amount': generator.randrange(100, 10_000)}
+    return edges
+
+
+@pytest.fixture(scope='module')
+def edges(graph_spec):
+    """Edges representation of synthetic graph"""
+    return make_edges(*graph_spec)
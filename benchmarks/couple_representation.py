@@ -0,0 +1,61 @@
+"""Micro-benchmark of UndirectedGraph couple representation
+
+Compares sorting-based couple representation with comparison-based swap
+and interned couples on existing and new couples, and `has_edge` on both.
+
+Usage:
+    PYTHONPATH=. python benchmarks/couple_representation.py
+"""
+
+import random
+import timeit
+from connectionz import UndirectedGraph
+
+
+NUMBER_OF_NODES = 1_000
+NUMBER_OF_EDGES = 20_000
+REPEAT = 5
+
+
+def sorted_couple_representation(couple):
+    """Previous couple representation"""
+    return tuple(sorted(couple))
+
+
+def best_of(statement) -> float:
+    """Returns the best time of statement over repeats, in seconds"""
+    return min(timeit.repeat(statement, number=1, repeat=REPEAT))
+
+
+def main():
+    generator = random.Random(36)
+    nodes = [f'node_{number}' for number in range(NUMBER_OF_NODES)]
+    couples = [
+        (generator.choice(nodes), generator.choice(nodes))
+        for _ in range(NUMBER_OF_EDGES)]
+    graph = UndirectedGraph()
+    for node_l, node_r in couples:
+        graph.add_edge(node_l, node_r, recalculate_calculated_attributes=False)
+    missing = [
+        (generator.choice(nodes), generator.choice(nodes))
+        for _ in range(NUMBER_OF_EDGES)]
+
+    representation = graph._couple_representation
+    results = {
+        'sorted, existing couples': best_of(
+            lambda: [sorted_couple_representation(couple) for couple in couples]),
+        'interned, existing couples': best_of(
+            lambda: [representation(couple) for couple in couples]),
+        'sorted, new couples': best_of(
+            lambda: [sorted_couple_representation(couple) for couple in missing]),
+        'swap, new couples': best_of(
+            lambda: [representation(couple) for couple in missing]),
+        'has_edge, existing couples': best_of(
+            lambda: [graph.has_edge(node_l, node_r) for node_l, node_r in couples]),
+    }
+    for name, seconds in results.items():
+        print(f'{name:<28} {seconds / len(couples) * 1e9:8.1f} ns per call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+#!/bin/bash
+
+# script that runs benchmarks suite and
+# - saves baseline (mode "save")
+# - compares results with the latest saved baseline and fails if any benchmark
+#   is slower than threshold (mode "compare")
+
+# usage
+# - ./benchmarks/run_benchmarks.sh save [pytest options]
+# - ./benchmarks/run_benchmarks.sh compare [pytest options]
+# - BENCHMARK_THRESHOLD="median:25%" ./benchmarks/run_benchmarks.sh compare --graph-sizes=small
+
+# exit codes explanation
+# - exit code 1 = benchmarks failed or regression found
+# - exit code 2 = wrong mode
+
+MODE=$1
+shift
+
+STORAGE="file://./benchmarks/.baselines"
+THRESHOLD=${BENCHMARK_THRESHOLD:-"mean:15%"}
+
+case "$MODE" in
+    save)
+        python -m pytest benchmarks \
+            --benchmark-storage="$STORAGE" \
+            --benchmark-autosave \
+            "$@" || exit 1
+        ;;
+    compare)
+        python -m pytest benchmarks \
+            --benchmark-storage="$STORAGE" \
+            --benchmark-compare \
+            --benchmark-compare-fail="$THRESHOLD" \
+            "$@" || exit 1
+        ;;
+    *)
+        echo "Wrong mode \"$MODE\", use save or compare"
+        exit 2
+        ;;
+esac
@@ -0,0 +1,108 @@
+"""Benchmarks of DirectedGraph and UndirectedGraph operations
+
+- construction
+- `add_edge` with and without recalculation of calculated attributes
+- `del_node`
+- `get_subgraph`
+- `describe`
+- `__eq__`
+- `export_graph_to_json` and `import_graph_from_json`
+
+Benchmarks that mutate graph get a new copy of graph for each round.
+"""
+
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, export_graph_to_json, import_graph_from_json)
+
+
+GRAPH_CLASSES = [DirectedGraph, UndirectedGraph]
+
+NUMBER_OF_MUTATIONS = 100
+
+ROUNDS = 5
+
+
+def _copy(edges: dict) -> dict:
+    """Returns copy of edges representation (graph keeps attribute dicts)"""
+    return {
+        couple: {identifier: dict(attributes) for identifier, attributes in multiples.items()}
+        for couple, multiples in edges.items()}
+
+
+@pytest.fixture(scope='module')
+def graph(edges):
+    """DirectedGraph created from synthetic edges"""
+    return DirectedGraph(edges=_copy(edges))
+
+
+@pytest.mark.parametrize('graph_class', GRAPH_CLASSES, ids=lambda cls: cls.__name__)
+def test_construction(benchmark, edges, graph_class):
+    """Graph construction from edges representation"""
+    benchmark.pedantic(
+        graph_class, setup=lambda: ((), {'edges': _copy(edges)}), rounds=ROUNDS)
+
+
+@pytest.mark.parametrize('graph_class', GRAPH_CLASSES, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize(
+    'recalculate', [False, True], ids=['without_recalculation', 'with_recalculation'])
+def test_add_edge(benchmark, edges, graph_class, recalculate):
+    """Adding edges to existing graph"""
+    nodes = [node for couple in list(edges)[:NUMBER_OF_MUTATIONS] for node in couple]
+
+    def add_edges(graph):
+        for number in range(NUMBER_OF_MUTATIONS):
+            graph.add_edge(
+                nodes[number], nodes[-number - 1], f'new{number}',
+                recalculate_calculated_attributes=recalculate, amount=number)
+
+    benchmark.pedantic(
+        add_edges, setup=lambda: ((graph_class(edges=_copy(edges)),), {}),
+        rounds=ROUNDS)
+
+
+def test_del_node(benchmark, edges):
+    """Removing nodes with incident edges"""
+    nodes = list(dict.fromkeys(node for couple in edges for node in couple))
+    selected = nodes[:NUMBER_OF_MUTATIONS // 10]
+
+    def del_nodes(graph):
+        for node in selected:
+            graph.del_node(node)
+
+    benchmark.pedantic(
+        del_nodes, setup=lambda: ((DirectedGraph(edges=_copy(edges)),), {}),
+        rounds=ROUNDS)
+
+
+def test_get_subgraph(benchmark, graph):
+    """Subgraph of a tenth of nodes with adjacent nodes"""
+    selected = list(graph.nodes)[::10]
+    benchmark(graph.get_subgraph, selected, include_adjacent_nodes=True)
+
+
+def test_describe(benchmark, graph):
+    """Graph description"""
+    benchmark(graph.describe)
+
+
+def test_eq(benchmark, graph, edges):
+    """Comparison of equal graphs"""
+    other = DirectedGraph(edges=_copy(edges))
+    assert benchmark(graph.__eq__, other)
+
+
+def test_export_graph_to_json(benchmark, edges, tmp_path):
+    """Export graph to JSON"""
+    file_path = str(tmp_path / 'graph.json')
+    benchmark.pedantic(
+        export_graph_to_json,
+        setup=lambda: ((DirectedGraph(edges=_copy(edges)), file_path), {}),
+        rounds=ROUNDS)
+
+
+def test_import_graph_from_json(benchmark, edges, tmp_path):
+    """Import graph from JSON"""
+    file_path = str(tmp_path / 'graph.json')
+    export_graph_to_json(DirectedGraph(edges=_copy(edges)), file_path)
+    benchmark(import_graph_from_json, file_path)
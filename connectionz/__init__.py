@@ -2,19 +2,44 @@
 
 from . core import (
     # identifier
-    Identifier, generate_identifier,
+    Identifier, IdentifierGenerator, generate_identifier,
+    CounterIdentifierGenerator, RandomIdentifierGenerator,
     # nodes and edges type alias
     Nodes, Edges,
     # abstract class
     Graph,
+    # views
+    SubgraphView,
+    ReverseView,
+    UndirectedView,
     # classes
     DirectedGraph,
-    UndirectedGraph)
+    UndirectedGraph,
+    # concurrency
+    ReadWriteLock,
+    GraphBatch,
+    ConcurrentGraph,
+    # versioning
+    VersionedGraph,
+    # patches
+    GraphPatch,
+    # shared memory
+    SharedGraph)
 from . algorithms import *
 from . tools import (
     # graph to/from json
     export_graph_to_json,
-    import_graph_from_json)
+    import_graph_from_json,
+    export_graph_to_json_async,
+    import_graph_from_json_async,
+    # asyncio
+    AsyncEdgeBatcher,
+    # durable graph
+    DurableGraph,
+    # instrumentation
+    Sink, StatsSink, LoggingSink, SpanSink,
+    enable_instrumentation, disable_instrumentation, instrumentation,
+    check_instrumentation_is_enabled)
 from . exceptions import (
     # object already exists exceptions
     NodeAlreadyExistsException,
@@ -23,6 +48,9 @@ from . exceptions import (
     NodeIsNotExistsException,
     CoupleIsNotExistsException,
     EdgeIsNotExistsException,
+    TemporalIndexIsNotExistsException,
+    IndexIsNotExistsException,
+    VersionIsNotExistsException,
     # can not delete basic elements exceptions
     CanNotDeleteNodesException,
     CanNotDeleteEdgesException,
@@ -40,4 +68,25 @@ from . exceptions import (
     WrongTypeOfEdgeAttributesException,
     DuplicationInEdgeIdentifiersException,
     # wrong file extension exception
-    WrongFileExtensionException,)
+    WrongFileExtensionException,
+    # index exceptions
+    IndexException,
+    WrongKindOfIndexException,
+    WrongTargetOfIndexException,
+    WrongTypeOfIndexedValueException,
+    # algorithm exceptions
+    AlgorithmException,
+    SourceIsTargetException,
+    WrongAlgorithmParameterException,
+    UnsupportedGraphTypeException,
+    # durability exceptions
+    DurabilityException,
+    CorruptedLogException,
+    DurableGraphIsClosedException,
+    # patch exceptions
+    PatchException,
+    WrongTypeOfGraphInPatchException,
+    PatchConflictException,
+    # versioning exceptions
+    VersioningException,
+    ClockWentBackwardsException,)
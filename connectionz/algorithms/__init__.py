@@ -1 +1,6 @@
 """Algorithms init"""
+
+from . maximum_flow import FlowNetwork, maximum_flow, minimum_cut
+from . random_walks import RandomWalker, generate_random_walks
+from . link_prediction import LinkPredictor, link_prediction_scores
+from . cycles import simple_cycles, cycles_through, temporal_cycles_through
@@ -0,0 +1,359 @@
+"""Cycles enumeration in directed graph (Johnson's algorithm, bounded-length
+and time-respecting cycles)"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import Any, Iterator
+from connectionz.core.identifier import Identifier
+from connectionz.core.directed_graph import DirectedGraph
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    NodeIsNotExistsException)
+from connectionz.exceptions.algorithm_exceptions import (
+    WrongAlgorithmParameterException,
+    UnsupportedGraphTypeException)
+
+
+def _validate_graph(graph):
+    """Checks that graph is directed"""
+    if not isinstance(graph, DirectedGraph):
+        raise UnsupportedGraphTypeException(
+            received=graph.check_type(), required='DirectedGraph')
+
+
+def _validate_max_length(max_length):
+    """Checks that max length is None or positive"""
+    if max_length is not None and max_length < 1:
+        raise WrongAlgorithmParameterException(
+            'max_length', 'max length must be more than 0')
+
+
+def _index_adjacency(graph: DirectedGraph) -> tuple[list, dict, list, list]:
+    """Returns nodes, node indexes, successors and predecessors of each node
+    index (loops and couples without edges are not included)"""
+    nodes = list(graph.nodes)
+    index = {node: position for position, node in enumerate(nodes)}
+    successors = [[] for _ in nodes]
+    predecessors = [[] for _ in nodes]
+    for (node_l, node_r), multiples in graph.edges.items():
+        if multiples and node_l != node_r:
+            successors[index[node_l]].append(index[node_r])
+            predecessors[index[node_r]].append(index[node_l])
+    return nodes, index, successors, predecessors
+
+
+def _distances_to(
+        predecessors: list, target: int, limit: int = None,
+        lowest: int = 0) -> dict[int, int]:
+    """Returns BFS distances from nodes to target (over nodes with index not
+    less than lowest, up to limit)"""
+    distances = {target: 0}
+    queue = deque([target])
+    while queue:
+        node = queue.popleft()
+        distance = distances[node] + 1
+        if limit is not None and distance > limit:
+            continue
+        for previous in predecessors[node]:
+            if previous >= lowest and previous not in distances:
+                distances[previous] = distance
+                queue.append(previous)
+    return distances
+
+
+def _bounded_cycles(
+        successors: list, start: int, distances: dict[int, int],
+        max_length: int, lowest: int = 0) -> Iterator[list[int]]:
+    """Generates simple cycles through start with at most max_length edges,
+    DFS is pruned by distances back to start"""
+    path = [start]
+    on_path = {start}
+    stack = [iter(successors[start])]
+    while stack:
+        for following in stack[-1]:
+            if following == start:
+                yield path[:]
+                continue
+            if following < lowest or following in on_path:
+                continue
+            distance = distances.get(following)
+            if distance is None or len(path) + distance > max_length:
+                continue
+            path.append(following)
+            on_path.add(following)
+            stack.append(iter(successors[following]))
+            break
+        else:
+            stack.pop()
+            on_path.discard(path.pop())
+
+
+def _strongly_connected_components(
+        successors: dict[int, set[int]]) -> list[set[int]]:
+    """Returns strongly connected components (iterative Tarjan's algorithm)"""
+    index_counter = 0
+    indexes = {}
+    lowlinks = {}
+    scc_stack = []
+    on_stack = set()
+    components = []
+
+    for root in successors:
+        if root in indexes:
+            continue
+        work = [(root, iter(successors[root]))]
+        indexes[root] = lowlinks[root] = index_counter
+        index_counter += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in indexes:
+                    indexes[child] = lowlinks[child] = index_counter
+                    index_counter += 1
+                    scc_stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                    break
+                if child in on_stack:
+                    lowlinks[node] = min(lowlinks[node], indexes[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                if lowlinks[node] == indexes[node]:
+                    component = set()
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def _johnson_cycles(successors: list) -> Iterator[list[int]]:
+    """Generates simple cycles (Johnson's algorithm), loops are not included"""
+
+    def unblock(node, blocked, blocked_by):
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current in blocked:
+                blocked.discard(current)
+                stack.extend(blocked_by.pop(current, ()))
+
+    subgraph = {node: set(heads) for node, heads in enumerate(successors)}
+    components = [
+        component for component in _strongly_connected_components(subgraph)
+        if len(component) > 1]
+
+    while components:
+        component = components.pop()
+        start = min(component)
+        component_successors = {
+            node: subgraph[node] & component for node in component}
+
+        path = [start]
+        blocked = {start}
+        closed = set()
+        blocked_by = {}
+        stack = [(start, list(component_successors[start]))]
+        while stack:
+            node, heads = stack[-1]
+            if heads:
+                following = heads.pop()
+                if following == start:
+                    yield path[:]
+                    closed.update(path)
+                elif following not in blocked:
+                    path.append(following)
+                    stack.append((following, list(component_successors[following])))
+                    closed.discard(following)
+                    blocked.add(following)
+                    continue
+            if not heads:
+                if node in closed:
+                    unblock(node, blocked, blocked_by)
+                else:
+                    for head in component_successors[node]:
+                        blocked_by.setdefault(head, set()).add(node)
+                stack.pop()
+                path.pop()
+
+        component.discard(start)
+        remaining = {
+            node: component_successors[node] - {start} for node in component}
+        components.extend(
+            part for part in _strongly_connected_components(remaining)
+            if len(part) > 1)
+
+
+def simple_cycles(
+        graph: DirectedGraph, max_length: int = None
+        ) -> Iterator[list[Identifier]]:
+    """Generates simple cycles of directed graph lazily
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph object
+    max_length, optional
+        Maximum number of edges in cycle
+            - None (default): all cycles (Johnson's algorithm)
+            - ...: only short cycles, search is pruned by BFS distances
+
+    Returns
+    -------
+        Iterator over cycles, each cycle is a list of node identifiers (the
+        last node is connected to the first one), loops are cycles of one node
+    """
+    _validate_graph(graph)
+    _validate_max_length(max_length)
+
+    for (node_l, node_r), multiples in graph.edges.items():
+        if multiples and node_l == node_r:
+            yield [node_l]
+
+    nodes, _, successors, predecessors = _index_adjacency(graph)
+
+    if max_length is None:
+        for cycle in _johnson_cycles(successors):
+            yield [nodes[node] for node in cycle]
+        return
+
+    for start in range(len(nodes)):
+        distances = _distances_to(
+            predecessors, start, limit=max_length - 1, lowest=start)
+        for cycle in _bounded_cycles(
+                successors, start, distances, max_length, lowest=start + 1):
+            yield [nodes[node] for node in cycle]
+
+
+def cycles_through(
+        graph: DirectedGraph, node: Identifier, max_length: int = None
+        ) -> Iterator[list[Identifier]]:
+    """Generates simple cycles through selected node lazily
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph object
+    node
+        Node identifier
+    max_length, optional
+        Maximum number of edges in cycle (None - without limit), search is
+        pruned by BFS distances back to selected node
+
+    Returns
+    -------
+        Iterator over cycles, each cycle is a list of node identifiers that
+        starts with selected node
+    """
+    _validate_graph(graph)
+    _validate_max_length(max_length)
+    if node not in graph.nodes:
+        raise NodeIsNotExistsException()
+
+    if graph.edges.get((node, node)):
+        yield [node]
+
+    nodes, index, successors, predecessors = _index_adjacency(graph)
+    start = index[node]
+    limit = None if max_length is None else max_length - 1
+    distances = _distances_to(predecessors, start, limit=limit)
+    if max_length is None:
+        max_length = len(nodes)
+    for cycle in _bounded_cycles(successors, start, distances, max_length):
+        yield [nodes[position] for position in cycle]
+
+
+def temporal_cycles_through(
+        graph: DirectedGraph, node: Identifier, max_length: int = None,
+        time: str = 'date'
+        ) -> Iterator[list[tuple[Identifier, Identifier, Identifier]]]:
+    """Generates time-respecting simple cycles through selected node lazily
+
+    Cycle follows only edges whose time attribute strictly increases along
+    the cycle, edges without time attribute are skipped. Each edge multiple
+    is a separate step, so the same couple of nodes may give several cycles.
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph object
+    node
+        Node identifier
+    max_length, optional
+        Maximum number of edges in cycle (None - without limit)
+    time, optional
+        Edge attribute with comparable time value (date, datetime, ISO str)
+
+    Returns
+    -------
+        Iterator over cycles, each cycle is a list of edges (left node, right
+        node, edge identifier), the first edge starts from selected node
+    """
+    _validate_graph(graph)
+    _validate_max_length(max_length)
+    if node not in graph.nodes:
+        raise NodeIsNotExistsException()
+
+    # outgoing edges of each node sorted by time
+    outgoing: dict[Identifier, list[tuple[Any, Identifier, Identifier]]] = {}
+    predecessors: dict[Identifier, set[Identifier]] = {}
+    for (node_l, node_r), multiples in graph.edges.items():
+        for identifier, attributes in multiples.items():
+            if time in attributes:
+                outgoing.setdefault(node_l, []).append(
+                    (attributes[time], node_r, identifier))
+                predecessors.setdefault(node_r, set()).add(node_l)
+    for edges in outgoing.values():
+        edges.sort(key=lambda edge: edge[0])
+    times = {
+        tail: [edge[0] for edge in edges] for tail, edges in outgoing.items()}
+
+    # BFS distances back to selected node
+    distances = {node: 0}
+    queue = deque([node])
+    while queue:
+        current = queue.popleft()
+        for previous in predecessors.get(current, ()):
+            if previous not in distances:
+                distances[previous] = distances[current] + 1
+                queue.append(previous)
+
+    if max_length is None:
+        max_length = len(graph.nodes)
+
+    def following_edges(tail, after):
+        edges = outgoing.get(tail, [])
+        if after is None:
+            return iter(edges)
+        return iter(edges[bisect_right(times[tail], after):])
+
+    path = []
+    on_path = {node}
+    stack = [(node, following_edges(node, None))]
+    while stack:
+        tail, edges = stack[-1]
+        for (edge_time, head, identifier) in edges:
+            if head == node:
+                if len(path) + 1 <= max_length:
+                    yield path + [(tail, head, identifier)]
+                continue
+            if head in on_path:
+                continue
+            distance = distances.get(head)
+            if distance is None or len(path) + 1 + distance > max_length:
+                continue
+            path.append((tail, head, identifier))
+            on_path.add(head)
+            stack.append((head, following_edges(head, edge_time)))
+            break
+        else:
+            stack.pop()
+            if path:
+                on_path.discard(path.pop()[1])
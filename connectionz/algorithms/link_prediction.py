@@ -0,0 +1,240 @@
+"""Node similarity and link prediction scores"""
+
+import heapq
+from math import log
+from typing import Iterable, Iterator
+from connectionz.core.identifier import Identifier
+from connectionz.core.graph import Graph
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    NodeIsNotExistsException)
+from connectionz.exceptions.algorithm_exceptions import (
+    WrongAlgorithmParameterException)
+
+
+LINK_PREDICTION_METHODS = (
+    'common_neighbors',
+    'jaccard',
+    'adamic_adar',
+    'resource_allocation',
+    'preferential_attachment')
+
+
+class LinkPredictor:
+
+    """Link prediction over precomputed neighborhoods
+
+    Predictor representation
+    ------------------------
+
+    Every node is mapped to an integer index, for each node index there is:
+        - neighborhood: frozenset of adjacent node indexes (edge direction and
+          loops are ignored)
+        - degree: size of neighborhood
+
+    Neighborhoods are built once, so scoring of a pair costs
+    O(min(degree_l, degree_r)) and does not touch graph dicts.
+
+    Scores
+    ------
+
+        - common_neighbors: |N(l) & N(r)|
+        - jaccard: |N(l) & N(r)| / |N(l) | N(r)|
+        - adamic_adar: sum of 1 / log(degree(w)) for w in N(l) & N(r)
+        - resource_allocation: sum of 1 / degree(w) for w in N(l) & N(r)
+        - preferential_attachment: degree(l) * degree(r)
+    """
+
+    def __init__(self, graph: Graph):
+        self.nodes = list(graph.nodes)
+        self.index = {node: position for position, node in enumerate(self.nodes)}
+
+        neighborhoods = [set() for _ in self.nodes]
+        for (node_l, node_r), multiples in graph.edges.items():
+            if not multiples or node_l == node_r:
+                continue
+            index_l = self.index[node_l]
+            index_r = self.index[node_r]
+            neighborhoods[index_l].add(index_r)
+            neighborhoods[index_r].add(index_l)
+
+        self.neighborhoods = [frozenset(neighbors) for neighbors in neighborhoods]
+        self.degrees = [len(neighbors) for neighbors in neighborhoods]
+
+    def _validate_method(self, method: str):
+        """Checks that method is supported"""
+        if method not in LINK_PREDICTION_METHODS:
+            raise WrongAlgorithmParameterException(
+                'method', f'method must be one of {", ".join(LINK_PREDICTION_METHODS)}')
+
+    def _node_index(self, node: Identifier) -> int:
+        """Returns node index, raise NodeIsNotExistsException if node not exists"""
+        position = self.index.get(node)
+        if position is None:
+            raise NodeIsNotExistsException()
+        return position
+
+    def _score(self, index_l: int, index_r: int, method: str) -> float:
+        """Returns score for couple of node indexes"""
+        degrees = self.degrees
+        if method == 'preferential_attachment':
+            return degrees[index_l] * degrees[index_r]
+
+        neighbors_l = self.neighborhoods[index_l]
+        neighbors_r = self.neighborhoods[index_r]
+        if len(neighbors_l) > len(neighbors_r):
+            neighbors_l, neighbors_r = neighbors_r, neighbors_l
+        common = neighbors_l.intersection(neighbors_r)
+
+        if method == 'common_neighbors':
+            return len(common)
+        if method == 'jaccard':
+            union = degrees[index_l] + degrees[index_r] - len(common)
+            return len(common) / union if union else 0.0
+        if method == 'adamic_adar':
+            return sum(
+                1 / log(degrees[node]) for node in common if degrees[node] > 1)
+        return sum(1 / degrees[node] for node in common)
+
+    def score(
+            self, node_l: Identifier, node_r: Identifier,
+            method: str = 'jaccard') -> float:
+        """Returns score for couple of nodes
+
+        Parameters
+        ----------
+        node_l
+            Left node identifier
+        node_r
+            Right node identifier
+        method, optional
+            Score: common_neighbors, jaccard (default), adamic_adar,
+            resource_allocation or preferential_attachment
+
+        Returns
+        -------
+            Score value
+        """
+        self._validate_method(method)
+        return self._score(self._node_index(node_l), self._node_index(node_r), method)
+
+    def score_pairs(
+            self, pairs: Iterable[tuple[Identifier, Identifier]],
+            method: str = 'jaccard'
+            ) -> Iterator[tuple[Identifier, Identifier, float]]:
+        """Generates scores for many couples of nodes
+
+        Returns
+        -------
+            Iterator over tuples (left node, right node, score)
+        """
+        self._validate_method(method)
+        index = self.index
+        score = self._score
+        for node_l, node_r in pairs:
+            index_l = index.get(node_l)
+            index_r = index.get(node_r)
+            if index_l is None or index_r is None:
+                raise NodeIsNotExistsException()
+            yield node_l, node_r, score(index_l, index_r, method)
+
+    def _two_hop_scores(
+            self, index_node: int, method: str,
+            max_intermediate_degree: int = None) -> dict[int, float]:
+        """Accumulates scores for non-adjacent nodes in 2-hop neighborhood"""
+        degrees = self.degrees
+        neighborhoods = self.neighborhoods
+        neighbors = neighborhoods[index_node]
+
+        scores = {}
+        for intermediate in neighbors:
+            degree = degrees[intermediate]
+            if max_intermediate_degree is not None and degree > max_intermediate_degree:
+                continue
+            if method == 'adamic_adar':
+                contribution = 1 / log(degree) if degree > 1 else 0.0
+            elif method == 'resource_allocation':
+                contribution = 1 / degree
+            else:
+                contribution = 1
+            for candidate in neighborhoods[intermediate]:
+                if candidate == index_node or candidate in neighbors:
+                    continue
+                scores[candidate] = scores.get(candidate, 0) + contribution
+
+        if method == 'jaccard':
+            degree_node = degrees[index_node]
+            for candidate, common in scores.items():
+                scores[candidate] = common / (degree_node + degrees[candidate] - common)
+        elif method == 'preferential_attachment':
+            degree_node = degrees[index_node]
+            for candidate in scores:
+                scores[candidate] = degree_node * degrees[candidate]
+        return scores
+
+    def top_k(
+            self, node: Identifier, k: int = 10, method: str = 'jaccard',
+            max_intermediate_degree: int = None
+            ) -> list[tuple[Identifier, float]]:
+        """Returns k best candidates for node among non-adjacent nodes in its
+        2-hop neighborhood
+
+        Parameters
+        ----------
+        node
+            Node identifier
+        k, optional
+            Number of candidates
+        method, optional
+            Score (see `score`)
+        max_intermediate_degree, optional
+            Prune paths through intermediate nodes with larger degree (hubs)
+                - None (default): do not prune
+
+        Returns
+        -------
+            List of tuples (candidate node, score) sorted by score descending
+        """
+        self._validate_method(method)
+        if k < 1:
+            raise WrongAlgorithmParameterException('k', 'k must be more than 0')
+        scores = self._two_hop_scores(
+            self._node_index(node), method, max_intermediate_degree)
+        best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [(self.nodes[candidate], score) for candidate, score in best]
+
+    def top_k_all(
+            self, k: int = 10, method: str = 'jaccard',
+            max_intermediate_degree: int = None
+            ) -> Iterator[tuple[Identifier, list[tuple[Identifier, float]]]]:
+        """Generates k best candidates for each node in graph (see `top_k`)
+
+        Returns
+        -------
+            Iterator over tuples (node, candidates)
+        """
+        for node in self.nodes:
+            yield node, self.top_k(
+                node, k=k, method=method,
+                max_intermediate_degree=max_intermediate_degree)
+
+
+def link_prediction_scores(
+        graph: Graph, pairs: Iterable[tuple[Identifier, Identifier]],
+        method: str = 'jaccard') -> list[tuple[Identifier, Identifier, float]]:
+    """Returns link prediction scores for couples of nodes
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph or UndirectedGraph object
+    pairs
+        Iterable object with couples of node identifiers
+    method, optional
+        Score: common_neighbors, jaccard (default), adamic_adar,
+        resource_allocation or preferential_attachment
+
+    Returns
+    -------
+        List of tuples (left node, right node, score)
+    """
+    return list(LinkPredictor(graph).score_pairs(pairs, method=method))
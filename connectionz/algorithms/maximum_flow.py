@@ -0,0 +1,260 @@
+"""Maximum flow and minimum cut (Dinic's algorithm)"""
+
+from collections import deque
+from connectionz.core.identifier import Identifier
+from connectionz.core.graph import Graph
+from connectionz.core.undirected_graph import UndirectedGraph
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    NodeIsNotExistsException)
+from connectionz.exceptions.algorithm_exceptions import (
+    SourceIsTargetException)
+
+
+INFINITE_CAPACITY = float('inf')
+
+
+class FlowNetwork:
+
+    """Residual network built once from graph edges
+
+    Network representation
+    ----------------------
+
+    Every node is mapped to an integer index. Every couple is represented by
+    a pair of arcs stored in flat lists (arc 2 * k and its reverse arc
+    2 * k + 1), outgoing arcs of each node are stored in CSR layout:
+        - arc_head: index of the node the arc points to
+        - arc_capacity: initial capacity of the arc
+        - adjacency_offsets: start of node arcs in adjacency_arcs
+        - adjacency_arcs: arc indexes grouped by tail node
+
+    Couple capacity is the sum of capacity attribute over couple multiples,
+    edges without capacity attribute have infinite capacity. Loops are
+    skipped. For UndirectedGraph both arcs of a pair get the couple capacity.
+
+    The graph is never modified, so the same network can be used to compute
+    flows between different couples of nodes.
+    """
+
+    def __init__(self, graph: Graph, capacity: str = 'capacity'):
+        self.nodes = list(graph.nodes)
+        self.index = {node: position for position, node in enumerate(self.nodes)}
+
+        symmetric = isinstance(graph, UndirectedGraph)
+        arc_head = []
+        arc_capacity = []
+        out_arcs_count = [0] * len(self.nodes)
+
+        for (node_l, node_r), multiples in graph.edges.items():
+            if node_l == node_r:
+                continue
+            couple_capacity = sum(
+                attributes.get(capacity, INFINITE_CAPACITY)
+                for attributes in multiples.values())
+            index_l = self.index[node_l]
+            index_r = self.index[node_r]
+            arc_head.append(index_r)
+            arc_capacity.append(couple_capacity)
+            arc_head.append(index_l)
+            arc_capacity.append(couple_capacity if symmetric else 0)
+            out_arcs_count[index_l] += 1
+            out_arcs_count[index_r] += 1
+
+        adjacency_offsets = [0] * (len(self.nodes) + 1)
+        for position, count in enumerate(out_arcs_count):
+            adjacency_offsets[position + 1] = adjacency_offsets[position] + count
+
+        adjacency_arcs = [0] * len(arc_head)
+        fill = adjacency_offsets[:-1]
+        for arc in range(len(arc_head)):
+            tail = arc_head[arc ^ 1]
+            adjacency_arcs[fill[tail]] = arc
+            fill[tail] += 1
+
+        self.arc_head = arc_head
+        self.arc_capacity = arc_capacity
+        self.adjacency_offsets = adjacency_offsets
+        self.adjacency_arcs = adjacency_arcs
+
+    def _validate_terminals(self, source: Identifier, target: Identifier):
+        """Checks that source and target are different existing nodes"""
+        if source not in self.index or target not in self.index:
+            raise NodeIsNotExistsException()
+        if source == target:
+            raise SourceIsTargetException()
+        return self.index[source], self.index[target]
+
+    def _levels(self, residual: list, source: int, target: int) -> list:
+        """Builds BFS levels over arcs with positive residual capacity"""
+        arc_head = self.arc_head
+        offsets = self.adjacency_offsets
+        arcs = self.adjacency_arcs
+
+        level = [-1] * len(self.nodes)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for position in range(offsets[node], offsets[node + 1]):
+                arc = arcs[position]
+                head = arc_head[arc]
+                if residual[arc] > 0 and level[head] < 0:
+                    level[head] = level[node] + 1
+                    if head == target:
+                        return level
+                    queue.append(head)
+        return level
+
+    def _blocking_flow(
+            self, residual: list, level: list, source: int, target: int) -> float:
+        """Pushes blocking flow along level graph using current arc pointers"""
+        arc_head = self.arc_head
+        offsets = self.adjacency_offsets
+        arcs = self.adjacency_arcs
+
+        pointer = offsets[:-1]
+        flow = 0
+        path = []
+        node = source
+        while True:
+            if node == target:
+                pushed = min(residual[arc] for arc in path)
+                if pushed == INFINITE_CAPACITY:
+                    return INFINITE_CAPACITY
+                for arc in path:
+                    residual[arc] -= pushed
+                    residual[arc ^ 1] += pushed
+                flow += pushed
+                # retreat to the tail of the first saturated arc
+                for position, arc in enumerate(path):
+                    if residual[arc] == 0:
+                        del path[position:]
+                        break
+                node = arc_head[path[-1]] if path else source
+                continue
+
+            end = offsets[node + 1]
+            position = pointer[node]
+            next_level = level[node] + 1
+            while position < end:
+                arc = arcs[position]
+                if residual[arc] > 0 and level[arc_head[arc]] == next_level:
+                    break
+                position += 1
+            pointer[node] = position
+
+            if position < end:
+                path.append(arc)
+                node = arc_head[arc]
+            else:
+                if node == source:
+                    return flow
+                # dead end, never visit this node again in current phase
+                level[node] = -1
+                arc = path.pop()
+                node = arc_head[arc ^ 1]
+                pointer[node] += 1
+
+    def _dinic(self, source: int, target: int) -> tuple[float, list]:
+        """Runs Dinic's phases, returns flow value and residual capacities"""
+        residual = self.arc_capacity[:]
+        flow = 0
+        while flow != INFINITE_CAPACITY:
+            level = self._levels(residual, source, target)
+            if level[target] < 0:
+                break
+            flow += self._blocking_flow(residual, level, source, target)
+        return flow, residual
+
+    def maximum_flow(self, source: Identifier, target: Identifier) -> float:
+        """Returns maximum flow value from source to target"""
+        index_s, index_t = self._validate_terminals(source, target)
+        flow, _ = self._dinic(index_s, index_t)
+        return flow
+
+    def minimum_cut(
+            self, source: Identifier, target: Identifier
+            ) -> tuple[float, tuple[set[Identifier], set[Identifier]]]:
+        """Returns minimum cut value and partition of nodes
+
+        Returns
+        -------
+            Tuple with:
+                - cut value (equal to maximum flow value)
+                - partition - a tuple with:
+                    - nodes reachable from source in residual network
+                    - other nodes
+        """
+        index_s, index_t = self._validate_terminals(source, target)
+        cut_value, residual = self._dinic(index_s, index_t)
+
+        arc_head = self.arc_head
+        offsets = self.adjacency_offsets
+        arcs = self.adjacency_arcs
+
+        reachable = [False] * len(self.nodes)
+        reachable[index_s] = True
+        stack = [index_s]
+        while stack:
+            node = stack.pop()
+            for position in range(offsets[node], offsets[node + 1]):
+                arc = arcs[position]
+                head = arc_head[arc]
+                if residual[arc] > 0 and not reachable[head]:
+                    reachable[head] = True
+                    stack.append(head)
+
+        source_side = {
+            node for node, is_reachable in zip(self.nodes, reachable)
+            if is_reachable}
+        target_side = set(self.nodes) - source_side
+        return cut_value, (source_side, target_side)
+
+
+def maximum_flow(
+        graph: Graph, source: Identifier, target: Identifier,
+        capacity: str = 'capacity') -> float:
+    """Returns maximum flow value between two nodes
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph or UndirectedGraph object
+    source
+        Source node identifier
+    target
+        Target node identifier
+    capacity, optional
+        Edge attribute with capacity, summed over couple multiples, edges
+        without this attribute have infinite capacity
+
+    Returns
+    -------
+        Maximum flow value
+    """
+    return FlowNetwork(graph, capacity=capacity).maximum_flow(source, target)
+
+
+def minimum_cut(
+        graph: Graph, source: Identifier, target: Identifier,
+        capacity: str = 'capacity'
+        ) -> tuple[float, tuple[set[Identifier], set[Identifier]]]:
+    """Returns minimum cut value and partition of nodes between two nodes
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph or UndirectedGraph object
+    source
+        Source node identifier
+    target
+        Target node identifier
+    capacity, optional
+        Edge attribute with capacity, summed over couple multiples, edges
+        without this attribute have infinite capacity
+
+    Returns
+    -------
+        Tuple with cut value and partition of nodes (source side, target side)
+    """
+    return FlowNetwork(graph, capacity=capacity).minimum_cut(source, target)
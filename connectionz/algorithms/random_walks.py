@@ -0,0 +1,303 @@
+"""Random walks (uniform, weighted and node2vec biased walks)"""
+
+import random
+from array import array
+from typing import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from connectionz.core.identifier import Identifier
+from connectionz.core.graph import Graph
+from connectionz.core.undirected_graph import UndirectedGraph
+from connectionz.exceptions.algorithm_exceptions import (
+    WrongAlgorithmParameterException)
+
+
+# walker and walk length of worker process (see `_init_worker`)
+_WORKER = {}
+
+
+def _alias_table(weights: list) -> tuple[list, list]:
+    """Builds alias table (Vose's method) for sampling from discrete
+    distribution in O(1)
+
+    Returns
+    -------
+        Tuple with probabilities and aliases
+    """
+    count = len(weights)
+    total = sum(weights)
+    if count == 0 or total <= 0:
+        return [], []
+
+    scaled = [weight * count / total for weight in weights]
+    probability = [1.0] * count
+    alias = list(range(count))
+    small = [position for position, value in enumerate(scaled) if value < 1.0]
+    large = [position for position, value in enumerate(scaled) if value >= 1.0]
+
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+
+    return probability, alias
+
+
+def _alias_draw(probability: list, alias: list, generator: random.Random) -> int:
+    """Draws position from alias table"""
+    position = int(generator.random() * len(probability))
+    if generator.random() < probability[position]:
+        return position
+    return alias[position]
+
+
+def _init_worker(walker: 'RandomWalker', walk_length: int) -> None:
+    """Stores walker received once per worker process"""
+    _WORKER['walker'] = walker
+    _WORKER['walk_length'] = walk_length
+
+
+def _worker_walks_batch(task: tuple[int, list]) -> list[array]:
+    """Returns walks of batch (seed, start node indexes) in worker process"""
+    seed, starts = task
+    return _WORKER['walker'].walks_batch(starts, _WORKER['walk_length'], seed)
+
+
+class RandomWalker:
+
+    """Random walk engine over multiplicity-aware adjacency
+
+    Walker representation
+    ---------------------
+
+    Every node is mapped to an integer index (position in `nodes`), outgoing
+    arcs of each node are stored in CSR layout:
+        - offsets: start of node arcs in heads
+        - heads: index of the node the arc points to
+
+    Arc weight is the number of edges in couple (each edge multiple counts
+    once) or the sum of weight attribute over couple multiples. In
+    UndirectedGraph each couple gives arcs in both directions.
+
+    Alias tables are precomputed per node, and for node2vec biased walks
+    (p != 1 or q != 1) per arc, so every step costs O(1).
+
+    Walks are generated in batches, each batch is a list of walks, each walk
+    is an array of node indexes (walk is shorter than walk length if it
+    reaches a node without outgoing arcs).
+    """
+
+    def __init__(
+            self, graph: Graph, weight: str = None,
+            p: float = 1.0, q: float = 1.0):
+        """
+        Parameters
+        ----------
+        graph
+            DirectedGraph or UndirectedGraph object
+        weight, optional
+            Edge attribute with weight
+                - None (default): each edge has weight 1
+                - ...: weight attribute, edges without it have weight 1
+        p, optional
+            Return parameter of node2vec, likelihood of returning to previous
+            node is proportional to 1 / p
+        q, optional
+            In-out parameter of node2vec, likelihood of moving away from
+            previous node is proportional to 1 / q
+        """
+        if p <= 0:
+            raise WrongAlgorithmParameterException('p', 'p must be more than 0')
+        if q <= 0:
+            raise WrongAlgorithmParameterException('q', 'q must be more than 0')
+
+        self.nodes = list(graph.nodes)
+        self.index = {node: position for position, node in enumerate(self.nodes)}
+        self.p = p
+        self.q = q
+
+        adjacency = [{} for _ in self.nodes]
+        symmetric = isinstance(graph, UndirectedGraph)
+        for (node_l, node_r), multiples in graph.edges.items():
+            if weight is None:
+                couple_weight = len(multiples)
+            else:
+                couple_weight = sum(
+                    attributes.get(weight, 1) for attributes in multiples.values())
+            index_l = self.index[node_l]
+            index_r = self.index[node_r]
+            adjacency[index_l][index_r] = \
+                adjacency[index_l].get(index_r, 0) + couple_weight
+            if symmetric and index_l != index_r:
+                adjacency[index_r][index_l] = \
+                    adjacency[index_r].get(index_l, 0) + couple_weight
+
+        self.offsets = array('q', [0])
+        self.heads = array('q')
+        weights = []
+        for arcs in adjacency:
+            self.heads.extend(arcs)
+            weights.extend(arcs.values())
+            self.offsets.append(len(self.heads))
+
+        self.node_alias = [
+            _alias_table(weights[self.offsets[node]:self.offsets[node + 1]])
+            for node in range(len(self.nodes))]
+
+        self.arc_alias = None
+        if p != 1.0 or q != 1.0:
+            self.arc_alias = self._arc_alias_tables(adjacency, weights)
+
+    def _arc_alias_tables(self, adjacency: list, weights: list) -> list:
+        """Builds node2vec alias table for each arc (previous -> current)"""
+        offsets = self.offsets
+        heads = self.heads
+        tables = []
+        for previous in range(len(self.nodes)):
+            previous_neighbors = adjacency[previous]
+            for arc in range(offsets[previous], offsets[previous + 1]):
+                current = heads[arc]
+                biased = []
+                for position in range(offsets[current], offsets[current + 1]):
+                    following = heads[position]
+                    if following == previous:
+                        biased.append(weights[position] / self.p)
+                    elif following in previous_neighbors:
+                        biased.append(weights[position])
+                    else:
+                        biased.append(weights[position] / self.q)
+                tables.append(_alias_table(biased))
+        return tables
+
+    def walk(
+            self, start: int, walk_length: int,
+            generator: random.Random) -> array:
+        """Returns one walk of node indexes from start node index"""
+        offsets = self.offsets
+        heads = self.heads
+        node_alias = self.node_alias
+        arc_alias = self.arc_alias
+
+        path = array('q', [start])
+        current = start
+        arc = -1
+        while len(path) < walk_length:
+            begin = offsets[current]
+            if begin == offsets[current + 1]:
+                break
+            if arc < 0 or arc_alias is None:
+                probability, alias = node_alias[current]
+            else:
+                probability, alias = arc_alias[arc]
+            if not probability:
+                break
+            arc = begin + _alias_draw(probability, alias, generator)
+            current = heads[arc]
+            path.append(current)
+        return path
+
+    def walks_batch(
+            self, starts: list, walk_length: int, seed: int) -> list[array]:
+        """Returns walks from each start node index using own generator"""
+        generator = random.Random(seed)
+        return [self.walk(start, walk_length, generator) for start in starts]
+
+    def walks(
+            self, walk_length: int, walks_per_node: int = 1,
+            batch_size: int = 10000, seed: int = None,
+            processes: int = None) -> Iterator[list[array]]:
+        """Generates batches of walks started from every node
+
+        Parameters
+        ----------
+        walk_length
+            Maximum number of nodes in walk
+        walks_per_node, optional
+            Number of walks started from each node
+        batch_size, optional
+            Number of walks in batch
+        seed, optional
+            Seed for reproducible walks, each batch gets its own seed derived
+            from it, so walks do not depend on number of processes
+        processes, optional
+            Number of worker processes
+                - None (default): generate walks in current process
+                - ...: generate batches in process pool, walker is sent to
+                    each worker once, tasks contain only batch seed and start
+                    node indexes
+
+        Returns
+        -------
+            Iterator over batches of walks (lists of arrays of node indexes)
+        """
+        if walk_length < 1:
+            raise WrongAlgorithmParameterException(
+                'walk_length', 'walk length must be more than 0')
+        if batch_size < 1:
+            raise WrongAlgorithmParameterException(
+                'batch_size', 'batch size must be more than 0')
+
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+
+        starts = [
+            node for _ in range(walks_per_node) for node in range(len(self.nodes))]
+        batches = [
+            starts[position:position + batch_size]
+            for position in range(0, len(starts), batch_size)]
+        seeds_generator = random.Random(seed)
+        seeds = [seeds_generator.getrandbits(64) for _ in batches]
+
+        if processes is None:
+            for batch, batch_seed in zip(batches, seeds):
+                yield self.walks_batch(batch, walk_length, batch_seed)
+        else:
+            with ProcessPoolExecutor(
+                    max_workers=processes, initializer=_init_worker,
+                    initargs=(self, walk_length)) as executor:
+                yield from executor.map(_worker_walks_batch, zip(seeds, batches))
+
+    def to_identifiers(self, walk: array) -> list[Identifier]:
+        """Converts walk of node indexes to node identifiers"""
+        return [self.nodes[node] for node in walk]
+
+
+def generate_random_walks(
+        graph: Graph, walk_length: int, walks_per_node: int = 1,
+        weight: str = None, p: float = 1.0, q: float = 1.0,
+        seed: int = None) -> list[list[Identifier]]:
+    """Returns random walks started from every node as lists of node
+    identifiers
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph or UndirectedGraph object
+    walk_length
+        Maximum number of nodes in walk
+    walks_per_node, optional
+        Number of walks started from each node
+    weight, optional
+        Edge attribute with weight (None - each edge has weight 1)
+    p, optional
+        Return parameter of node2vec
+    q, optional
+        In-out parameter of node2vec
+    seed, optional
+        Seed for reproducible walks
+
+    Returns
+    -------
+        List of walks
+    """
+    walker = RandomWalker(graph, weight=weight, p=p, q=q)
+    return [
+        walker.to_identifiers(walk)
+        for batch in walker.walks(
+            walk_length, walks_per_node=walks_per_node, seed=seed)
+        for walk in batch]
@@ -1,8 +1,16 @@
 """Core init"""
 
-from . identifier import Identifier, generate_identifier
+from . identifier import (
+    Identifier, IdentifierGenerator, generate_identifier,
+    CounterIdentifierGenerator, RandomIdentifierGenerator)
 from . nodes import Nodes
 from . edges import Edges
+from . shared_graph import SharedGraph
+from . graph_patch import GraphPatch
 from . graph import Graph
+from . subgraph_view import SubgraphView
+from . directed_views import ReverseView, UndirectedView
 from . directed_graph import DirectedGraph
 from . undirected_graph import UndirectedGraph
+from . concurrent_graph import ReadWriteLock, GraphBatch, ConcurrentGraph
+from . versioned_graph import VersionedGraph
@@ -0,0 +1,254 @@
+"""ConcurrentGraph implementation"""
+
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Any, Iterator
+from connectionz.core.identifier import Identifier
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    NodeIsNotExistsException)
+
+
+class ReadWriteLock:
+
+    """Reader-writer lock
+
+    Any number of readers can hold lock at the same time, writer holds lock
+    exclusively. Waiting writer blocks new readers, so writers are not
+    starved by a continuous flow of readers. Lock is not reentrant.
+    """
+
+    def __init__(self):
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        """Acquires lock for reading"""
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Releases lock for reading"""
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquires lock for writing"""
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        """Releases lock for writing"""
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Holds lock for reading inside `with` block"""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Holds lock for writing inside `with` block"""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class GraphBatch:
+
+    """Writes collected by `ConcurrentGraph.batch` and applied at once"""
+
+    def __init__(self):
+        self.operations: list[tuple[str, tuple, dict[str, Any]]] = []
+
+    def __len__(self):
+        return len(self.operations)
+
+    def add_node(self, identifier: Identifier = None, replace: bool = False, **attributes):
+        """Collects `add_node`"""
+        self.operations.append(('add_node', (identifier, replace), attributes))
+
+    def del_node(self, identifier: Identifier):
+        """Collects `del_node`"""
+        self.operations.append(('del_node', (identifier,), {}))
+
+    def add_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None, replace: bool = False, **attributes):
+        """Collects `add_edge`"""
+        self.operations.append(('add_edge', (node_l, node_r, identifier, replace), attributes))
+
+    def del_edge(self, node_l: Identifier, node_r: Identifier, identifier: Identifier = None):
+        """Collects `del_edge`"""
+        self.operations.append(('del_edge', (node_l, node_r, identifier), {}))
+
+
+class ConcurrentGraph:
+
+    """Thread-safe wrapper of DirectedGraph or UndirectedGraph
+
+    Reads (`has_node`, `has_edge`, `neighbors`, `degree`, `get_node`,
+    `get_edge`, `read`) run in parallel under reader lock, writes (`add_node`,
+    `del_node`, `add_edge`, `del_edge`, `batch`) are serialized under writer
+    lock, so readers never see graph in the middle of write.
+
+    Batch applies many writes under one writer lock. Snapshot is copy-on-write
+    snapshot of graph taken under reader lock.
+
+    Wrapped graph must not be changed directly while wrapper is in use.
+    Degree and adjacency of graph (built lazily by graph) are built under
+    writer lock, so readers never build them concurrently.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.lock = ReadWriteLock()
+        graph.ensure_adjacency()
+
+    def __repr__(self):
+        with self.lock.read_locked():
+            return f'Concurrent {self.graph!r}'
+
+    def __len__(self):
+        with self.lock.read_locked():
+            return len(self.graph)
+
+    @contextmanager
+    def read(self) -> Iterator[Any]:
+        """Gives graph for several consistent reads inside `with` block
+        (graph must not be changed inside block)"""
+        with self.lock.read_locked():
+            yield self.graph
+
+    @contextmanager
+    def _write_locked(self) -> Iterator[None]:
+        """Holds writer lock inside `with` block and rebuilds adjacency of
+        graph if write dropped it (`recalculate_calculated_attributes=False`)"""
+        with self.lock.write_locked():
+            try:
+                yield
+            finally:
+                self.graph.ensure_adjacency()
+
+    def has_node(self, identifier: Identifier) -> bool:
+        """Checks that node is in graph"""
+        with self.lock.read_locked():
+            return self.graph.has_node(identifier)
+
+    def has_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None) -> bool:
+        """Checks that couple and edge is in graph"""
+        with self.lock.read_locked():
+            return self.graph.has_edge(node_l, node_r, identifier)
+
+    def _node_attributes(self, identifier: Identifier) -> dict[str, Any]:
+        """Returns node attributes, raise NodeIsNotExistsException if node
+        not exists"""
+        attributes = self.graph.nodes.get(identifier)
+        if attributes is None:
+            raise NodeIsNotExistsException()
+        return attributes
+
+    def neighbors(self, identifier: Identifier) -> frozenset[Identifier]:
+        """Returns neighbors of node (copy)"""
+        with self.lock.read_locked():
+            return frozenset(self.graph.neighbors(identifier))
+
+    def degree(self, identifier: Identifier) -> int:
+        """Returns degree of node"""
+        with self.lock.read_locked():
+            return self.graph.degree(identifier)
+
+    def get_node(self, identifier: Identifier) -> dict[str, Any]:
+        """Returns copy of node attributes"""
+        with self.lock.read_locked():
+            return dict(self._node_attributes(identifier))
+
+    def get_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier) -> dict[str, Any]:
+        """Returns copy of edge attributes or None if edge not exists"""
+        with self.lock.read_locked():
+            if not self.graph.has_edge(node_l, node_r, identifier):
+                return None
+            couple = self.graph.couple_representation(node_l, node_r)
+            return dict(self.graph.edges[couple][identifier])
+
+    def add_node(self, *args, **kwargs) -> Identifier:
+        """Adds node (see Graph `add_node`)"""
+        with self._write_locked():
+            return self.graph.add_node(*args, **kwargs)
+
+    def del_node(self, *args, **kwargs) -> None:
+        """Removes node (see Graph `del_node`)"""
+        with self._write_locked():
+            self.graph.del_node(*args, **kwargs)
+
+    def add_edge(self, *args, **kwargs) -> Identifier:
+        """Adds edge (see Graph `add_edge`)"""
+        with self._write_locked():
+            return self.graph.add_edge(*args, **kwargs)
+
+    def del_edge(self, *args, **kwargs) -> None:
+        """Removes edge (see Graph `del_edge`)"""
+        with self._write_locked():
+            self.graph.del_edge(*args, **kwargs)
+
+    def apply(self, batch: GraphBatch) -> None:
+        """Applies collected writes under one writer lock
+
+        Batch is atomic: if any write raises exception, graph is restored from
+        copy-on-write snapshot taken before the first write and exception is
+        raised again, so readers never see batch applied partially."""
+        if not batch:
+            return
+        with self._write_locked():
+            graph = self.graph
+            backup = graph.snapshot()
+            try:
+                for name, args, attributes in batch.operations:
+                    if name == 'add_node':
+                        identifier, replace = args
+                        graph.add_node(identifier, replace=replace, **attributes)
+                    else:
+                        getattr(graph, name)(*args, **attributes)
+            except Exception:
+                # snapshot and graph do not write to shared nested dicts, so
+                # state of snapshot is state of graph before the batch
+                graph.__dict__.update(backup.__dict__)
+                raise
+
+    @contextmanager
+    def batch(self) -> Iterator[GraphBatch]:
+        """Collects writes inside `with` block and applies them at the end of
+        block (writes are discarded if block raises exception)"""
+        batch = GraphBatch()
+        yield batch
+        self.apply(batch)
+
+    def snapshot(self):
+        """Returns independent consistent copy-on-write snapshot of graph (see
+        Graph `snapshot`), reader lock is held only while top-level dicts are
+        copied"""
+        with self.lock.read_locked():
+            return self.graph.snapshot()
@@ -1,9 +1,15 @@
 """DirectedGraph implementation"""
 
-from connectionz.core.identifier import Identifier
+from types import MappingProxyType
+from typing import Any, KeysView
+from connectionz.core.identifier import Identifier, IdentifierGenerator
 from connectionz.core.nodes import Nodes
 from connectionz.core.edges import Edges
 from connectionz.core.graph import Graph
+from connectionz.core.directed_views import ReverseView, UndirectedView
+
+
+_NO_ADJACENT_NODES = MappingProxyType({})
 
 
 class DirectedGraph(Graph):
@@ -44,10 +50,34 @@ class DirectedGraph(Graph):
                 '239af58': {'amount': 1900, 'date': '2024-04-16'},
             },
         }
+
+    Adjacency representation
+    ------------------------
+
+    Adjacency is built lazily from all edges in one pass on the first lookup
+    and then maintained incrementally on each edge mutation:
+        - out degree / in degree - a dict with node identifier and the number
+          of outgoing / incoming edges
+        - successors / predecessors - a dict with node identifier and a dict
+          with adjacent node identifier and the number of edges between them
+
+    Nodes without incident edges are not stored in adjacency, so lookups
+    (`degree`, `neighbors`, `out_degree`, `in_degree`, `successors`,
+    `predecessors`) are O(1) once adjacency is built. Degree and neighbors
+    are not stored in node attributes.
     """
 
-    def __init__(self, nodes: Nodes = None, edges: Edges = None):
-        super().__init__(nodes=nodes, edges=edges)
+    _shared_kinds = Graph._shared_kinds + ('successors', 'predecessors')
+
+    def __init__(
+            self, nodes: Nodes = None, edges: Edges = None,
+            identifier_generator: IdentifierGenerator = None):
+        self._out_degree = {}
+        self._in_degree = {}
+        self._successors = {}
+        self._predecessors = {}
+        super().__init__(
+            nodes=nodes, edges=edges, identifier_generator=identifier_generator)
 
     def _couple_representation(
             self, couple: tuple[Identifier, Identifier]
@@ -55,12 +85,128 @@ class DirectedGraph(Graph):
         """Couple representation for directed graph"""
         return couple
 
-    def find_neighbors(self):
-        """Finds neighbors for each node in graph"""
-        self.clear_neighbors()
-
-        for (node_l, node_r) in self.edges:
-            self.nodes[node_l]['neighbors'].add(node_r)
+    def _on_edge_added(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and adjacency after edge is added"""
+        super()._on_edge_added(couple, identifier, attributes)
+        if not self._adjacency_is_built:
+            return
+        node_l, node_r = couple
+        self._out_degree[node_l] = self._out_degree.get(node_l, 0) + 1
+        self._in_degree[node_r] = self._in_degree.get(node_r, 0) + 1
+        successors = self._own_nested(self._successors, node_l, 'successors')
+        successors[node_r] = successors.get(node_r, 0) + 1
+        predecessors = self._own_nested(self._predecessors, node_r, 'predecessors')
+        predecessors[node_l] = predecessors.get(node_l, 0) + 1
+
+    def _on_edge_removed(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and adjacency before edge is removed"""
+        super()._on_edge_removed(couple, identifier, attributes)
+        if not self._adjacency_is_built:
+            return
+        node_l, node_r = couple
+        for counter, node in ((self._out_degree, node_l), (self._in_degree, node_r)):
+            if counter[node] == 1:
+                del counter[node]
+            else:
+                counter[node] -= 1
+        for adjacency, kind, node, adjacent in (
+                (self._successors, 'successors', node_l, node_r),
+                (self._predecessors, 'predecessors', node_r, node_l)):
+            adjacent_nodes = self._own_nested(adjacency, node, kind)
+            if adjacent_nodes[adjacent] == 1:
+                del adjacent_nodes[adjacent]
+                if not adjacent_nodes:
+                    del adjacency[node]
+            else:
+                adjacent_nodes[adjacent] -= 1
+
+    def _build_adjacency(self) -> None:
+        """Builds adjacency from all edges in one pass"""
+        self._clear_adjacency()
+        out_degree = self._out_degree
+        in_degree = self._in_degree
+        successors = self._successors
+        predecessors = self._predecessors
+        for (node_l, node_r), multiples in self.edges.items():
+            if not multiples:
+                continue
+            out_degree[node_l] = out_degree.get(node_l, 0) + len(multiples)
+            in_degree[node_r] = in_degree.get(node_r, 0) + len(multiples)
+            successors.setdefault(node_l, {})[node_r] = len(multiples)
+            predecessors.setdefault(node_r, {})[node_l] = len(multiples)
+        if self._owned is not None:
+            self._owned['successors'] = set(successors)
+            self._owned['predecessors'] = set(predecessors)
+
+    def _clear_adjacency(self) -> None:
+        """Replaces adjacency by empty dicts"""
+        self._out_degree = {}
+        self._in_degree = {}
+        self._successors = {}
+        self._predecessors = {}
+
+    def _on_snapshot(self) -> None:
+        """Replaces indexes and top-level adjacency shared with source graph
+        by own copies"""
+        super()._on_snapshot()
+        self._out_degree = dict(self._out_degree)
+        self._in_degree = dict(self._in_degree)
+        self._successors = dict(self._successors)
+        self._predecessors = dict(self._predecessors)
+
+    def out_degree(self, identifier: Identifier) -> int:
+        """Returns the number of edges directed from node (O(1))"""
+        self.ensure_adjacency()
+        return self._out_degree.get(self._checked_node(identifier), 0)
+
+    def in_degree(self, identifier: Identifier) -> int:
+        """Returns the number of edges directed to node (O(1))"""
+        self.ensure_adjacency()
+        return self._in_degree.get(self._checked_node(identifier), 0)
+
+    def degree(self, identifier: Identifier) -> int:
+        """Returns the number of edges incident to node (O(1), loop increases
+        degree by 2)"""
+        self.ensure_adjacency()
+        identifier = self._checked_node(identifier)
+        return self._out_degree.get(identifier, 0) + self._in_degree.get(identifier, 0)
+
+    def neighbors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns nodes to which edges from node are directed (same as
+        successors)"""
+        return self.successors(identifier)
+
+    def successors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns nodes to which edges from node are directed (O(1), live
+        read-only set-like view)"""
+        self.ensure_adjacency()
+        return self._successors.get(
+            self._checked_node(identifier), _NO_ADJACENT_NODES).keys()
+
+    def predecessors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns nodes from which edges to node are directed (O(1), live
+        read-only set-like view)"""
+        self.ensure_adjacency()
+        return self._predecessors.get(
+            self._checked_node(identifier), _NO_ADJACENT_NODES).keys()
+
+    def reverse_view(self) -> ReverseView:
+        """Returns read-only view with reversed couples, created in O(1)
+        without copying"""
+        return ReverseView(self)
+
+    def to_undirected_view(self) -> UndirectedView:
+        """Returns read-only undirected view (couples (a, b) and (b, a) are
+        merged), created in O(1) without copying"""
+        return UndirectedView(self)
+
+    def check_is_directed(self) -> bool:
+        """Checks that graph is directed"""
+        return True
 
     def check_is_complete(self):
         """Checks that graph is complete
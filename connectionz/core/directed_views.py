@@ -0,0 +1,264 @@
+"""Reverse and undirected views of DirectedGraph"""
+
+from types import MappingProxyType
+from typing import Iterator, KeysView
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from connectionz.core.identifier import Identifier
+from connectionz.core.undirected_graph import UndirectedGraph
+from connectionz.exceptions.validation_exceptions import (
+    WrongTypeOfNodeIdentifierException,
+    WrongTypeOfEdgeIdentifierException)
+
+
+class _ReadOnlyNodes(Mapping):
+    """Read-only nodes of parent graph"""
+
+    def __init__(self, nodes):
+        self._nodes = nodes
+
+    def __getitem__(self, identifier):
+        return MappingProxyType(self._nodes[identifier])
+
+    def __contains__(self, identifier):
+        return identifier in self._nodes
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+class _ReadOnlyMultiples(Mapping):
+    """Read-only multiples merged from one or two couples of parent graph
+
+    Edges of the first couple keep their identifiers. Edge of the second
+    couple whose identifier is also in the first couple is presented with
+    identifier `<identifier>@<node_l>-><node_r>` (direction of its couple in
+    parent graph), so both edges stay in multiples.
+    """
+
+    def __init__(self, *parts):
+        self._parts = [(couple, multiples) for couple, multiples in parts if multiples]
+
+    @staticmethod
+    def _qualified(identifier, couple):
+        """Identifier of edge that collides with edge of the first couple"""
+        return f'{identifier}@{couple[0]}->{couple[1]}'
+
+    def __getitem__(self, identifier):
+        parts = self._parts
+        if identifier in parts[0][1]:
+            return MappingProxyType(parts[0][1][identifier])
+        for couple, multiples in parts[1:]:
+            if identifier in multiples:
+                return MappingProxyType(multiples[identifier])
+            suffix = self._qualified('', couple)
+            if isinstance(identifier, str) and identifier.endswith(suffix):
+                original = identifier[:-len(suffix)]
+                if original in multiples and original in parts[0][1]:
+                    return MappingProxyType(multiples[original])
+        raise KeyError(identifier)
+
+    def __iter__(self):
+        parts = self._parts
+        yield from parts[0][1]
+        for couple, multiples in parts[1:]:
+            for identifier in multiples:
+                yield (
+                    self._qualified(identifier, couple) if identifier in parts[0][1]
+                    else identifier)
+
+    def __len__(self):
+        return sum(len(multiples) for _, multiples in self._parts)
+
+
+class _ViewEdges(Mapping):
+    """Read-only edges of directed graph view"""
+
+    def __init__(self, view):
+        self._view = view
+
+    def __getitem__(self, couple):
+        multiples = self._view._multiples(couple)
+        if multiples is None:
+            raise KeyError(couple)
+        return multiples
+
+    def __contains__(self, couple):
+        return self._view._multiples(couple) is not None
+
+    def __iter__(self):
+        return self._view._iter_couples()
+
+    def __len__(self):
+        return sum(1 for _ in self._view._iter_couples())
+
+
+class _DirectedGraphView(ABC):
+    """Base of views over DirectedGraph storage"""
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __len__(self):
+        """Returns the number of nodes in the view"""
+        return len(self.graph.nodes)
+
+    def __repr__(self):
+        number_of_edges = sum(len(multiples) for multiples in self.edges.values())
+        return (
+            f'{self.check_type()} view with {len(self.nodes)} nodes, '
+            f'{len(self.edges)} couples and {number_of_edges} edges')
+
+    @property
+    def nodes(self) -> Mapping:
+        """Nodes getter"""
+        return _ReadOnlyNodes(self.graph.nodes)
+
+    @property
+    def edges(self) -> Mapping:
+        """Edges getter"""
+        return _ViewEdges(self)
+
+    @abstractmethod
+    def _multiples(self, couple):
+        """Returns multiples of couple in view or None"""
+
+    @abstractmethod
+    def _iter_couples(self) -> Iterator[tuple[Identifier, Identifier]]:
+        """Generates couples in view"""
+
+    def has_node(self, identifier: Identifier) -> bool:
+        """Checks that node is in view"""
+        if not isinstance(identifier, Identifier):
+            raise WrongTypeOfNodeIdentifierException()
+        return identifier in self.graph.nodes
+
+    def has_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None) -> bool:
+        """Checks that couple and edge is in view"""
+        if not (isinstance(node_l, Identifier) and isinstance(node_r, Identifier)):
+            raise WrongTypeOfNodeIdentifierException()
+        multiples = self._multiples((node_l, node_r))
+        if identifier is None:
+            return multiples is not None
+        if not isinstance(identifier, Identifier):
+            raise WrongTypeOfEdgeIdentifierException()
+        return multiples is not None and identifier in multiples
+
+    def degree(self, identifier: Identifier) -> int:
+        """Returns degree of node (loop increases degree by 2)"""
+        return self.graph.out_degree(identifier) + self.graph.in_degree(identifier)
+
+    def check_type(self) -> str:
+        """Checks type of view"""
+        return self.__class__.__name__
+
+
+class ReverseView(_DirectedGraphView):
+
+    """Read-only view of DirectedGraph with reversed couples
+
+    Couple (node_l, node_r) of parent graph is presented as couple
+    (node_r, node_l) with the same multiples. View is created in O(1) and
+    follows parent mutations.
+    """
+
+    def _multiples(self, couple):
+        reversed_couple = (couple[1], couple[0])
+        multiples = self.graph.edges.get(reversed_couple)
+        return _ReadOnlyMultiples((reversed_couple, multiples)) if multiples else None
+
+    def _iter_couples(self):
+        for (node_l, node_r), multiples in self.graph.edges.items():
+            if multiples:
+                yield (node_r, node_l)
+
+    def check_is_directed(self) -> bool:
+        """Checks that view is directed"""
+        return True
+
+    def successors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns nodes to which edges from node are directed"""
+        return self.graph.predecessors(identifier)
+
+    def predecessors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns nodes from which edges to node are directed"""
+        return self.graph.successors(identifier)
+
+    def neighbors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns neighbors of node (same as successors)"""
+        return self.successors(identifier)
+
+    def copy(self):
+        """Returns independent DirectedGraph with reversed couples"""
+        graph = self.graph.__class__()
+        for identifier, attributes in self.graph.nodes.items():
+            graph.add_node(identifier=identifier, **attributes)
+        for (node_l, node_r), multiples in self.graph.edges.items():
+            for identifier, attributes in multiples.items():
+                graph.add_edge(
+                    node_l=node_r, node_r=node_l, identifier=identifier,
+                    recalculate_calculated_attributes=False, **attributes)
+
+        return graph
+
+
+class UndirectedView(_DirectedGraphView):
+
+    """Read-only undirected view of DirectedGraph
+
+    Couples (node_l, node_r) and (node_r, node_l) of parent graph are
+    presented as one sorted couple with merged multiples (the same way as
+    UndirectedGraph represents couples). Edge of couple (node_r, node_l) with
+    identifier of edge of couple (node_l, node_r) is presented with qualified
+    identifier (see `_ReadOnlyMultiples`). View is created in O(1) and follows
+    parent mutations.
+    """
+
+    @staticmethod
+    def _couple_representation(couple):
+        """Couple representation for undirected view"""
+        return couple if couple[0] <= couple[1] else (couple[1], couple[0])
+
+    def _multiples(self, couple):
+        node_l, node_r = self._couple_representation(couple)
+        edges = self.graph.edges
+        couples = [(node_l, node_r)] if node_l == node_r else [(node_l, node_r), (node_r, node_l)]
+        parts = [(couple, edges.get(couple)) for couple in couples]
+        parts = [(couple, multiples) for couple, multiples in parts if multiples]
+        return _ReadOnlyMultiples(*parts) if parts else None
+
+    def _iter_couples(self):
+        edges = self.graph.edges
+        for couple, multiples in edges.items():
+            if not multiples:
+                continue
+            representation = self._couple_representation(couple)
+            if representation == couple or not edges.get(representation):
+                yield representation
+
+    def check_is_directed(self) -> bool:
+        """Checks that view is directed"""
+        return False
+
+    def neighbors(self, identifier: Identifier) -> frozenset[Identifier]:
+        """Returns nodes adjacent to node in any direction"""
+        return frozenset(
+            self.graph.successors(identifier) | self.graph.predecessors(identifier))
+
+    def copy(self):
+        """Returns independent UndirectedGraph"""
+        graph = UndirectedGraph()
+        for identifier, attributes in self.graph.nodes.items():
+            graph.add_node(identifier=identifier, **attributes)
+        for (node_l, node_r), multiples in self.edges.items():
+            for identifier, attributes in multiples.items():
+                graph.add_edge(
+                    node_l=node_l, node_r=node_r, identifier=identifier,
+                    recalculate_calculated_attributes=False, **attributes)
+
+        return graph
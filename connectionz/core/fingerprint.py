@@ -0,0 +1,81 @@
+"""Structural fingerprint of graph
+
+Fingerprint is an order-independent hash of nodes, couples, edge identifiers
+and attributes: the sum (modulo 2 ** 64) of hashes of each node, couple and
+edge. Graph updates the sum on each mutation in O(size of attributes), equal
+graphs always have equal fingerprints, so graphs with different fingerprints
+are not equal.
+
+Hashes are based on built-in `hash`, so fingerprints are comparable only
+within one process (string hashes depend on PYTHONHASHSEED).
+"""
+
+from typing import Any
+from connectionz.core.identifier import Identifier
+
+
+MASK = (1 << 64) - 1
+
+# types hashed by built-in `hash` without checks
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def value_hash(value: Any) -> int:
+    """Returns hash of attribute value, equal values have equal hashes
+
+    Dicts, sets, lists and tuples are hashed by content (dicts and sets do not
+    depend on order), other unhashable values have hash 0.
+    """
+    if type(value) in _SCALAR_TYPES:
+        return hash(value)
+    if isinstance(value, dict):
+        return hash(('dict', attributes_hash(value)))
+    if isinstance(value, (set, frozenset)):
+        return hash(('set', sum(value_hash(item) for item in value) & MASK))
+    if isinstance(value, (list, tuple)):
+        return hash((
+            'list' if isinstance(value, list) else 'tuple',
+            tuple(value_hash(item) for item in value)))
+    try:
+        return hash(value)
+    except TypeError:
+        return 0
+
+
+def attributes_hash(attributes: dict[str, Any]) -> int:
+    """Returns order-independent hash of attributes dict"""
+    return sum(
+        hash((key, hash(value) if type(value) in _SCALAR_TYPES else value_hash(value)))
+        for key, value in attributes.items()) & MASK
+
+
+def node_hash(identifier: Identifier, attributes: dict[str, Any]) -> int:
+    """Returns hash of node with attributes"""
+    return hash(('node', identifier, attributes_hash(attributes)))
+
+
+def couple_hash(couple: tuple[Identifier, Identifier]) -> int:
+    """Returns hash of couple (couple without edges is part of graph)"""
+    return hash(('couple', couple))
+
+
+def edge_hash(
+        couple: tuple[Identifier, Identifier], identifier: Identifier,
+        attributes: dict[str, Any]) -> int:
+    """Returns hash of edge with attributes"""
+    return hash(('edge', couple, identifier, attributes_hash(attributes)))
+
+
+def nodes_fingerprint(nodes: dict) -> int:
+    """Returns fingerprint of all nodes"""
+    return sum(
+        node_hash(identifier, attributes) for identifier, attributes in nodes.items()) & MASK
+
+
+def edges_fingerprint(edges: dict) -> int:
+    """Returns fingerprint of all couples and edges"""
+    return sum(
+        couple_hash(couple) + sum(
+            edge_hash(couple, identifier, attributes)
+            for identifier, attributes in multiples.items())
+        for couple, multiples in edges.items()) & MASK
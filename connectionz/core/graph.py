@@ -1,10 +1,24 @@
 """Graph implementation"""
 
-from typing import Iterable
+import copy
+import asyncio
+from array import array
+from pickle import PickleBuffer, PicklingError, dumps
+from typing import Any, Iterable, Iterator, KeysView
 from abc import ABC, abstractmethod
-from connectionz.core.identifier import Identifier, generate_identifier
+from concurrent.futures import Executor
+from connectionz.core.identifier import (
+    Identifier, IdentifierGenerator, generate_identifier)
 from connectionz.core.nodes import Nodes
 from connectionz.core.edges import Edges
+from connectionz.core.indexes import HashIndex, SortedIndex
+from connectionz.core.subgraph_view import SubgraphView
+from connectionz.core.shared_graph import SharedGraph
+from connectionz.core.memory_usage import graph_memory_usage, graph_memory_report
+from connectionz.core.fingerprint import (
+    MASK, node_hash, couple_hash, edge_hash, nodes_fingerprint, edges_fingerprint)
+from connectionz.core.graph_patch import (
+    GraphPatch, attributes_change, changed_attributes)
 from connectionz.exceptions.cannot_delete_basic_elements_exceptions import (
     CanNotDeleteNodesException,
     CanNotDeleteEdgesException)
@@ -14,7 +28,12 @@ from connectionz.exceptions.object_already_exists_exceptions import (
 from connectionz.exceptions.object_isnot_exists_exceptions import (
     NodeIsNotExistsException,
     CoupleIsNotExistsException,
-    EdgeIsNotExistsException)
+    EdgeIsNotExistsException,
+    TemporalIndexIsNotExistsException,
+    IndexIsNotExistsException)
+from connectionz.exceptions.index_exceptions import (
+    WrongKindOfIndexException,
+    WrongTargetOfIndexException)
 from connectionz.exceptions.validation_exceptions import (
     WrongTypeOfNodesException,
     WrongTypeOfNodeIdentifierException,
@@ -28,18 +47,79 @@ from connectionz.exceptions.validation_exceptions import (
     WrongTypeOfEdgeIdentifierException,
     WrongTypeOfEdgeAttributesException,
     DuplicationInEdgeIdentifiersException)
+from connectionz.exceptions.patch_exceptions import (
+    WrongTypeOfGraphInPatchException,
+    PatchConflictException)
+
+
+INDEX_KINDS = {'hash': HashIndex, 'sorted': SortedIndex}
+
+LOOKUPS = {
+    'eq': lambda value, expected: value == expected,
+    'gt': lambda value, expected: value > expected,
+    'gte': lambda value, expected: value >= expected,
+    'lt': lambda value, expected: value < expected,
+    'lte': lambda value, expected: value <= expected,
+}
+
+
+def _parse_conditions(conditions: dict[str, Any]) -> list[tuple[str, str, Any]]:
+    """Parses conditions like age=30 or age__gte=30 to tuples (attribute,
+    lookup, value)"""
+    parsed = []
+    for key, value in conditions.items():
+        attribute, _, lookup = key.rpartition('__')
+        if not attribute or lookup not in LOOKUPS:
+            attribute, lookup = key, 'eq'
+        parsed.append((attribute, lookup, value))
+    return parsed
+
+
+def _matches(attributes: dict[str, Any], conditions: list[tuple[str, str, Any]]) -> bool:
+    """Checks that attributes satisfy all conditions"""
+    return all(
+        attribute in attributes and LOOKUPS[lookup](attributes[attribute], value)
+        for attribute, lookup, value in conditions)
+
+
+def _int_array(data) -> memoryview:
+    """Returns int64 view of pickled array (array, bytes or out-of-band
+    buffer) without copying"""
+    return memoryview(data).cast('B').cast('q')
+
+
+def _picklable_or_none(generator: IdentifierGenerator) -> IdentifierGenerator | None:
+    """Returns identifier generator if it can be pickled, otherwise None
+    (graph is loaded with the default generator)"""
+    try:
+        dumps(generator)
+    except (PicklingError, AttributeError, TypeError):
+        return None
+    return generator
 
 
 class Graph(ABC):
     """Graph implementation"""
 
-    def __init__(self, nodes: Nodes = None, edges: Edges = None):
+    # kinds of nested dicts shared with snapshots (see `snapshot`)
+    _shared_kinds = ('couples',)
+
+    def __init__(
+            self, nodes: Nodes = None, edges: Edges = None,
+            identifier_generator: IdentifierGenerator = None):
+        self.identifier_generator = identifier_generator or generate_identifier
+        self._version = 0
+        self._temporal_index = None
+        self._node_indexes = {}
+        self._edge_indexes = {}
+        self._owned = None
+        self._adjacency_is_built = False
+        self._node_fingerprint = None
+        self._edge_fingerprint = None
+
         self.nodes = nodes
         self.edges = edges
 
-        self.calc_degree()
-        self.find_neighbors()
-
     def __repr__(self):
         description = self.describe()
 
@@ -91,6 +171,12 @@ class Graph(ABC):
 
         return message
 
+    @property
+    def modification_count(self) -> int:
+        """Number of modifications of nodes and edges by graph methods (views
+        compare it to detect changes of parent graph)"""
+        return self._version
+
     @property
     def nodes(self):
         """Nodes getter"""
@@ -100,6 +186,10 @@ class Graph(ABC):
     def nodes(self, new_nodes: Nodes):
         """Nodes setter"""
         self.__nodes = {}
+        self._version += 1
+        self._node_fingerprint = None
+        for index in self._node_indexes.values():
+            index.clear()
         self._nodes_validation(new_nodes)
 
     @nodes.deleter
@@ -144,6 +234,7 @@ class Graph(ABC):
     def edges(self, new_edges: Edges):
         """Edges setter"""
         self.__edges = {}
+        self._on_edges_cleared()
         self._edges_validation(new_edges)
 
     @edges.deleter
@@ -245,9 +336,16 @@ class Graph(ABC):
         """
         if not isinstance(other, self.__class__.__bases__):
             return NotImplemented
-        return type(self) is type(other) and \
-            self.nodes == other.nodes and \
-            self.edges == other.edges
+        if self is other:
+            return True
+        # fail fast on counts before comparing dicts
+        if type(self) is not type(other) or \
+                len(self.nodes) != len(other.nodes) or \
+                len(self.edges) != len(other.edges):
+            return False
+        # fingerprints are not compared: they do not track attribute dicts
+        # changed in place, so they can differ for equal graphs
+        return self.nodes == other.nodes and self.edges == other.edges
 
     def __ne__(self, other):
         """Not equal (!=) dunder method
@@ -267,6 +365,25 @@ class Graph(ABC):
         """Returns the number of nodes in the graph"""
         return len(self.nodes)
 
+    def fingerprint(self) -> int:
+        """Returns structural fingerprint of graph: order-independent hash of
+        graph type, nodes, couples, edge identifiers and attributes
+
+        Fingerprint is computed in one pass on the first call after
+        construction or bulk replacement of nodes or edges and then updated
+        on each mutation, so next calls are O(1). Equal graphs have equal
+        fingerprints, graphs with different fingerprints are not equal.
+        Fingerprint is comparable only within one process and does not track
+        attribute dicts changed in place (see `snapshot`), so `==` does not
+        use it.
+        """
+        if self._node_fingerprint is None:
+            self._node_fingerprint = nodes_fingerprint(self.nodes)
+        if self._edge_fingerprint is None:
+            self._edge_fingerprint = edges_fingerprint(self.edges)
+        return hash((
+            self.check_type(), self._node_fingerprint, self._edge_fingerprint)) & MASK
+
     def add_node(
         self, identifier: Identifier = None, replace: bool = False,
         **attributes) -> Identifier:
@@ -294,24 +411,25 @@ class Graph(ABC):
 
         # validate identifier
         if identifier is None:
-            identifier = generate_identifier()
+            identifier = self.identifier_generator()
+            while identifier in self.nodes:
+                identifier = self.identifier_generator()
         else:
             if not isinstance(identifier, Identifier):
                 raise WrongTypeOfNodeIdentifierException()
 
+        # validate indexed values before any change
+        for index in self._node_indexes.values():
+            index.check(attributes)
+
         # actions if (node exists)
         if self.nodes.get(identifier) is not None:
             if replace is False:
                 raise NodeAlreadyExistsException()
-            if replace is True:
-                replaceable_node_degree = self.nodes[identifier].get('degree')
-                if replaceable_node_degree is not None:
-                    attributes['degree'] = replaceable_node_degree
-                replaceable_node_neighbors = self.nodes[identifier].get('neighbors')
-                if replaceable_node_neighbors is not None:
-                    attributes['neighbors'] = replaceable_node_neighbors
+            self._on_node_removed(identifier, self.nodes[identifier])
         # actions if (node not exists)
         self.nodes[identifier] = attributes
+        self._on_node_added(identifier, attributes)
 
         return identifier
 
@@ -325,12 +443,11 @@ class Graph(ABC):
         identifier
             Node identifier
         recalculate_calculated_attributes, optional
-            Recalculate nodes attributes, that calculated by functions: calc_degree, find_neighbors
-                - True (deafult): recalculate calculated nodes attributes (worst performance)
-                    * use it when removing a small number of nodes
-                - False: do nothing (best performance)
-                    * use it when removing a large number of nodes,
-                      then recalculate calculated attributes
+            Update degree and neighbors of adjacent nodes
+                - True (default): update them incrementally
+                - False: drop degree and neighbors of all nodes, they are
+                    rebuilt in one pass on the next lookup (use for bulk
+                    removal)
         """
 
         if not isinstance(identifier, Identifier):
@@ -343,16 +460,14 @@ class Graph(ABC):
         incident_edges = [
             couple for couple in self.edges if identifier in couple]
         for couple in incident_edges:
-            self.del_edge(*couple, recalculate_calculated_attributes=False)
+            self.del_edge(
+                *couple,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
 
         # delete node
+        self._on_node_removed(identifier, self.nodes[identifier])
         del self.nodes[identifier]
 
-        # recalculate calculated attributes
-        if recalculate_calculated_attributes is True:
-            self.calc_degree()
-            self.find_neighbors()
-
     def has_node(self, identifier: Identifier) -> bool:
         """Checks that node is in graph"""
 
@@ -362,6 +477,26 @@ class Graph(ABC):
 
         return identifier in self.nodes
 
+    def _on_node_added(
+            self, identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and fingerprint after node is added"""
+        self._version += 1
+        if self._node_fingerprint is not None:
+            self._node_fingerprint = (
+                self._node_fingerprint + node_hash(identifier, attributes)) & MASK
+        for index in self._node_indexes.values():
+            index.add(identifier, attributes)
+
+    def _on_node_removed(
+            self, identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and fingerprint before node is removed"""
+        self._version += 1
+        if self._node_fingerprint is not None:
+            self._node_fingerprint = (
+                self._node_fingerprint - node_hash(identifier, attributes)) & MASK
+        for index in self._node_indexes.values():
+            index.remove(identifier, attributes)
+
     def clear_nodes(self) -> None:
         """Removes all nodes from the graph"""
         self.nodes = {}
@@ -373,6 +508,13 @@ class Graph(ABC):
             ) -> tuple[Identifier, Identifier]:
         """Couple representation for different graph types"""
 
+    def couple_representation(
+            self, node_l: Identifier, node_r: Identifier
+            ) -> tuple[Identifier, Identifier]:
+        """Returns couple (node_l, node_r) as it is stored in edges dict (for
+        UndirectedGraph nodes are sorted)"""
+        return self._couple_representation((node_l, node_r))
+
     def add_edge(
             self, node_l: Identifier, node_r: Identifier,
             identifier: Identifier = None, replace: bool = False,
@@ -397,12 +539,11 @@ class Graph(ABC):
                 - True: replace existing edge by new
                 - False (default): raise EdgeAlreadyExistsException if edge exists
         recalculate_calculated_attributes, optional
-            Recalculate nodes attributes, that calculated by functions: calc_degree, find_neighbors
-                - True (deafult): recalculate calculated nodes attributes (worst performance)
-                    * use it when adding a small number of edges
-                - False: do nothing (best performance)
-                    * use it when adding a large number of edges,
-                      then recalculate calculated attributes
+            Update degree and neighbors of incident nodes
+                - True (default): update them incrementally
+                - False: drop degree and neighbors of all nodes, they are
+                    rebuilt in one pass on the next lookup (use for bulk
+                    insertion)
 
         Returns
         -------
@@ -418,19 +559,34 @@ class Graph(ABC):
 
         # validate identifier
         if identifier is None:
-            identifier = generate_identifier()
+            identifier = self.identifier_generator()
+            while identifier in self.edges.get(couple, ()):
+                identifier = self.identifier_generator()
         else:
             if not isinstance(identifier, Identifier):
                 raise WrongTypeOfEdgeIdentifierException()
 
+        # validate indexed values before any change
+        if self._temporal_index is not None:
+            self._temporal_index.check(attributes)
+        for index in self._edge_indexes.values():
+            index.check(attributes)
+
+        # bulk insertion: adjacency is rebuilt on the next lookup
+        if not recalculate_calculated_attributes:
+            self._invalidate_adjacency()
+
         # actions if (edge exists) and (replace is False)
         if self.edges.get(couple) is not None and \
                 self.edges.get(couple).get(identifier) is not None:
             if replace is False:
                 raise EdgeAlreadyExistsException()
+            self._on_edge_removed(couple, identifier, self.edges[couple][identifier])
         # actions if (edge not exists) or (edge exists and replace is True)
-        self.edges[couple] = self.edges.get(couple) or {}
-        self.edges[couple][identifier] = attributes
+        if couple not in self.edges:
+            self._on_couple_added(couple)
+        self._own_nested(self.edges, couple, 'couples')[identifier] = attributes
+        self._on_edge_added(couple, identifier, attributes)
 
         # add non-existent incident nodes
         try:
@@ -442,11 +598,6 @@ class Graph(ABC):
         except NodeAlreadyExistsException:
             pass
 
-        # recalculate calculated values
-        if recalculate_calculated_attributes is True:
-            self.calc_degree()
-            self.find_neighbors()
-
         return identifier
 
     def del_edge(
@@ -469,12 +620,11 @@ class Graph(ABC):
                     identifier specified, raise EdgeIsNotExistsException if
                     selected edge not exists
         recalculate_calculated_attributes, optional
-            Recalculate nodes attributes, that calculated by functions: calc_degree, find_neighbors
-                - True (deafult): recalculate calculated nodes attributes (worst performance)
-                    * use it when removing a small number of edges
-                - False: do nothing (best performance)
-                    * use it when removing a large number of edges,
-                      then recalculate calculated attributes
+            Update degree and neighbors of incident nodes
+                - True (default): update them incrementally
+                - False: drop degree and neighbors of all nodes, they are
+                    rebuilt in one pass on the next lookup (use for bulk
+                    removal)
         """
 
         # nodes validation
@@ -490,7 +640,14 @@ class Graph(ABC):
 
         # delete couple
         if identifier is None:
+            if not recalculate_calculated_attributes:
+                self._invalidate_adjacency()
+            for edge_identifier, edge_attributes in self.edges[couple].items():
+                self._on_edge_removed(couple, edge_identifier, edge_attributes)
             del self.edges[couple]
+            if self._owned is not None:
+                self._owned['couples'].discard(couple)
+            self._on_couple_removed(couple)
         else:
             # edge validation
             if not isinstance(identifier, Identifier):
@@ -498,12 +655,10 @@ class Graph(ABC):
             if self.edges.get(couple).get(identifier) is None:
                 raise EdgeIsNotExistsException()
             # delete edge
-            del self.edges[couple][identifier]
-
-        # clear calculated attributes
-        if recalculate_calculated_attributes is True:
-            self.calc_degree()
-            self.find_neighbors()
+            if not recalculate_calculated_attributes:
+                self._invalidate_adjacency()
+            self._on_edge_removed(couple, identifier, self.edges[couple][identifier])
+            del self._own_nested(self.edges, couple, 'couples')[identifier]
 
     def has_edge(
             self, node_l: Identifier, node_r: Identifier,
@@ -526,13 +681,451 @@ class Graph(ABC):
             return identifier in self.edges[couple]
         return False
 
+    def _on_edge_added(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and fingerprint after edge is added"""
+        self._version += 1
+        if self._edge_fingerprint is not None:
+            self._edge_fingerprint = (
+                self._edge_fingerprint + edge_hash(couple, identifier, attributes)) & MASK
+        if self._temporal_index is not None:
+            self._temporal_index.add((couple, identifier), attributes)
+        for index in self._edge_indexes.values():
+            index.add((couple, identifier), attributes)
+
+    def _on_edge_removed(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and fingerprint before edge is removed"""
+        self._version += 1
+        if self._edge_fingerprint is not None:
+            self._edge_fingerprint = (
+                self._edge_fingerprint - edge_hash(couple, identifier, attributes)) & MASK
+        if self._temporal_index is not None:
+            self._temporal_index.remove((couple, identifier), attributes)
+        for index in self._edge_indexes.values():
+            index.remove((couple, identifier), attributes)
+
+    def _on_couple_added(self, couple: tuple[Identifier, Identifier]) -> None:
+        """Updates fingerprint before couple is added"""
+        if self._edge_fingerprint is not None:
+            self._edge_fingerprint = (self._edge_fingerprint + couple_hash(couple)) & MASK
+
+    def _on_couple_removed(self, couple: tuple[Identifier, Identifier]) -> None:
+        """Updates couple-level structures and fingerprint after couple is
+        removed"""
+        if self._edge_fingerprint is not None:
+            self._edge_fingerprint = (self._edge_fingerprint - couple_hash(couple)) & MASK
+
+    def _on_edges_cleared(self) -> None:
+        """Clears indexes, fingerprint and adjacency after all edges are
+        replaced"""
+        self._version += 1
+        self._edge_fingerprint = None
+        if self._temporal_index is not None:
+            self._temporal_index.clear()
+        for index in self._edge_indexes.values():
+            index.clear()
+        # empty adjacency is up to date for empty edges
+        self._clear_adjacency()
+        self._adjacency_is_built = True
+
+    def _on_edges_loaded(self) -> None:
+        """Builds couple-level structures from all edges at once after edges
+        are loaded without hooks (see `__setstate__`), adjacency is built on
+        the next lookup"""
+        self._version += 1
+        self._edge_fingerprint = None
+        self._invalidate_adjacency()
+
+    @abstractmethod
+    def _build_adjacency(self) -> None:
+        """Builds degree and adjacency from all edges in one pass"""
+
+    @abstractmethod
+    def _clear_adjacency(self) -> None:
+        """Replaces degree and adjacency by empty dicts"""
+
+    def ensure_adjacency(self) -> None:
+        """Builds degree and adjacency if they are not built (after
+        construction or bulk changes, see `_invalidate_adjacency`), called by
+        each lookup, so the next lookup costs O(1)"""
+        if not self._adjacency_is_built:
+            self._build_adjacency()
+            self._adjacency_is_built = True
+
+    def _invalidate_adjacency(self) -> None:
+        """Drops degree and adjacency, so edge mutations do not update them
+        until the next lookup rebuilds them in one pass"""
+        if self._adjacency_is_built:
+            self._adjacency_is_built = False
+            self._clear_adjacency()
+
+    def _own_nested(self, container: dict, key: Any, kind: str) -> dict:
+        """Returns nested dict (multiples, adjacent nodes) of
+        container owned by graph: dict shared with snapshot is copied on the
+        first write, missing dict is created"""
+        nested = container.get(key)
+        owned = self._owned
+        if nested is None:
+            nested = container[key] = {}
+        elif owned is None or key in owned[kind]:
+            return nested
+        else:
+            nested = container[key] = dict(nested)
+        if owned is not None:
+            owned[kind].add(key)
+        return nested
+
+    def _on_snapshot(self) -> None:
+        """Replaces top-level dicts and indexes shared with source graph by
+        own copies (called on new snapshot)"""
+        self.__nodes = dict(self.__nodes)
+        self.__edges = dict(self.__edges)
+        self._node_indexes = {
+            attribute: index.copy() for attribute, index in self._node_indexes.items()}
+        self._edge_indexes = {
+            attribute: index.copy() for attribute, index in self._edge_indexes.items()}
+        if self._temporal_index is not None:
+            self._temporal_index = self._temporal_index.copy()
+
+    def __copy__(self):
+        """Returns copy-on-write snapshot of graph (see `snapshot`)"""
+        snapshot = self.__class__.__new__(self.__class__)
+        snapshot.__dict__.update(self.__dict__)
+        snapshot._on_snapshot()
+        for graph in (self, snapshot):
+            graph._owned = {kind: set() for kind in self._shared_kinds}
+        return snapshot
+
+    def snapshot(self):
+        """Returns copy-on-write snapshot of graph
+
+        Snapshot copies only top-level dicts (nodes, edges and adjacency) and
+        shares node attribute dicts, multiples and adjacent nodes with graph.
+        Shared nested dict is copied by graph or snapshot on its first write
+        by graph methods (add_edge, del_edge), node attribute dicts are only
+        replaced (add_node), so graph and snapshot are independent and memory
+        grows only with modifications. Indexes are copied.
+
+        Attribute dicts must not be changed in place (`graph.nodes[node][key]
+        = value`): change of shared dict is visible in graph and snapshot (and
+        is not tracked by indexes and fingerprint). Use add_node or add_edge
+        with replace=True instead, or `copy(deep=True)` for copy with own
+        attribute dicts.
+
+        Returns
+        -------
+            Snapshot (graph of the same type)
+        """
+        return copy.copy(self)
+
+    def copy(self, deep: bool = False):
+        """Returns independent copy of graph
+
+        Parameters
+        ----------
+        deep, optional
+            Copy attribute dicts
+                - True: node and edge attribute dicts and multiples are
+                    copied, so attributes of copy can be changed in place
+                    without changing graph (O(N + E))
+                - False (default): copy-on-write snapshot (see `snapshot`),
+                    attribute dicts are shared with graph
+
+        Returns
+        -------
+            Copy (graph of the same type)
+        """
+        snapshot = self.snapshot()
+        if deep:
+            # values of existing keys are replaced, so dicts are not resized
+            # while they are iterated
+            nodes, edges = snapshot.nodes, snapshot.edges
+            for identifier, attributes in nodes.items():
+                nodes[identifier] = dict(attributes)
+            for couple, multiples in edges.items():
+                edges[couple] = {
+                    identifier: dict(attributes)
+                    for identifier, attributes in multiples.items()}
+        return snapshot
+
+    def diff(self, other) -> GraphPatch:
+        """Returns patch that transforms graph into other graph of the same
+        type (`graph.apply_patch(graph.diff(other))` makes graph equal to
+        other)
+
+        Unchanged elements are skipped without comparing attributes: node
+        attribute dicts and multiples shared by copy-on-write snapshots (see
+        `snapshot`) are skipped by identity, other ones are compared as whole
+        dicts first, so diff of a snapshot and its modified copy costs one
+        lookup per element plus the size of changes. Patch contains copies of
+        attribute dicts of added nodes and edges, so later changes of other
+        graph do not change patch.
+
+        Parameters
+        ----------
+        other
+            Graph of the same type, raise WrongTypeOfGraphInPatchException if
+            types are different
+
+        Returns
+        -------
+            GraphPatch
+        """
+        if other.check_type() != self.check_type():
+            raise WrongTypeOfGraphInPatchException(
+                received=other.check_type(), required=self.check_type())
+        patch = GraphPatch(self.check_type())
+        if self is other:
+            return patch
+
+        # nodes
+        nodes, other_nodes = self.nodes, other.nodes
+        for identifier, attributes in other_nodes.items():
+            current = nodes.get(identifier)
+            if current is None:
+                patch.added_nodes[identifier] = dict(attributes)
+            elif current is not attributes and current != attributes:
+                patch.changed_nodes[identifier] = attributes_change(current, attributes)
+        patch.removed_nodes = [
+            identifier for identifier in nodes if identifier not in other_nodes]
+
+        # couples and edges
+        edges, other_edges = self.edges, other.edges
+        for couple, multiples in other_edges.items():
+            current = edges.get(couple)
+            if current is None:
+                if multiples:
+                    patch.added_edges[couple] = {
+                        identifier: dict(attributes)
+                        for identifier, attributes in multiples.items()}
+                else:
+                    patch.added_couples.append(couple)
+                continue
+            if current is multiples or current == multiples:
+                continue
+            added, changed = {}, {}
+            for identifier, attributes in multiples.items():
+                current_attributes = current.get(identifier)
+                if current_attributes is None:
+                    added[identifier] = dict(attributes)
+                elif current_attributes is not attributes and \
+                        current_attributes != attributes:
+                    changed[identifier] = attributes_change(current_attributes, attributes)
+            removed = [
+                identifier for identifier in current if identifier not in multiples]
+            if added:
+                patch.added_edges[couple] = added
+            if removed:
+                patch.removed_edges[couple] = removed
+            if changed:
+                patch.changed_edges[couple] = changed
+        patch.removed_couples = [
+            couple for couple in edges if couple not in other_edges]
+
+        return patch
+
+    def _patch_conflicts(self, patch: GraphPatch) -> Iterator[str]:
+        """Yields elements of patch that do not match graph"""
+        for identifier in patch.removed_nodes:
+            if identifier not in self.nodes:
+                yield f'removed node {identifier} is not exists'
+        for identifier in patch.changed_nodes:
+            if identifier not in self.nodes:
+                yield f'changed node {identifier} is not exists'
+        for identifier in patch.added_nodes:
+            if identifier in self.nodes:
+                yield f'added node {identifier} already exists'
+        for couple in patch.removed_couples:
+            if not self.has_edge(*couple):
+                yield f'removed couple {couple} is not exists'
+        for couple in patch.added_couples:
+            if self.has_edge(*couple):
+                yield f'added couple {couple} already exists'
+        for changes, exists, state in (
+                (patch.removed_edges, True, 'is not exists'),
+                (patch.changed_edges, True, 'is not exists'),
+                (patch.added_edges, False, 'already exists')):
+            for couple, identifiers in changes.items():
+                for identifier in identifiers:
+                    if self.has_edge(*couple, identifier) is not exists:
+                        yield f'edge {identifier} of couple {couple} {state}'
+
+    def apply_patch(
+            self, patch: GraphPatch,
+            recalculate_calculated_attributes: bool = True) -> None:
+        """Applies patch (see `diff`) to graph
+
+        Patch is checked before any change: graph is not changed if graph
+        type is different (raise WrongTypeOfGraphInPatchException) or patch
+        does not match graph, e.g. removed edge is not exists or added node
+        already exists (raise PatchConflictException). Elements are applied
+        in order: removed couples, removed edges, removed nodes, added nodes,
+        changed nodes, added couples, added edges, changed edges.
+
+        Parameters
+        ----------
+        patch
+            GraphPatch
+        recalculate_calculated_attributes, optional
+            Update degree and neighbors of incident nodes
+                - True (default): update them incrementally
+                - False: drop degree and neighbors of all nodes, they are
+                    rebuilt in one pass on the next lookup (use for large
+                    patches)
+        """
+        if patch.graph_type != self.check_type():
+            raise WrongTypeOfGraphInPatchException(
+                received=patch.graph_type, required=self.check_type())
+        conflict = next(self._patch_conflicts(patch), None)
+        if conflict is not None:
+            raise PatchConflictException(conflict)
+
+        for couple in patch.removed_couples:
+            self.del_edge(
+                *couple,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
+        for couple, identifiers in patch.removed_edges.items():
+            for identifier in identifiers:
+                self.del_edge(
+                    *couple, identifier,
+                    recalculate_calculated_attributes=recalculate_calculated_attributes)
+        for identifier in patch.removed_nodes:
+            self.del_node(
+                identifier,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
+        for identifier, attributes in patch.added_nodes.items():
+            self.add_node(identifier, **attributes)
+        for identifier, change in patch.changed_nodes.items():
+            self.add_node(
+                identifier, replace=True,
+                **changed_attributes(self.nodes[identifier], change))
+        for couple in patch.added_couples:
+            # couple without edges (same as import from JSON)
+            identifier = self.add_edge(
+                *couple,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
+            self.del_edge(
+                *couple, identifier,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
+        for couple, multiples in patch.added_edges.items():
+            for identifier, attributes in multiples.items():
+                self.add_edge(
+                    *couple, identifier,
+                    recalculate_calculated_attributes=recalculate_calculated_attributes,
+                    **attributes)
+        for couple, multiples in patch.changed_edges.items():
+            for identifier, change in multiples.items():
+                current = self.edges[self._couple_representation(couple)][identifier]
+                self.add_edge(
+                    *couple, identifier, replace=True,
+                    recalculate_calculated_attributes=recalculate_calculated_attributes,
+                    **changed_attributes(current, change))
+
+    def __getstate__(self):
+        """Returns compact pickle state of graph
+
+        State contains node identifiers with attributes, couples as an array
+        of node numbers, the number of edges of each couple as an array, edge
+        identifiers with attributes, identifier generator and definitions of
+        indexes. Adjacency (degree, neighbors) and index contents are not
+        pickled and are rebuilt on load. Identifier generator that can not be
+        pickled (lambda, local function) is replaced by the default uuid
+        generator on load.
+        """
+        number = {node: position for position, node in enumerate(self.nodes)}
+        couples = array('q')
+        multiplicity = array('q')
+        edge_identifiers = []
+        edge_attributes = []
+        for (node_l, node_r), multiples in self.edges.items():
+            couples.append(number[node_l])
+            couples.append(number[node_r])
+            multiplicity.append(len(multiples))
+            edge_identifiers.extend(multiples)
+            edge_attributes.extend(multiples.values())
+        return {
+            'nodes': list(self.nodes),
+            'node_attributes': list(self.nodes.values()),
+            'couples': couples,
+            'multiplicity': multiplicity,
+            'edge_identifiers': edge_identifiers,
+            'edge_attributes': edge_attributes,
+            'identifier_generator': _picklable_or_none(self.identifier_generator),
+            'node_indexes': [
+                (attribute, index.kind) for attribute, index in self._node_indexes.items()],
+            'edge_indexes': [
+                (attribute, index.kind) for attribute, index in self._edge_indexes.items()],
+            'temporal_index': (
+                None if self._temporal_index is None else self._temporal_index.attribute)}
+
+    def __reduce_ex__(self, protocol):
+        """Pickles arrays of state as out-of-band buffers with protocol 5"""
+        reconstructor, args, state = super().__reduce_ex__(protocol)[:3]
+        if protocol >= 5:
+            for key in ('couples', 'multiplicity'):
+                state[key] = PickleBuffer(state[key])
+        return reconstructor, args, state
+
+    def __setstate__(self, state):
+        """Rebuilds graph from state of `__getstate__`: nodes and edges are
+        inserted without validation, adjacency and indexes are built once
+        from all edges"""
+        self.__init__(identifier_generator=state['identifier_generator'])
+        nodes = state['nodes']
+        self.__nodes = dict(zip(nodes, state['node_attributes']))
+        self._node_fingerprint = None
+
+        couples = _int_array(state['couples'])
+        edge_identifiers = state['edge_identifiers']
+        edge_attributes = state['edge_attributes']
+        edges = self.__edges
+        position = 0
+        for couple_number, length in enumerate(_int_array(state['multiplicity'])):
+            couple = (nodes[couples[2 * couple_number]], nodes[couples[2 * couple_number + 1]])
+            edges[couple] = dict(zip(
+                edge_identifiers[position:position + length],
+                edge_attributes[position:position + length]))
+            position += length
+        self._on_edges_loaded()
+
+        for attribute, kind in state['node_indexes']:
+            self.create_index(attribute, 'nodes', kind)
+        for attribute, kind in state['edge_indexes']:
+            self.create_index(attribute, 'edges', kind)
+        if state['temporal_index'] is not None:
+            self.create_temporal_index(state['temporal_index'])
+
+    def to_shared_memory(
+            self, node_attributes: Iterable[str] = None,
+            edge_attributes: Iterable[str] = None, name: str = None) -> SharedGraph:
+        """Exports graph structure to shared memory block for worker
+        processes (see SharedGraph `create`)
+
+        Parameters
+        ----------
+        node_attributes, optional
+            Node attributes stored as float columns (None - all attributes
+            with only int and float values)
+        edge_attributes, optional
+            Edge attributes stored as float columns (None - all attributes
+            with only int and float values)
+        name, optional
+            Name of shared memory block (None - generated name)
+
+        Returns
+        -------
+            Shared graph owning the block (call `unlink` when workers are
+            finished)
+        """
+        return SharedGraph.create(self, node_attributes, edge_attributes, name)
+
     def clear_edges(self) -> None:
         """Removes all edges from the graph"""
         self.edges = {}
 
-        self.clear_degree()
-        self.clear_neighbors()
-
     def get_subgraph(
             self, selected_nodes: Iterable[Identifier],
             include_adjacent_nodes: bool = False):
@@ -583,33 +1176,288 @@ class Graph(ABC):
                         recalculate_calculated_attributes=False,
                         **edge_attributes)
 
-        # recalculate calculated attributes
-        subgraph.calc_degree()
-        subgraph.find_neighbors()
+        return subgraph
+
+    def subgraph_view(
+            self, selected_nodes: Iterable[Identifier] = None,
+            node_filter=None, edge_filter=None) -> SubgraphView:
+        """Returns read-only subgraph view over graph storage without copying
+
+        Parameters
+        ----------
+        selected_nodes, optional
+            Iterable object with node identifiers (None - all nodes)
+        node_filter, optional
+            Function (identifier, attributes) -> bool, selects nodes
+        edge_filter, optional
+            Function (node_l, node_r, identifier, attributes) -> bool,
+            selects edges
+
+        Returns
+        -------
+            Subgraph view
+        """
+        return SubgraphView(
+            self, selected_nodes=selected_nodes,
+            node_filter=node_filter, edge_filter=edge_filter)
+
+    def create_temporal_index(self, attribute: str = 'date') -> None:
+        """Creates sorted index over edge time attribute, index is kept in sync
+        with graph on each edge mutation
+
+        Parameters
+        ----------
+        attribute, optional
+            Edge attribute with comparable time value (date, datetime, ISO
+            str), add_edge raise WrongTypeOfIndexedValueException if value is
+            not comparable with indexed values
+        """
+        self._temporal_index = SortedIndex(attribute)
+        self._temporal_index.build(self._iter_edge_items())
+
+    def drop_temporal_index(self) -> None:
+        """Removes temporal index"""
+        self._temporal_index = None
+
+    def _checked_temporal_index(self) -> SortedIndex:
+        """Returns temporal index, raise TemporalIndexIsNotExistsException if
+        index not created"""
+        if self._temporal_index is None:
+            raise TemporalIndexIsNotExistsException()
+        return self._temporal_index
+
+    def _subgraph_from_edges(
+            self, entries: Iterable[tuple[tuple[Identifier, Identifier], Identifier]]):
+        """Returns subgraph with selected edges and their incident nodes"""
+        subgraph = self.__class__()
+        nodes = self.nodes
+        edges = self.edges
+        for couple, identifier in entries:
+            for node in couple:
+                if node not in subgraph.nodes:
+                    subgraph.add_node(identifier=node, **nodes[node])
+            subgraph.add_edge(
+                *couple, identifier=identifier,
+                recalculate_calculated_attributes=False,
+                **edges[couple][identifier])
 
         return subgraph
 
-    def clear_degree(self):
-        """Set degree value to 0 for each node in graph"""
-        for node in self.nodes:
-            self.nodes[node]['degree'] = 0
+    def get_edges_by_time(self, start: Any = None, end: Any = None) -> Edges:
+        """Returns edges with start <= time <= end using temporal index
+
+        Parameters
+        ----------
+        start, optional
+            Start of time range (None - without lower bound)
+        end, optional
+            End of time range (None - without upper bound)
+
+        Returns
+        -------
+            Edges (couples with selected multiples)
+        """
+        selected = {}
+        for couple, identifier in self._checked_temporal_index().range(start, end):
+            selected.setdefault(couple, {})[identifier] = self.edges[couple][identifier]
+        return selected
 
-    def calc_degree(self):
-        """Calculates degree for each node in graph"""
-        self.clear_degree()
+    def get_subgraph_by_time(self, start: Any = None, end: Any = None):
+        """Returns subgraph with edges with start <= time <= end and their
+        incident nodes using temporal index
 
-        for (node_l, node_r), multiples in self.edges.items():
-            self.nodes[node_l]['degree'] += len(multiples)
-            self.nodes[node_r]['degree'] += len(multiples)
+        Parameters
+        ----------
+        start, optional
+            Start of time range (None - without lower bound)
+        end, optional
+            End of time range (None - without upper bound)
+
+        Returns
+        -------
+            Subgraph
+        """
+        return self._subgraph_from_edges(
+            self._checked_temporal_index().range(start, end))
+
+    def get_time_windows(
+            self, window: Any, step: Any = None,
+            start: Any = None, end: Any = None) -> Iterator[tuple[Any, Any]]:
+        """Generates sliding-window snapshots, each window contains edges with
+        window start <= time < window start + window
+
+        Parameters
+        ----------
+        window
+            Window size (timedelta for date and datetime)
+        step, optional
+            Shift between windows (None - equal to window size)
+        start, optional
+            Start of the first window (None - the earliest time in index)
+        end, optional
+            Windows start before end (None - the latest time in index)
+
+        Returns
+        -------
+            Iterator over tuples (window start, subgraph)
+        """
+        temporal_index = self._checked_temporal_index()
+        if len(temporal_index) == 0:
+            return
+        step = window if step is None else step
+        window_start = temporal_index.first() if start is None else start
+        end = temporal_index.last() if end is None else end
+        while window_start <= end:
+            entries = temporal_index.range(
+                window_start, window_start + window, include_end=False)
+            yield window_start, self._subgraph_from_edges(entries)
+            window_start = window_start + step
+
+    def _iter_edge_items(self) -> Iterator[tuple[tuple, dict[str, Any]]]:
+        """Generates tuples ((couple, edge identifier), edge attributes)"""
+        for couple, multiples in self.edges.items():
+            for identifier, attributes in multiples.items():
+                yield (couple, identifier), attributes
+
+    def _indexes_of(self, target: str) -> dict:
+        """Returns indexes of nodes or edges"""
+        if target == 'nodes':
+            return self._node_indexes
+        if target == 'edges':
+            return self._edge_indexes
+        raise WrongTargetOfIndexException()
+
+    def create_index(
+            self, attribute: str, target: str = 'nodes',
+            kind: str = 'hash') -> None:
+        """Creates secondary index over node or edge attribute, index is kept
+        in sync with graph on each mutation
+
+        Parameters
+        ----------
+        attribute
+            Attribute name
+        target, optional
+            Indexed objects
+                - nodes (default): node attributes
+                - edges: edge attributes
+        kind, optional
+            Index kind
+                - hash (default): equality queries
+                - sorted: equality and range queries (attribute values must
+                    be comparable with each other, add_node and add_edge
+                    raise WrongTypeOfIndexedValueException before any change
+                    if value is not comparable with indexed values)
+        """
+        indexes = self._indexes_of(target)
+        if kind not in INDEX_KINDS:
+            raise WrongKindOfIndexException()
+        index = INDEX_KINDS[kind](attribute)
+        if target == 'nodes':
+            index.build(self.nodes.items())
+        else:
+            index.build(self._iter_edge_items())
+        indexes[attribute] = index
+
+    def drop_index(self, attribute: str, target: str = 'nodes') -> None:
+        """Removes secondary index over node or edge attribute"""
+        indexes = self._indexes_of(target)
+        if attribute not in indexes:
+            raise IndexIsNotExistsException()
+        del indexes[attribute]
+
+    def _find(self, target: str, conditions: dict[str, Any]) -> Iterator:
+        """Generates (key, attributes) of objects satisfying conditions, uses
+        indexes to select candidates when possible"""
+        parsed = _parse_conditions(conditions)
+        indexes = self._indexes_of(target)
+
+        candidates = None
+        for attribute, lookup, value in parsed:
+            index = indexes.get(attribute)
+            if index is None or (lookup != 'eq' and index.kind != 'sorted'):
+                continue
+            if lookup == 'eq':
+                keys = index.equal(value)
+            else:
+                bounds = {
+                    'gt': (value, None, False, True),
+                    'gte': (value, None, True, True),
+                    'lt': (None, value, True, False),
+                    'lte': (None, value, True, True)}[lookup]
+                keys = set(index.range(*bounds))
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                return
+
+        if target == 'nodes':
+            if candidates is None:
+                items = self.nodes.items()
+            else:
+                items = ((node, self.nodes[node]) for node in candidates)
+        else:
+            if candidates is None:
+                items = self._iter_edge_items()
+            else:
+                items = (
+                    ((couple, identifier), self.edges[couple][identifier])
+                    for couple, identifier in candidates)
 
-    def clear_neighbors(self):
-        """Set neighbors value to empty set for each node in graph"""
-        for node in self.nodes:
-            self.nodes[node]['neighbors'] = set()
+        for key, attributes in items:
+            if _matches(attributes, parsed):
+                yield key, attributes
+
+    def find_nodes(self, **conditions) -> Nodes:
+        """Returns nodes with attributes satisfying all conditions
+
+        Parameters
+        ----------
+        conditions
+            Conditions like attribute=value (equality) or
+            attribute__lookup=value, where lookup is gt, gte, lt or lte,
+            nodes without attribute do not satisfy condition
+
+        Returns
+        -------
+            Nodes
+        """
+        return dict(self._find('nodes', conditions))
+
+    def find_edges(self, **conditions) -> Edges:
+        """Returns edges with attributes satisfying all conditions
+
+        Parameters
+        ----------
+        conditions
+            Conditions like attribute=value (equality) or
+            attribute__lookup=value, where lookup is gt, gte, lt or lte,
+            edges without attribute do not satisfy condition
+
+        Returns
+        -------
+            Edges (couples with selected multiples)
+        """
+        selected = {}
+        for (couple, identifier), attributes in self._find('edges', conditions):
+            selected.setdefault(couple, {})[identifier] = attributes
+        return selected
+
+    def _checked_node(self, identifier: Identifier) -> Identifier:
+        """Validates node identifier and existence"""
+        if not isinstance(identifier, Identifier):
+            raise WrongTypeOfNodeIdentifierException()
+        if identifier not in self.nodes:
+            raise NodeIsNotExistsException()
+        return identifier
+
+    @abstractmethod
+    def degree(self, identifier: Identifier) -> int:
+        """Returns the number of edges incident to node (loop increases
+        degree by 2)"""
 
     @abstractmethod
-    def find_neighbors(self):
-        """Finds neighbors for each node in graph"""
+    def neighbors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns adjacent nodes of node"""
 
     def find_loops(self):
         """Finds loops in a graph (when an edge incident to one node)"""
@@ -621,6 +1469,10 @@ class Graph(ABC):
         """Checks graph type"""
         return self.__class__.__name__
 
+    @abstractmethod
+    def check_is_directed(self) -> bool:
+        """Checks that graph is directed"""
+
     @abstractmethod
     def check_is_complete(self):
         """Checks that graph is complete"""
@@ -634,10 +1486,38 @@ class Graph(ABC):
         nodes (and is a multigraph)"""
         return any(len(multiples) > 1 for multiples in self.edges.values())
 
+    def memory_usage(
+            self, deep: bool = True, sample_size: int = 10_000,
+            seed: int = 0) -> dict[str, int]:
+        """Returns estimated memory usage of graph in bytes by component
+
+        Parameters
+        ----------
+        deep, optional
+            Measure content of nodes and edges
+                - True (default): breakdown by component (containers,
+                  identifiers, couples, attributes, derived attributes,
+                  internal structures)
+                - False: only nodes dict and edges dict
+        sample_size, optional
+            Maximum number of sampled nodes and couples, measured sizes of
+            sample are extrapolated to the whole graph
+        seed, optional
+            Seed of random sample
+
+        Returns
+        -------
+            Dict with component and size in bytes (see `graph_memory_usage`)
+        """
+        return graph_memory_usage(self, deep=deep, sample_size=sample_size, seed=seed)
+
+    def memory_report(self, sample_size: int = 10_000) -> list[dict[str, Any]]:
+        """Returns estimated savings of compact representations sorted by
+        saving descending (see `graph_memory_report`)"""
+        return graph_memory_report(self, self.memory_usage(sample_size=sample_size))
+
     def describe(self):
         """Returns information about graph"""
-        self.calc_degree()
-        self.find_neighbors()
         return {
             'type': self.check_type(),
             'number_of_nodes': len(self.nodes),
@@ -647,3 +1527,16 @@ class Graph(ABC):
             'pseudo_graph': self.check_is_pseudo(),
             'complete_graph': self.check_is_complete(),
         }
+
+    async def describe_async(self, executor: Executor = None):
+        """Returns information about graph (see `describe`), calculation runs
+        in executor on snapshot of graph, so event loop is not blocked
+
+        Parameters
+        ----------
+        executor, optional
+            Executor (None - default executor of event loop)
+        """
+        snapshot = self.snapshot()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, snapshot.describe)
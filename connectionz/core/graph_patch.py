@@ -0,0 +1,236 @@
+"""GraphPatch implementation"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+from connectionz.core.identifier import Identifier
+
+
+def attributes_change(
+        old: dict[str, Any], new: dict[str, Any]
+        ) -> tuple[dict[str, Any], list[str]]:
+    """Returns change of attributes dict: set attributes (added or changed)
+    and unset attribute names"""
+    changed = {
+        key: value for key, value in new.items()
+        if key not in old or old[key] != value}
+    unset = [key for key in old if key not in new]
+    return changed, unset
+
+
+def changed_attributes(
+        old: dict[str, Any], change: tuple[dict[str, Any], list[str]]
+        ) -> dict[str, Any]:
+    """Returns new attributes dict: old attributes with applied change"""
+    changed, unset = change
+    attributes = {key: value for key, value in old.items() if key not in unset}
+    attributes.update(changed)
+    return attributes
+
+
+# key of tagged value in JSON: {"$": type, "v": JSON representation}
+TAG = '$'
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def encode_value(value: Any) -> Any:
+    """Returns JSON representation of attribute value
+
+    Values that JSON can not restore are tagged: tuple, set, frozenset, date,
+    datetime and dicts with non-str keys or with tag key, raise TypeError for
+    other types.
+    """
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    if isinstance(value, dict):
+        if TAG in value or not all(isinstance(key, str) for key in value):
+            return {TAG: 'dict', 'v': [
+                [encode_value(key), encode_value(item)] for key, item in value.items()]}
+        return {key: encode_value(item) for key, item in value.items()}
+    if isinstance(value, (tuple, set, frozenset)):
+        return {TAG: type(value).__name__, 'v': [encode_value(item) for item in value]}
+    if isinstance(value, (date, datetime)):
+        return {TAG: type(value).__name__, 'v': value.isoformat()}
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+_TAGGED_TYPES = {
+    'tuple': tuple, 'set': set, 'frozenset': frozenset,
+    'date': date.fromisoformat, 'datetime': datetime.fromisoformat}
+
+
+def decode_value(value: Any) -> Any:
+    """Returns attribute value from its JSON representation (see
+    `encode_value`)"""
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    if TAG not in value:
+        return {key: decode_value(item) for key, item in value.items()}
+    tag, content = value[TAG], value['v']
+    if tag == 'dict':
+        return {decode_value(key): decode_value(item) for key, item in content}
+    if tag in ('date', 'datetime'):
+        return _TAGGED_TYPES[tag](content)
+    return _TAGGED_TYPES[tag](decode_value(item) for item in content)
+
+
+def _encode_change(change: tuple[dict[str, Any], list[str]]) -> list:
+    """Returns JSON representation of attributes change"""
+    changed, unset = change
+    return [encode_value(changed), unset]
+
+
+def _decode_change(change: list) -> tuple[dict[str, Any], list[str]]:
+    """Returns attributes change from its JSON representation"""
+    changed, unset = change
+    return decode_value(changed), unset
+
+
+class GraphPatch:
+
+    """Difference between two graphs of the same type (see Graph `diff` and
+    `apply_patch`)
+
+    Patch representation
+    --------------------
+
+    Patch contains only changed elements of graph:
+        - graph_type - type of graph (DirectedGraph or UndirectedGraph)
+        - added_nodes - a dict with node identifier and node attributes
+        - removed_nodes - a list with node identifiers
+        - changed_nodes - a dict with node identifier and attributes change
+        - added_couples - a list with couples without edges
+        - removed_couples - a list with couples (removed with their edges)
+        - added_edges - a dict with couple and a dict with edge identifier
+          and edge attributes
+        - removed_edges - a dict with couple and a list with edge identifiers
+        - changed_edges - a dict with couple and a dict with edge identifier
+          and attributes change
+
+    Attributes change is a tuple with a dict of added or changed attributes
+    and a list of removed attribute names, so patch of large attribute dict
+    contains only changed values.
+
+    Patch representation example:
+        GraphPatch(
+            graph_type='DirectedGraph',
+            added_nodes={'Sebastian': {'age': 21}},
+            changed_nodes={'Elizabeth': ({'age': 20}, ['sex'])},
+            added_edges={('Elizabeth', 'Sebastian'): {'46f893e': {'amount': 1400}}},
+            removed_edges={('Elizabeth', 'Ava'): ['206ij5s']},
+        )
+
+    Serialized patch (`to_json`) is a compact JSON document, so services can
+    exchange deltas instead of full exports of graph. Attribute values are
+    restored with their types (see `encode_value`).
+    """
+
+    def __init__(
+            self, graph_type: str, *,
+            added_nodes: dict[Identifier, dict[str, Any]] = None,
+            removed_nodes: list[Identifier] = None,
+            changed_nodes: dict[Identifier, tuple[dict[str, Any], list[str]]] = None,
+            added_couples: list[tuple[Identifier, Identifier]] = None,
+            removed_couples: list[tuple[Identifier, Identifier]] = None,
+            added_edges: dict[tuple[Identifier, Identifier], dict] = None,
+            removed_edges: dict[tuple[Identifier, Identifier], list[Identifier]] = None,
+            changed_edges: dict[tuple[Identifier, Identifier], dict] = None):
+        self.graph_type = graph_type
+        self.added_nodes = added_nodes if added_nodes is not None else {}
+        self.removed_nodes = removed_nodes if removed_nodes is not None else []
+        self.changed_nodes = changed_nodes if changed_nodes is not None else {}
+        self.added_couples = added_couples if added_couples is not None else []
+        self.removed_couples = removed_couples if removed_couples is not None else []
+        self.added_edges = added_edges if added_edges is not None else {}
+        self.removed_edges = removed_edges if removed_edges is not None else {}
+        self.changed_edges = changed_edges if changed_edges is not None else {}
+
+    def __repr__(self):
+        return f'{self.graph_type} patch with {len(self)} changes'
+
+    def __len__(self):
+        """Returns the number of changed nodes, couples and edges"""
+        return (
+            len(self.added_nodes) + len(self.removed_nodes)
+            + len(self.changed_nodes) + len(self.added_couples)
+            + len(self.removed_couples)
+            + sum(len(edges) for edges in self.added_edges.values())
+            + sum(len(edges) for edges in self.removed_edges.values())
+            + sum(len(edges) for edges in self.changed_edges.values()))
+
+    def __eq__(self, other):
+        if not isinstance(other, GraphPatch):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def to_json(self) -> str:
+        """Returns compact JSON representation of patch, attribute values that
+        JSON can not restore (tuple, set, date, datetime) are tagged, so
+        `GraphPatch.from_json(patch.to_json()) == patch`"""
+        data = {
+            'graph_type': self.graph_type,
+            'nodes': {
+                'added': {
+                    identifier: encode_value(attributes)
+                    for identifier, attributes in self.added_nodes.items()},
+                'removed': self.removed_nodes,
+                'changed': {
+                    identifier: _encode_change(change)
+                    for identifier, change in self.changed_nodes.items()},
+            },
+            'couples': {
+                'added': self.added_couples,
+                'removed': self.removed_couples,
+            },
+            'edges': {
+                'added': [
+                    [*couple, {
+                        identifier: encode_value(attributes)
+                        for identifier, attributes in multiples.items()}]
+                    for couple, multiples in self.added_edges.items()],
+                'removed': [
+                    [*couple, identifiers]
+                    for couple, identifiers in self.removed_edges.items()],
+                'changed': [
+                    [*couple, {
+                        identifier: _encode_change(change)
+                        for identifier, change in multiples.items()}]
+                    for couple, multiples in self.changed_edges.items()],
+            },
+        }
+        return json.dumps(data, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text: str) -> 'GraphPatch':
+        """Returns patch from its JSON representation (see `to_json`)"""
+        data = json.loads(text)
+        nodes, couples, edges = data['nodes'], data['couples'], data['edges']
+        return cls(
+            graph_type=data['graph_type'],
+            added_nodes={
+                identifier: decode_value(attributes)
+                for identifier, attributes in nodes['added'].items()},
+            removed_nodes=nodes['removed'],
+            changed_nodes={
+                identifier: _decode_change(change)
+                for identifier, change in nodes['changed'].items()},
+            added_couples=[tuple(couple) for couple in couples['added']],
+            removed_couples=[tuple(couple) for couple in couples['removed']],
+            added_edges={
+                (node_l, node_r): {
+                    identifier: decode_value(attributes)
+                    for identifier, attributes in multiples.items()}
+                for node_l, node_r, multiples in edges['added']},
+            removed_edges={
+                (node_l, node_r): identifiers
+                for node_l, node_r, identifiers in edges['removed']},
+            changed_edges={
+                (node_l, node_r): {
+                    identifier: _decode_change(change)
+                    for identifier, change in multiples.items()}
+                for node_l, node_r, multiples in edges['changed']})
@@ -1,12 +1,59 @@
-"""Type alias for idetifier"""
+"""Type alias for idetifier and identifier generators"""
 
+from os import urandom
 from uuid import uuid4
-from typing import TypeAlias
+from typing import Callable, TypeAlias
 
 
 Identifier: TypeAlias = str
 
+IdentifierGenerator: TypeAlias = Callable[[], Identifier]
+
 
 def generate_identifier() -> Identifier:
     """Returns uuid in fixed format"""
     return uuid4().hex
+
+
+class CounterIdentifierGenerator:
+
+    """Monotonic counter identifier generator
+
+    Generates identifiers '0', '1', '2', ... or with prefix 'e0', 'e1', 'e2',
+    ... without reading OS random numbers generator. Identifiers are unique
+    only within one generator, so use one generator per graph (or different
+    prefixes). Generator keeps the next value as a plain int, so it is
+    pickled with graph.
+    """
+
+    def __init__(self, prefix: str = '', start: int = 0):
+        self.prefix = prefix
+        self.counter = start
+
+    def __call__(self) -> Identifier:
+        value = self.counter
+        self.counter = value + 1
+        return f'{self.prefix}{value}'
+
+
+class RandomIdentifierGenerator:
+
+    """Batched random identifier generator
+
+    Draws random bytes for `batch_size` identifiers at once and slices them
+    into hex identifiers of `length` characters.
+    """
+
+    def __init__(self, length: int = 16, batch_size: int = 1024):
+        self.length = length
+        self.batch_size = batch_size
+        self._batch = ''
+        self._position = 0
+
+    def __call__(self) -> Identifier:
+        if self._position + self.length > len(self._batch):
+            self._batch = urandom((self.length * self.batch_size + 1) // 2).hex()
+            self._position = 0
+        position = self._position
+        self._position = position + self.length
+        return self._batch[position:self._position]
@@ -0,0 +1,259 @@
+"""Secondary indexes over node and edge attributes"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Hashable, Iterable, Iterator
+from connectionz.exceptions.index_exceptions import WrongTypeOfIndexedValueException
+
+
+class HashIndex:
+
+    """Hash index over attribute for equality queries
+
+    Index representation
+    --------------------
+
+    Index is a dict with:
+        - attribute value
+        - set of keys (node identifiers or tuples with couple and edge
+          identifier) with this value
+
+    Objects without attribute or with unhashable attribute value are not
+    indexed. Equality query costs O(1 + result).
+    """
+
+    kind = 'hash'
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+        self.keys = {}
+
+    def __len__(self):
+        return sum(len(keys) for keys in self.keys.values())
+
+    def build(self, items: Iterable[tuple[Hashable, dict[str, Any]]]) -> None:
+        """Builds index from all objects at once"""
+        self.clear()
+        for key, attributes in items:
+            self.add(key, attributes)
+
+    def clear(self) -> None:
+        """Removes all objects from index"""
+        self.keys = {}
+
+    def copy(self) -> 'HashIndex':
+        """Returns independent copy of index"""
+        index = HashIndex(self.attribute)
+        index.keys = {value: set(keys) for value, keys in self.keys.items()}
+        return index
+
+    def check(self, attributes: dict[str, Any]) -> None:
+        """Checks that attribute value can be added to index (any value, objects
+        with unhashable value are not indexed)"""
+
+    def add(self, key: Hashable, attributes: dict[str, Any]) -> None:
+        """Adds object to index"""
+        if self.attribute not in attributes:
+            return
+        try:
+            self.keys.setdefault(attributes[self.attribute], set()).add(key)
+        except TypeError:
+            pass
+
+    def remove(self, key: Hashable, attributes: dict[str, Any]) -> None:
+        """Removes object from index"""
+        if self.attribute not in attributes:
+            return
+        value = attributes[self.attribute]
+        try:
+            keys = self.keys.get(value)
+        except TypeError:
+            return
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.keys[value]
+
+    def equal(self, value: Any) -> set[Hashable]:
+        """Returns keys of objects with attribute equal to value"""
+        return set(self.keys.get(value, ()))
+
+
+class SortedIndex:
+
+    """Sorted index over attribute for equality and range queries
+
+    Index representation
+    --------------------
+
+    Index is a sorted list split into buckets of at most 2 * `bucket_size`
+    objects:
+        - values: buckets of attribute values
+        - keys: buckets of node identifiers or tuples with couple and edge
+          identifier (aligned with values)
+        - maxes: the last value of each bucket
+        - length: the number of indexed objects
+
+    Objects without attribute are not indexed, attribute values must be
+    comparable with each other (see `check`). Insertion and removal cost
+    O(log N + bucket size) (binary search over maxes and inside bucket, list
+    insert moves only objects of one bucket), full bucket is split in two.
+    Range query costs O(log N + result). Index is built from all objects at
+    once by one sort (see `build`).
+    """
+
+    kind = 'sorted'
+
+    bucket_size = 1000
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+        self.values: list[list] = []
+        self.keys: list[list] = []
+        self.maxes: list = []
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def build(self, items: Iterable[tuple[Hashable, dict[str, Any]]]) -> None:
+        """Builds index from all objects at once"""
+        attribute = self.attribute
+        indexed = sorted(
+            ((attributes[attribute], key)
+                for key, attributes in items if attribute in attributes),
+            key=lambda item: item[0])
+        size = self.bucket_size
+        self.values = [
+            [value for value, _ in indexed[start:start + size]]
+            for start in range(0, len(indexed), size)]
+        self.keys = [
+            [key for _, key in indexed[start:start + size]]
+            for start in range(0, len(indexed), size)]
+        self.maxes = [bucket[-1] for bucket in self.values]
+        self.length = len(indexed)
+
+    def clear(self) -> None:
+        """Removes all objects from index"""
+        self.values = []
+        self.keys = []
+        self.maxes = []
+        self.length = 0
+
+    def copy(self) -> 'SortedIndex':
+        """Returns independent copy of index"""
+        index = SortedIndex(self.attribute)
+        index.values = [list(bucket) for bucket in self.values]
+        index.keys = [list(bucket) for bucket in self.keys]
+        index.maxes = list(self.maxes)
+        index.length = self.length
+        return index
+
+    def check(self, attributes: dict[str, Any]) -> None:
+        """Checks that attribute value can be added to index (before object is
+        stored), raise WrongTypeOfIndexedValueException if value is not
+        comparable with indexed values"""
+        if self.attribute not in attributes:
+            return
+        value = attributes[self.attribute]
+        reference = self.maxes[0] if self.maxes else value
+        try:
+            sorted((value, reference))
+        except TypeError:
+            raise WrongTypeOfIndexedValueException(self.attribute) from None
+
+    def add(self, key: Hashable, attributes: dict[str, Any]) -> None:
+        """Adds object to index"""
+        if self.attribute not in attributes:
+            return
+        value = attributes[self.attribute]
+        self.length += 1
+        if not self.maxes:
+            self.values.append([value])
+            self.keys.append([key])
+            self.maxes.append(value)
+            return
+        bucket = min(bisect_right(self.maxes, value), len(self.maxes) - 1)
+        values, keys = self.values[bucket], self.keys[bucket]
+        position = bisect_right(values, value)
+        values.insert(position, value)
+        keys.insert(position, key)
+        self.maxes[bucket] = values[-1]
+        if len(values) > 2 * self.bucket_size:
+            # split full bucket in two
+            half = self.bucket_size
+            self.values[bucket + 1:bucket + 1] = [values[half:]]
+            self.keys[bucket + 1:bucket + 1] = [keys[half:]]
+            del values[half:], keys[half:]
+            self.maxes[bucket:bucket + 1] = [values[-1], self.values[bucket + 1][-1]]
+
+    def remove(self, key: Hashable, attributes: dict[str, Any]) -> None:
+        """Removes object from index"""
+        if self.attribute not in attributes:
+            return
+        value = attributes[self.attribute]
+        # objects with equal values can be stored in several buckets
+        for bucket in range(bisect_left(self.maxes, value), len(self.maxes)):
+            values, keys = self.values[bucket], self.keys[bucket]
+            position = bisect_left(values, value)
+            end = bisect_right(values, value, lo=position)
+            for current in range(position, end):
+                if keys[current] == key:
+                    del values[current], keys[current]
+                    self.length -= 1
+                    if values:
+                        self.maxes[bucket] = values[-1]
+                    else:
+                        del self.values[bucket], self.keys[bucket], self.maxes[bucket]
+                    return
+            if end < len(values):
+                return
+
+    def first(self) -> Any:
+        """Returns the smallest indexed value (None for empty index)"""
+        return self.values[0][0] if self.values else None
+
+    def last(self) -> Any:
+        """Returns the largest indexed value (None for empty index)"""
+        return self.maxes[-1] if self.maxes else None
+
+    def _bound(self, value: Any, right: bool) -> tuple[int, int]:
+        """Returns position (bucket, position in bucket) of the first object
+        with attribute value greater than (right is True) or greater than or
+        equal to (right is False) value"""
+        search = bisect_right if right else bisect_left
+        bucket = search(self.maxes, value)
+        if bucket == len(self.maxes):
+            return bucket, 0
+        return bucket, search(self.values[bucket], value)
+
+    def positions(
+            self, start: Any = None, end: Any = None,
+            include_start: bool = True,
+            include_end: bool = True) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Returns positions (bucket, position in bucket) of the first object
+        in range and of the first object after range"""
+        left = (0, 0) if start is None else self._bound(start, not include_start)
+        right = (len(self.maxes), 0) if end is None else self._bound(end, include_end)
+        return left, max(left, right)
+
+    def range(
+            self, start: Any = None, end: Any = None,
+            include_start: bool = True,
+            include_end: bool = True) -> Iterator[Hashable]:
+        """Generates keys of objects with attribute value in range (None bound
+        means range without this bound), bound that is not comparable with
+        indexed values gives no objects"""
+        try:
+            (left_bucket, left), (right_bucket, right) = self.positions(
+                start, end, include_start, include_end)
+        except TypeError:
+            return
+        for bucket in range(left_bucket, min(right_bucket + 1, len(self.keys))):
+            keys = self.keys[bucket]
+            yield from keys[
+                left if bucket == left_bucket else 0:
+                right if bucket == right_bucket else len(keys)]
+
+    def equal(self, value: Any) -> set[Hashable]:
+        """Returns keys of objects with attribute equal to value"""
+        return set(self.range(value, value))
@@ -0,0 +1,221 @@
+"""Memory accounting of graph
+
+Sizes are estimates in bytes (`sys.getsizeof` of each object). Objects
+referenced from several places (node identifiers in couples and adjacency,
+cached small ints and strings) are counted once, in the component that owns
+them. Large graphs are measured on a random sample of nodes and couples and
+extrapolated to the whole graph. Derived and internal structures (adjacency,
+indexes) are measured on random samples of their nested containers, so the
+cost of measurement does not grow with the size of graph.
+"""
+
+import sys
+import random
+from typing import Any
+
+
+DERIVED_STRUCTURES = (
+    '_degree', '_adjacency', '_out_degree', '_in_degree', '_successors', '_predecessors')
+
+MEMORY_COMPONENTS = (
+    'nodes_dict',
+    'edges_dict',
+    'multiples',
+    'attribute_dicts',
+    'node_identifiers',
+    'edge_identifiers',
+    'couples',
+    'attributes',
+    'derived',
+    'internal')
+
+POINTER_SIZE = 8
+
+
+def _deep_sizeof(value: Any) -> int:
+    """Returns size of object with nested dicts, lists, tuples, sets and
+    instance attributes"""
+    seen = set()
+    stack = [value]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__dict__') and not isinstance(item, type):
+            stack.append(vars(item))
+    return size
+
+
+def _sample(keys: list, sample_size: int, generator: random.Random) -> tuple[list, float]:
+    """Returns sampled keys and scale to extrapolate sample to all keys"""
+    if len(keys) <= sample_size:
+        return keys, 1.0
+    return generator.sample(keys, sample_size), len(keys) / sample_size
+
+
+def _sampled_sizeof(
+        value: Any, sample_size: int, generator: random.Random,
+        seen: set[int] = None) -> float:
+    """Returns estimated size of object with nested containers and instance
+    attributes without strings
+
+    Containers with more than `sample_size` items are measured on a random
+    sample of items and extrapolated, sample size is divided between items
+    of the next nesting level, so about `sample_size` objects are measured
+    on each level.
+    """
+    if seen is None:
+        seen = set()
+    if isinstance(value, str) or id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        keys, scale = _sample(list(value), sample_size, generator)
+        items = [item for key in keys for item in (key, value[key])]
+    elif isinstance(value, (list, tuple)):
+        if len(value) <= sample_size:
+            items, scale = value, 1.0
+        else:
+            positions = generator.sample(range(len(value)), sample_size)
+            items = [value[position] for position in positions]
+            scale = len(value) / sample_size
+    elif isinstance(value, (set, frozenset)):
+        items, scale = _sample(list(value), sample_size, generator)
+    elif hasattr(value, '__dict__') and not isinstance(value, type):
+        items, scale = [vars(value)], 1.0
+    else:
+        return size
+    if not items:
+        return size
+    nested_sample_size = max(1, sample_size // len(items))
+    return size + scale * sum(
+        _sampled_sizeof(item, nested_sample_size, generator, seen) for item in items)
+
+
+def graph_memory_usage(
+        graph, deep: bool = True, sample_size: int = 10_000,
+        seed: int = 0) -> dict[str, int]:
+    """Returns memory usage of graph by component
+
+    Components
+    ----------
+
+        - nodes_dict, edges_dict: nodes and edges dicts (without content)
+        - multiples: multiples dicts (without content)
+        - attribute_dicts: node and edge attribute dicts (without content)
+        - node_identifiers, edge_identifiers: identifier strings
+        - couples: couple tuples
+        - attributes: keys and values of user attributes (payload)
+        - derived: degree and adjacency structures (without identifier
+          strings)
+        - internal: indexes and other internal structures (without identifier
+          strings)
+        - total: sum of components
+
+    If deep is False, only nodes dict and edges dict are measured.
+    """
+    nodes = graph.nodes
+    edges = graph.edges
+    usage = dict.fromkeys(MEMORY_COMPONENTS, 0)
+    usage['nodes_dict'] = sys.getsizeof(nodes)
+    usage['edges_dict'] = sys.getsizeof(edges)
+
+    if deep:
+        generator = random.Random(seed)
+
+        # nodes
+        sampled, scale = _sample(list(nodes), sample_size, generator)
+        sizes = dict.fromkeys(MEMORY_COMPONENTS, 0)
+        for identifier in sampled:
+            node_attributes = nodes[identifier]
+            sizes['node_identifiers'] += sys.getsizeof(identifier)
+            sizes['attribute_dicts'] += sys.getsizeof(node_attributes)
+            for key, value in node_attributes.items():
+                sizes['attributes'] += sys.getsizeof(key) + _deep_sizeof(value)
+        for component, size in sizes.items():
+            usage[component] += round(size * scale)
+
+        # edges
+        sampled, scale = _sample(list(edges), sample_size, generator)
+        sizes = dict.fromkeys(MEMORY_COMPONENTS, 0)
+        for couple in sampled:
+            multiples = edges[couple]
+            sizes['couples'] += sys.getsizeof(couple)
+            sizes['multiples'] += sys.getsizeof(multiples)
+            for identifier, edge_attributes in multiples.items():
+                sizes['edge_identifiers'] += sys.getsizeof(identifier)
+                sizes['attribute_dicts'] += sys.getsizeof(edge_attributes)
+                for key, value in edge_attributes.items():
+                    sizes['attributes'] += sys.getsizeof(key) + _deep_sizeof(value)
+        for component, size in sizes.items():
+            usage[component] += round(size * scale)
+
+        # derived and internal structures
+        for name, value in vars(graph).items():
+            if name.startswith('_Graph__') or not name.startswith('_'):
+                continue
+            component = 'derived' if name in DERIVED_STRUCTURES else 'internal'
+            usage[component] += round(_sampled_sizeof(value, sample_size, generator))
+
+    usage['total'] = sum(usage[component] for component in MEMORY_COMPONENTS)
+    return usage
+
+
+def graph_memory_report(
+        graph, usage: dict[str, int] = None) -> list[dict[str, Any]]:
+    """Returns estimated savings of compact representations, sorted by saving
+    descending
+
+    Representations
+    ---------------
+
+        - counter identifiers: edge identifiers are generated by
+          CounterIdentifierGenerator instead of uuid
+        - CSR adjacency: edges dict, multiples, couples and adjacency are
+          replaced by arrays of offsets and heads and lists of edge
+          identifiers and attribute dicts (as in FlowNetwork and RandomWalker)
+        - columnar attributes: attribute dicts are replaced by one list per
+          attribute name
+    """
+    if usage is None:
+        usage = graph_memory_usage(graph)
+    number_of_nodes = len(graph.nodes)
+    number_of_edges = sum(len(multiples) for multiples in graph.edges.values())
+    number_of_objects = number_of_nodes + number_of_edges
+
+    # number of attribute names (columns) in sampled attribute dicts
+    generator = random.Random(0)
+    sampled_nodes, _ = _sample(list(graph.nodes), 1_000, generator)
+    sampled_couples, _ = _sample(list(graph.edges), 1_000, generator)
+    names = {key for identifier in sampled_nodes for key in graph.nodes[identifier]}
+    names.update(
+        key for couple in sampled_couples
+        for attributes in graph.edges[couple].values() for key in attributes)
+
+    counter_identifier = sys.getsizeof(str(max(number_of_edges - 1, 0)))
+    csr = (number_of_nodes + 1 + 3 * number_of_edges) * POINTER_SIZE
+    columns = len(names) * number_of_objects * POINTER_SIZE
+
+    suggestions = [
+        ('counter identifiers',
+            usage['edge_identifiers'] - number_of_edges * counter_identifier),
+        ('CSR adjacency',
+            usage['edges_dict'] + usage['multiples'] + usage['couples']
+            + usage['derived'] - csr),
+        ('columnar attributes', usage['attribute_dicts'] - columns),
+    ]
+    total = usage['total'] or 1
+    report = [
+        {'representation': representation, 'saving': max(saving, 0),
+         'share': max(saving, 0) / total}
+        for representation, saving in suggestions]
+    return sorted(report, key=lambda row: row['saving'], reverse=True)
@@ -0,0 +1,374 @@
+"""SharedGraph implementation"""
+
+import sys
+import json
+from array import array
+from numbers import Real
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator
+from connectionz.core.identifier import Identifier
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    NodeIsNotExistsException)
+
+
+ALIGNMENT = 8
+
+HEADER_SIZE = 8
+
+
+def _aligned(size: int) -> int:
+    """Returns size rounded up to alignment"""
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _numeric_attributes(attribute_dicts: Iterable[dict]) -> list[str]:
+    """Returns names of attributes with only int and float values"""
+    numeric = {}
+    for attributes in attribute_dicts:
+        for key, value in attributes.items():
+            is_numeric = isinstance(value, Real) and not isinstance(value, bool)
+            numeric[key] = numeric.get(key, True) and is_numeric
+    return sorted(key for key, is_numeric in numeric.items() if is_numeric)
+
+
+def _column(attribute_dicts: Iterable[dict], attribute: str) -> array:
+    """Returns float column of attribute (NaN if attribute is missing)"""
+    nan = float('nan')
+    return array('d', (
+        float(attributes.get(attribute, nan)) for attributes in attribute_dicts))
+
+
+def _strings(strings: Iterable[str]) -> tuple[bytes, array]:
+    """Returns UTF-8 data and offsets of strings"""
+    encoded = [string.encode() for string in strings]
+    offsets = array('q', [0])
+    total = 0
+    for data in encoded:
+        total += len(data)
+        offsets.append(total)
+    return b''.join(encoded), offsets
+
+
+def _csr(number_of_nodes: int, arcs: Iterable[tuple[int, int, int]]) -> tuple[array, array, array]:
+    """Returns offsets, heads and couples of arcs (tail, head, couple) in CSR
+    layout"""
+    adjacency = [[] for _ in range(number_of_nodes)]
+    for tail, head, couple in arcs:
+        adjacency[tail].append((head, couple))
+    offsets = array('q', [0])
+    heads = array('q')
+    couples = array('q')
+    for node_arcs in adjacency:
+        for head, couple in node_arcs:
+            heads.append(head)
+            couples.append(couple)
+        offsets.append(len(heads))
+    return offsets, heads, couples
+
+
+def _attach_block(name: str) -> SharedMemory:
+    """Attaches to shared memory block without registering it in resource
+    tracker of current process (block is unlinked only by its owner)"""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    block = SharedMemory(name=name)
+    # resource tracker registers private name of block (with leading slash)
+    resource_tracker.unregister(block._name, 'shared_memory')  # pylint: disable=protected-access
+    return block
+
+
+class SharedGraph:
+
+    """Read-only structure of DirectedGraph or UndirectedGraph in
+    `multiprocessing.shared_memory` block
+
+    Shared graph representation
+    ---------------------------
+
+    Every node is mapped to an integer index (position in nodes of graph),
+    every couple and edge - to position in edges of graph. Block contains
+    header (JSON with graph type, attribute names and sections) and sections:
+        - node_identifiers, edge_identifiers: UTF-8 data of identifiers with
+          offsets (node_identifier_offsets, edge_identifier_offsets)
+        - couples: node indexes of couples (node_l, node_r, ...)
+        - couple_edges: start of couple edges in edges (CSR offsets)
+        - degree: degree of nodes
+        - offsets, heads, arc_couples: outgoing arcs in CSR layout (head node
+          index and couple index of each arc), in UndirectedGraph each
+          couple gives arcs in both directions
+        - in_offsets, in_heads, in_arc_couples: incoming arcs in CSR layout
+          (DirectedGraph only)
+        - node:<attribute>, edge:<attribute>: float columns of numeric
+          attributes (NaN if attribute is missing)
+
+    Sections are exposed as read-only memoryviews over block without copying
+    (`array`, `node_attribute`, `edge_attribute`), so any number of worker
+    processes attach to one copy of graph structure.
+
+    Lifecycle
+    ---------
+
+    Owner creates block by `create` (or Graph `to_shared_memory`) and
+    removes it by `unlink` after workers are finished. Workers attach by
+    `attach` (or receive pickled SharedGraph, which is pickled as block name)
+    and detach by `close`. Memoryviews returned by shared graph must not be
+    used after `close`.
+    """
+
+    def __init__(self, block: SharedMemory, owner: bool):
+        self._block = block
+        self.owner = owner
+        header_length = int.from_bytes(block.buf[:HEADER_SIZE], 'little')
+        header = json.loads(bytes(block.buf[HEADER_SIZE:HEADER_SIZE + header_length]))
+        self.graph_type = header['graph_type']
+        self.node_attributes = header['node_attributes']
+        self.edge_attributes = header['edge_attributes']
+        self._sections = header['sections']
+        self._start = _aligned(HEADER_SIZE + header_length)
+        self._views = {}
+        self._index = None
+
+    @classmethod
+    def create(
+            cls, graph, node_attributes: Iterable[str] = None,
+            edge_attributes: Iterable[str] = None, name: str = None) -> 'SharedGraph':
+        """Creates shared memory block with graph structure
+
+        Parameters
+        ----------
+        graph
+            DirectedGraph or UndirectedGraph object
+        node_attributes, optional
+            Node attributes stored as float columns (None - all attributes
+            with only int and float values)
+        edge_attributes, optional
+            Edge attributes stored as float columns (None - all attributes
+            with only int and float values)
+        name, optional
+            Name of shared memory block (None - generated name)
+
+        Returns
+        -------
+            Shared graph owning the block
+        """
+        nodes = graph.nodes
+        index = {node: position for position, node in enumerate(nodes)}
+        edge_identifiers = [
+            identifier for multiples in graph.edges.values() for identifier in multiples]
+        edge_attribute_dicts = [
+            attributes for multiples in graph.edges.values()
+            for attributes in multiples.values()]
+        if node_attributes is None:
+            node_attributes = _numeric_attributes(nodes.values())
+        if edge_attributes is None:
+            edge_attributes = _numeric_attributes(edge_attribute_dicts)
+
+        sections = {}
+        sections['node_identifiers'], sections['node_identifier_offsets'] = _strings(nodes)
+        sections['edge_identifiers'], sections['edge_identifier_offsets'] = \
+            _strings(edge_identifiers)
+
+        couples = array('q')
+        couple_edges = array('q', [0])
+        degree = array('q', bytes(8 * len(nodes)))
+        for (node_l, node_r), multiples in graph.edges.items():
+            couples.append(index[node_l])
+            couples.append(index[node_r])
+            couple_edges.append(couple_edges[-1] + len(multiples))
+            degree[index[node_l]] += len(multiples)
+            degree[index[node_r]] += len(multiples)
+        sections['couples'] = couples
+        sections['couple_edges'] = couple_edges
+        sections['degree'] = degree
+
+        number_of_couples = len(couple_edges) - 1
+        out_arcs = [
+            (couples[2 * couple], couples[2 * couple + 1], couple)
+            for couple in range(number_of_couples)]
+        if graph.check_is_directed():
+            in_arcs = [(head, tail, couple) for tail, head, couple in out_arcs]
+            sections['in_offsets'], sections['in_heads'], sections['in_arc_couples'] = \
+                _csr(len(nodes), in_arcs)
+        else:
+            out_arcs += [
+                (head, tail, couple) for tail, head, couple in out_arcs if tail != head]
+        sections['offsets'], sections['heads'], sections['arc_couples'] = \
+            _csr(len(nodes), out_arcs)
+
+        for attribute in node_attributes:
+            sections[f'node:{attribute}'] = _column(nodes.values(), attribute)
+        for attribute in edge_attributes:
+            sections[f'edge:{attribute}'] = _column(edge_attribute_dicts, attribute)
+
+        # layout: header length, header, aligned sections (offsets of
+        # sections are relative to the first aligned byte after header)
+        layout = {}
+        size = 0
+        for section, data in sections.items():
+            data = memoryview(data)
+            layout[section] = [data.format, size, data.nbytes]
+            size += _aligned(data.nbytes)
+        header_data = json.dumps({
+            'graph_type': graph.check_type(),
+            'node_attributes': list(node_attributes),
+            'edge_attributes': list(edge_attributes),
+            'sections': layout}).encode()
+        start = _aligned(HEADER_SIZE + len(header_data))
+
+        block = SharedMemory(name=name, create=True, size=start + size)
+        buffer = block.buf
+        buffer[:HEADER_SIZE] = len(header_data).to_bytes(HEADER_SIZE, 'little')
+        buffer[HEADER_SIZE:HEADER_SIZE + len(header_data)] = header_data
+        for section, data in sections.items():
+            _, offset, nbytes = layout[section]
+            buffer[start + offset:start + offset + nbytes] = memoryview(data).cast('B')
+        del buffer
+
+        return cls(block, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedGraph':
+        """Attaches to shared memory block created by `create`"""
+        return cls(_attach_block(name), owner=False)
+
+    def __reduce__(self):
+        return (SharedGraph.attach, (self.name,))
+
+    def __repr__(self):
+        return (
+            f'Shared {self.graph_type} with {self.number_of_nodes} nodes, '
+            f'{self.number_of_couples} couples and {self.number_of_edges} edges')
+
+    def __len__(self):
+        """Returns the number of nodes in the graph"""
+        return self.number_of_nodes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        """Name of shared memory block"""
+        return self._block.name
+
+    def array(self, section: str) -> memoryview:
+        """Returns section of block as read-only memoryview without copying"""
+        view = self._views.get(section)
+        if view is None:
+            typecode, offset, size = self._sections[section]
+            offset += self._start
+            view = self._block.buf[offset:offset + size].toreadonly().cast(typecode)
+            self._views[section] = view
+        return view
+
+    @property
+    def number_of_nodes(self) -> int:
+        """The number of nodes"""
+        return len(self.array('node_identifier_offsets')) - 1
+
+    @property
+    def number_of_couples(self) -> int:
+        """The number of couples"""
+        return len(self.array('couple_edges')) - 1
+
+    @property
+    def number_of_edges(self) -> int:
+        """The number of edges"""
+        return len(self.array('edge_identifier_offsets')) - 1
+
+    def check_is_directed(self) -> bool:
+        """Checks that graph is directed"""
+        return self.graph_type == 'DirectedGraph'
+
+    def node_identifier(self, index: int) -> Identifier:
+        """Returns identifier of node index"""
+        offsets = self.array('node_identifier_offsets')
+        return bytes(self.array('node_identifiers')[offsets[index]:offsets[index + 1]]).decode()
+
+    def node_identifiers(self) -> Iterator[Identifier]:
+        """Generates node identifiers by node index"""
+        for index in range(self.number_of_nodes):
+            yield self.node_identifier(index)
+
+    def node_index(self, identifier: Identifier) -> int:
+        """Returns index of node, raise NodeIsNotExistsException if node not
+        exists (index of identifiers is built on the first call)"""
+        if self._index is None:
+            self._index = {
+                node: position for position, node in enumerate(self.node_identifiers())}
+        if identifier not in self._index:
+            raise NodeIsNotExistsException()
+        return self._index[identifier]
+
+    def edge_identifier(self, index: int) -> Identifier:
+        """Returns identifier of edge index"""
+        offsets = self.array('edge_identifier_offsets')
+        return bytes(self.array('edge_identifiers')[offsets[index]:offsets[index + 1]]).decode()
+
+    def couple(self, index: int) -> tuple[Identifier, Identifier]:
+        """Returns couple of node identifiers of couple index"""
+        couples = self.array('couples')
+        return (
+            self.node_identifier(couples[2 * index]),
+            self.node_identifier(couples[2 * index + 1]))
+
+    def couple_edges(self, index: int) -> range:
+        """Returns edge indexes of couple index"""
+        couple_edges = self.array('couple_edges')
+        return range(couple_edges[index], couple_edges[index + 1])
+
+    def degree(self, identifier: Identifier) -> int:
+        """Returns degree of node"""
+        return self.array('degree')[self.node_index(identifier)]
+
+    def successors(self, identifier: Identifier) -> list[Identifier]:
+        """Returns nodes to which arcs from node are directed (neighbors of
+        node in UndirectedGraph)"""
+        offsets = self.array('offsets')
+        heads = self.array('heads')
+        node = self.node_index(identifier)
+        return [
+            self.node_identifier(heads[arc])
+            for arc in range(offsets[node], offsets[node + 1])]
+
+    def predecessors(self, identifier: Identifier) -> list[Identifier]:
+        """Returns nodes from which arcs to node are directed (neighbors of
+        node in UndirectedGraph)"""
+        if not self.check_is_directed():
+            return self.successors(identifier)
+        offsets = self.array('in_offsets')
+        heads = self.array('in_heads')
+        node = self.node_index(identifier)
+        return [
+            self.node_identifier(heads[arc])
+            for arc in range(offsets[node], offsets[node + 1])]
+
+    def neighbors(self, identifier: Identifier) -> list[Identifier]:
+        """Returns neighbors of node (successors in DirectedGraph, see Graph
+        `neighbors`)"""
+        return self.successors(identifier)
+
+    def node_attribute(self, attribute: str) -> memoryview:
+        """Returns float column of node attribute by node index"""
+        return self.array(f'node:{attribute}')
+
+    def edge_attribute(self, attribute: str) -> memoryview:
+        """Returns float column of edge attribute by edge index"""
+        return self.array(f'edge:{attribute}')
+
+    def close(self) -> None:
+        """Releases memoryviews and detaches from block"""
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        self._block.close()
+
+    def unlink(self) -> None:
+        """Removes block (owner only, after all processes are detached)"""
+        self._block.unlink()
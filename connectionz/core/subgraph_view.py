@@ -0,0 +1,256 @@
+"""SubgraphView implementation"""
+
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator
+from collections.abc import Mapping
+from connectionz.core.identifier import Identifier
+from connectionz.exceptions.validation_exceptions import (
+    WrongTypeOfNodeIdentifierException,
+    WrongTypeOfEdgeIdentifierException)
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    NodeIsNotExistsException)
+
+
+class _ViewNodes(Mapping):
+    """Read-only nodes of subgraph view"""
+
+    def __init__(self, view):
+        self._view = view
+
+    def __getitem__(self, identifier):
+        if not self._view._contains_node(identifier):
+            raise KeyError(identifier)
+        return MappingProxyType(self._view.graph.nodes[identifier])
+
+    def __contains__(self, identifier):
+        return self._view._contains_node(identifier)
+
+    def __iter__(self):
+        return self._view._iter_nodes()
+
+    def __len__(self):
+        return sum(1 for _ in self._view._iter_nodes())
+
+
+class _ViewMultiples(Mapping):
+    """Read-only multiples of couple in subgraph view"""
+
+    def __init__(self, view, couple, multiples):
+        self._view = view
+        self._couple = couple
+        self._multiples = multiples
+
+    def __getitem__(self, identifier):
+        attributes = self._multiples[identifier]
+        if not self._view._contains_edge(self._couple, identifier, attributes):
+            raise KeyError(identifier)
+        return MappingProxyType(attributes)
+
+    def __iter__(self):
+        for identifier, attributes in self._multiples.items():
+            if self._view._contains_edge(self._couple, identifier, attributes):
+                yield identifier
+
+    def __len__(self):
+        if self._view._edge_filter is None:
+            return len(self._multiples)
+        return sum(1 for _ in self)
+
+
+class _ViewEdges(Mapping):
+    """Read-only edges of subgraph view"""
+
+    def __init__(self, view):
+        self._view = view
+
+    def __getitem__(self, couple):
+        multiples = self._view._multiples(couple)
+        if multiples is None:
+            raise KeyError(couple)
+        return multiples
+
+    def __contains__(self, couple):
+        return self._view._multiples(couple) is not None
+
+    def __iter__(self):
+        for couple, _ in self._view._iter_couples():
+            yield couple
+
+    def __len__(self):
+        return sum(1 for _ in self._view._iter_couples())
+
+
+class SubgraphView:
+
+    """Read-only subgraph view
+
+    View references storage of parent graph without copying. Nodes and edges
+    of view are mappings over parent nodes and edges, filtered by:
+        - selected nodes (node-induced view)
+        - node filter - function (identifier, attributes) -> bool
+        - edge filter - function (node_l, node_r, identifier, attributes) -> bool
+
+    Edge is in view if both incident nodes are in view and it satisfies edge
+    filter. Attribute dicts are exposed as read-only mappings.
+
+    View follows parent mutations. Degree and neighbors are calculated lazily
+    on the first request and recalculated only after parent mutation. Use
+    `copy` to materialize view as independent graph.
+    """
+
+    def __init__(
+            self, graph, selected_nodes: Iterable[Identifier] = None,
+            node_filter: Callable[[Identifier, dict], bool] = None,
+            edge_filter: Callable[[Identifier, Identifier, Identifier, dict], bool] = None):
+        self.graph = graph
+        self._selected = None if selected_nodes is None else frozenset(selected_nodes)
+        self._node_filter = node_filter
+        self._edge_filter = edge_filter
+        self._calculated = None
+        self._calculated_version = None
+
+    def __repr__(self):
+        number_of_edges = sum(len(multiples) for _, multiples in self._iter_couples())
+        return (
+            f'{self.graph.check_type()} view with {len(self.nodes)} nodes, '
+            f'{len(self.edges)} couples and {number_of_edges} edges')
+
+    def __len__(self):
+        """Returns the number of nodes in the view"""
+        return len(self.nodes)
+
+    @property
+    def nodes(self) -> Mapping:
+        """Nodes getter"""
+        return _ViewNodes(self)
+
+    @property
+    def edges(self) -> Mapping:
+        """Edges getter"""
+        return _ViewEdges(self)
+
+    def _contains_node(self, identifier: Identifier) -> bool:
+        """Checks that node is in view"""
+        if self._selected is not None and identifier not in self._selected:
+            return False
+        attributes = self.graph.nodes.get(identifier)
+        if attributes is None:
+            return False
+        return self._node_filter is None or self._node_filter(identifier, attributes)
+
+    def _contains_edge(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> bool:
+        """Checks that edge of couple in view satisfies edge filter"""
+        return self._edge_filter is None or \
+            self._edge_filter(couple[0], couple[1], identifier, attributes)
+
+    def _iter_nodes(self) -> Iterator[Identifier]:
+        """Generates identifiers of nodes in view"""
+        candidates = self.graph.nodes if self._selected is None else self._selected
+        for identifier in candidates:
+            if self._contains_node(identifier):
+                yield identifier
+
+    def _multiples(self, couple: tuple[Identifier, Identifier]) -> Mapping:
+        """Returns filtered multiples of couple or None if couple not in view"""
+        multiples = self.graph.edges.get(couple)
+        if multiples is None or \
+                not (self._contains_node(couple[0]) and self._contains_node(couple[1])):
+            return None
+        view_multiples = _ViewMultiples(self, couple, multiples)
+        if self._edge_filter is None:
+            return view_multiples if multiples else None
+        return view_multiples if len(view_multiples) > 0 else None
+
+    def _candidate_couples(self) -> Iterator[tuple[Identifier, Identifier]]:
+        """Generates couples of parent graph that may be in view, for
+        node-induced view only couples between selected nodes are visited
+        (using neighbors of parent graph)"""
+        graph = self.graph
+        if self._selected is None:
+            yield from graph.edges
+            return
+        for node_l in list(self._iter_nodes()):
+            for node_r in graph.neighbors(node_l):
+                if node_r in self._selected:
+                    couple = graph.couple_representation(node_l, node_r)
+                    if couple == (node_l, node_r):
+                        yield couple
+
+    def _iter_couples(self) -> Iterator[tuple[tuple[Identifier, Identifier], Mapping]]:
+        """Generates couples in view with their filtered multiples"""
+        for couple in self._candidate_couples():
+            multiples = self._multiples(couple)
+            if multiples is not None:
+                yield couple, multiples
+
+    def _calculated_attributes(self) -> tuple[dict, dict]:
+        """Returns degree and neighbors of nodes in view, recalculates them
+        only after parent mutation"""
+        version = self.graph.modification_count
+        if self._calculated is None or self._calculated_version != version:
+            symmetric = not self.graph.check_is_directed()
+            degree = {node: 0 for node in self._iter_nodes()}
+            neighbors = {node: set() for node in degree}
+            for (node_l, node_r), multiples in self._iter_couples():
+                degree[node_l] += len(multiples)
+                degree[node_r] += len(multiples)
+                neighbors[node_l].add(node_r)
+                if symmetric:
+                    neighbors[node_r].add(node_l)
+            self._calculated = (degree, neighbors)
+            self._calculated_version = version
+        return self._calculated
+
+    def has_node(self, identifier: Identifier) -> bool:
+        """Checks that node is in view"""
+        if not isinstance(identifier, Identifier):
+            raise WrongTypeOfNodeIdentifierException()
+        return self._contains_node(identifier)
+
+    def has_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None) -> bool:
+        """Checks that couple and edge is in view"""
+        if not (isinstance(node_l, Identifier) and isinstance(node_r, Identifier)):
+            raise WrongTypeOfNodeIdentifierException()
+        multiples = self._multiples(self.graph.couple_representation(node_l, node_r))
+        if identifier is None:
+            return multiples is not None
+        if not isinstance(identifier, Identifier):
+            raise WrongTypeOfEdgeIdentifierException()
+        return multiples is not None and identifier in multiples
+
+    def degree(self, identifier: Identifier) -> int:
+        """Returns degree of node in view"""
+        degree, _ = self._calculated_attributes()
+        if identifier not in degree:
+            raise NodeIsNotExistsException()
+        return degree[identifier]
+
+    def neighbors(self, identifier: Identifier) -> frozenset[Identifier]:
+        """Returns neighbors of node in view"""
+        _, neighbors = self._calculated_attributes()
+        if identifier not in neighbors:
+            raise NodeIsNotExistsException()
+        return frozenset(neighbors[identifier])
+
+    def check_type(self) -> str:
+        """Checks type of parent graph"""
+        return self.graph.check_type()
+
+    def copy(self):
+        """Returns independent graph with nodes and edges of view"""
+        graph = self.graph
+        subgraph = graph.__class__()
+        for identifier in self._iter_nodes():
+            subgraph.add_node(identifier=identifier, **graph.nodes[identifier])
+        for (node_l, node_r), multiples in self._iter_couples():
+            for identifier in multiples:
+                subgraph.add_edge(
+                    node_l=node_l, node_r=node_r, identifier=identifier,
+                    recalculate_calculated_attributes=False,
+                    **graph.edges[(node_l, node_r)][identifier])
+
+        return subgraph
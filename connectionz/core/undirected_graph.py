@@ -1,11 +1,16 @@
 """UndirectedGraph implementation"""
 
-from connectionz.core.identifier import Identifier
+from types import MappingProxyType
+from typing import Any, KeysView
+from connectionz.core.identifier import Identifier, IdentifierGenerator
 from connectionz.core.nodes import Nodes
 from connectionz.core.edges import Edges
 from connectionz.core.graph import Graph
 
 
+_NO_ADJACENT_NODES = MappingProxyType({})
+
+
 class UndirectedGraph(Graph):
 
     """UndirectedGraph implementation
@@ -42,24 +47,155 @@ class UndirectedGraph(Graph):
                 '239af58': {'amount': 1900, 'date': '2024-04-16'},
             },
         }
+
+    Adjacency representation
+    ------------------------
+
+    Adjacency is built lazily from all edges in one pass on the first lookup
+    and then maintained incrementally on each edge mutation:
+        - degree - a dict with node identifier and the number of incident
+          edges (loop increases degree by 2)
+        - adjacency - a dict with node identifier and a dict with adjacent
+          node identifier and the number of edges between them
+
+    Nodes without incident edges are not stored in adjacency, so lookups
+    (`degree`, `neighbors`) are O(1) once adjacency is built. Degree and
+    neighbors are not stored in node attributes.
+
+    Couple representation
+    ---------------------
+
+    Couple is represented as a sorted tuple. Both orientations of each
+    existing couple are interned, so couple representation is a single dict
+    lookup that returns the same tuple object as the key of edges (and of
+    edge indexes) instead of a new tuple for each call.
     """
 
-    def __init__(self, nodes: Nodes = None, edges: Edges = None):
-        super().__init__(nodes=nodes, edges=edges)
+    _shared_kinds = Graph._shared_kinds + ('adjacency',)
+
+    def __init__(
+            self, nodes: Nodes = None, edges: Edges = None,
+            identifier_generator: IdentifierGenerator = None):
+        self._couples = {}
+        self._degree = {}
+        self._adjacency = {}
+        super().__init__(
+            nodes=nodes, edges=edges, identifier_generator=identifier_generator)
 
     def _couple_representation(
             self, couple: tuple[Identifier, Identifier]
             ) -> tuple[Identifier, Identifier]:
-        """Couple representation for directed graph"""
-        return tuple(sorted(couple))
-
-    def find_neighbors(self):
-        """Finds neighbors for each node in graph"""
-        self.clear_neighbors()
-
-        for (node_l, node_r) in self.edges:
-            self.nodes[node_l]['neighbors'].add(node_r)
-            self.nodes[node_r]['neighbors'].add(node_l)
+        """Couple representation for undirected graph"""
+        interned = self._couples.get(couple)
+        if interned is not None:
+            return interned
+        node_l, node_r = couple
+        if node_r < node_l:
+            return (node_r, node_l)
+        return couple
+
+    def _on_edge_added(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes, interned couples and adjacency after edge is
+        added"""
+        super()._on_edge_added(couple, identifier, attributes)
+        if couple not in self._couples:
+            self._couples[couple] = couple
+            self._couples[(couple[1], couple[0])] = couple
+        if not self._adjacency_is_built:
+            return
+        node_l, node_r = couple
+        for node, adjacent in ((node_l, node_r), (node_r, node_l)):
+            self._degree[node] = self._degree.get(node, 0) + 1
+            adjacent_nodes = self._own_nested(self._adjacency, node, 'adjacency')
+            adjacent_nodes[adjacent] = adjacent_nodes.get(adjacent, 0) + 1
+
+    def _on_edge_removed(
+            self, couple: tuple[Identifier, Identifier],
+            identifier: Identifier, attributes: dict[str, Any]) -> None:
+        """Updates indexes and adjacency before edge is removed"""
+        super()._on_edge_removed(couple, identifier, attributes)
+        if not self._adjacency_is_built:
+            return
+        node_l, node_r = couple
+        for node, adjacent in ((node_l, node_r), (node_r, node_l)):
+            if self._degree[node] == 1:
+                del self._degree[node]
+            else:
+                self._degree[node] -= 1
+            adjacent_nodes = self._own_nested(self._adjacency, node, 'adjacency')
+            if adjacent_nodes[adjacent] == 1:
+                del adjacent_nodes[adjacent]
+                if not adjacent_nodes:
+                    del self._adjacency[node]
+            else:
+                adjacent_nodes[adjacent] -= 1
+
+    def _on_couple_removed(self, couple: tuple[Identifier, Identifier]) -> None:
+        """Removes interned couple after couple is removed"""
+        super()._on_couple_removed(couple)
+        self._couples.pop(couple, None)
+        self._couples.pop((couple[1], couple[0]), None)
+
+    def _on_edges_loaded(self) -> None:
+        """Interns couples of all edges at once after edges are loaded"""
+        super()._on_edges_loaded()
+        for couple, multiples in self.edges.items():
+            if multiples:
+                self._couples[couple] = couple
+                self._couples[(couple[1], couple[0])] = couple
+
+    def _build_adjacency(self) -> None:
+        """Builds adjacency from all edges in one pass"""
+        self._clear_adjacency()
+        degree = self._degree
+        adjacency = self._adjacency
+        for (node_l, node_r), multiples in self.edges.items():
+            if not multiples:
+                continue
+            for node, adjacent in ((node_l, node_r), (node_r, node_l)):
+                degree[node] = degree.get(node, 0) + len(multiples)
+                adjacent_nodes = adjacency.setdefault(node, {})
+                adjacent_nodes[adjacent] = adjacent_nodes.get(adjacent, 0) + len(multiples)
+        if self._owned is not None:
+            self._owned['adjacency'] = set(adjacency)
+
+    def _clear_adjacency(self) -> None:
+        """Replaces adjacency by empty dicts"""
+        self._degree = {}
+        self._adjacency = {}
+
+    def _on_snapshot(self) -> None:
+        """Replaces indexes, interned couples and top-level adjacency shared
+        with source graph by own copies"""
+        super()._on_snapshot()
+        self._couples = dict(self._couples)
+        self._degree = dict(self._degree)
+        self._adjacency = dict(self._adjacency)
+
+    def _on_edges_cleared(self) -> None:
+        """Clears indexes, interned couples and adjacency after all edges are
+        replaced"""
+        super()._on_edges_cleared()
+        self._couples = {}
+
+    def degree(self, identifier: Identifier) -> int:
+        """Returns the number of edges incident to node (O(1), loop increases
+        degree by 2)"""
+        self.ensure_adjacency()
+        return self._degree.get(self._checked_node(identifier), 0)
+
+    def neighbors(self, identifier: Identifier) -> KeysView[Identifier]:
+        """Returns nodes adjacent to node (O(1), live read-only set-like
+        view)"""
+        self.ensure_adjacency()
+        return self._adjacency.get(
+            self._checked_node(identifier), _NO_ADJACENT_NODES).keys()
+
+    def check_is_directed(self) -> bool:
+        """Checks that graph is directed"""
+        return False
 
     def check_is_complete(self):
         """Checks that graph is complete
@@ -0,0 +1,211 @@
+"""VersionedGraph implementation"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Any, Callable, Iterator
+from connectionz.core.identifier import Identifier
+from connectionz.core.subgraph_view import SubgraphView
+from connectionz.exceptions.object_isnot_exists_exceptions import (
+    VersionIsNotExistsException)
+from connectionz.exceptions.versioning_exceptions import (
+    ClockWentBackwardsException)
+
+
+class MonotonicClock:
+
+    """Clock that returns aware UTC datetimes that never decrease: UTC time
+    at creation of clock plus monotonic time elapsed since creation, so
+    changes of system time (DST, NTP corrections) do not affect it"""
+
+    def __init__(self):
+        self.origin = datetime.now(timezone.utc)
+        self.start = monotonic()
+
+    def __call__(self) -> datetime:
+        return self.origin + timedelta(seconds=monotonic() - self.start)
+
+
+class VersionedGraph:
+
+    """Wrapper of DirectedGraph or UndirectedGraph that records mutations
+    with version stamps and answers time-travel queries
+
+    History representation
+    ----------------------
+
+    Each successful mutation (`add_node`, `del_node`, `add_edge`, `del_edge`)
+    creates the next version. History is:
+        - log - a list with mutation that creates each version (operation
+          name, arguments with resolved identifier, attributes)
+        - times - a non-decreasing list with time of each version (version 0
+          is the state of graph when wrapper was created)
+        - checkpoints - copy-on-write snapshots of graph taken every
+          `checkpoint_interval` versions
+
+    `as_of(version)` takes snapshot of the nearest checkpoint before version
+    and replays at most `checkpoint_interval` mutations of log, so historical
+    reads never replay the whole log. Checkpoints share unchanged node
+    attribute dicts and multiples with graph (see Graph `snapshot`).
+
+    Time of version is returned by `clock` (by default `MonotonicClock`).
+    Mutation is rejected with ClockWentBackwardsException before graph is
+    changed if clock returns time before time of the last version.
+
+    Wrapped graph must not be changed directly while wrapper is in use.
+    """
+
+    def __init__(
+            self, graph, checkpoint_interval: int = 1000,
+            clock: Callable[[], Any] = None):
+        self.graph = graph
+        self.checkpoint_interval = checkpoint_interval
+        self.clock = clock if clock is not None else MonotonicClock()
+        self._log: list[tuple[str, tuple, dict[str, Any]]] = []
+        self._times = [self.clock()]
+        self._checkpoint_versions = [0]
+        self._checkpoints = {0: graph.snapshot()}
+
+    def __repr__(self):
+        return f'Versioned {self.graph!r} at version {self.version}'
+
+    def __len__(self):
+        return len(self.graph)
+
+    @property
+    def version(self) -> int:
+        """Current version"""
+        return len(self._log)
+
+    def _moment(self) -> Any:
+        """Returns time for the next version, raise
+        ClockWentBackwardsException if it is before time of the last version"""
+        moment = self.clock()
+        if moment < self._times[-1]:
+            raise ClockWentBackwardsException(moment, self._times[-1])
+        return moment
+
+    def _record(
+            self, moment: Any, name: str, args: tuple,
+            attributes: dict[str, Any]) -> None:
+        """Records mutation as the next version, takes checkpoint every
+        `checkpoint_interval` versions"""
+        self._log.append((name, args, attributes))
+        self._times.append(moment)
+        if self.version % self.checkpoint_interval == 0:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Takes checkpoint of current version"""
+        if self.version not in self._checkpoints:
+            self._checkpoint_versions.append(self.version)
+        self._checkpoints[self.version] = self.graph.snapshot()
+
+    def add_node(
+            self, identifier: Identifier = None, replace: bool = False,
+            **attributes) -> Identifier:
+        """Adds node (see Graph `add_node`) and records new version"""
+        moment = self._moment()
+        identifier = self.graph.add_node(identifier, replace=replace, **attributes)
+        self._record(moment, 'add_node', (identifier, replace), dict(attributes))
+        return identifier
+
+    def del_node(
+            self, identifier: Identifier,
+            recalculate_calculated_attributes: bool = True) -> None:
+        """Removes node (see Graph `del_node`) and records new version"""
+        moment = self._moment()
+        self.graph.del_node(
+            identifier,
+            recalculate_calculated_attributes=recalculate_calculated_attributes)
+        self._record(moment, 'del_node', (identifier,), {})
+
+    def add_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None, replace: bool = False,
+            recalculate_calculated_attributes: bool = True,
+            **attributes) -> Identifier:
+        """Adds edge (see Graph `add_edge`) and records new version"""
+        moment = self._moment()
+        identifier = self.graph.add_edge(
+            node_l, node_r, identifier, replace=replace,
+            recalculate_calculated_attributes=recalculate_calculated_attributes,
+            **attributes)
+        self._record(moment, 'add_edge', (node_l, node_r, identifier, replace), dict(attributes))
+        return identifier
+
+    def del_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None,
+            recalculate_calculated_attributes: bool = True) -> None:
+        """Removes edge (see Graph `del_edge`) and records new version"""
+        moment = self._moment()
+        self.graph.del_edge(
+            node_l, node_r, identifier,
+            recalculate_calculated_attributes=recalculate_calculated_attributes)
+        self._record(moment, 'del_edge', (node_l, node_r, identifier), {})
+
+    def _checked_version(self, version: int) -> int:
+        """Validates version, raise VersionIsNotExistsException if version not
+        exists"""
+        if not isinstance(version, int) or not 0 <= version <= self.version:
+            raise VersionIsNotExistsException()
+        return version
+
+    def version_at(self, moment: Any) -> int:
+        """Returns the latest version created at or before moment, raise
+        VersionIsNotExistsException if moment is before version 0"""
+        return self._checked_version(bisect_right(self._times, moment) - 1)
+
+    def time_of(self, version: int) -> Any:
+        """Returns time of version"""
+        return self._times[self._checked_version(version)]
+
+    def _reconstruct(self, version: int):
+        """Returns independent graph in state of version: snapshot of the
+        nearest checkpoint with replayed log"""
+        start = self._checkpoint_versions[
+            bisect_right(self._checkpoint_versions, version) - 1]
+        graph = self._checkpoints[start].snapshot()
+        if start == version:
+            return graph
+
+        for name, args, attributes in self._log[start:version]:
+            if name == 'add_node':
+                identifier, replace = args
+                graph.add_node(identifier, replace=replace, **attributes)
+            else:
+                getattr(graph, name)(
+                    *args, recalculate_calculated_attributes=False, **attributes)
+
+        return graph
+
+    def as_of(self, version: int) -> SubgraphView:
+        """Returns read-only view of graph in state of version
+
+        Parameters
+        ----------
+        version
+            Version (0 <= version <= current version)
+
+        Returns
+        -------
+            Read-only view (use `copy` to get independent graph)
+        """
+        return SubgraphView(self._reconstruct(self._checked_version(version)))
+
+    def as_of_time(self, moment: Any) -> SubgraphView:
+        """Returns read-only view of graph in state at moment (see `as_of`)"""
+        return self.as_of(self.version_at(moment))
+
+    def history(
+            self, start: int = 0,
+            end: int = None) -> Iterator[tuple[int, Any, str, tuple, dict[str, Any]]]:
+        """Generates tuples (version, time, operation name, arguments,
+        attributes) of mutations that created versions start < version <= end
+        (None - current version)"""
+        start = self._checked_version(start)
+        end = self.version if end is None else self._checked_version(end)
+        for version in range(start + 1, end + 1):
+            name, args, attributes = self._log[version - 1]
+            yield version, self._times[version], name, args, dict(attributes)
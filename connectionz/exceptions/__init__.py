@@ -6,7 +6,10 @@ from . object_already_exists_exceptions import (
 from . object_isnot_exists_exceptions import (
     NodeIsNotExistsException,
     CoupleIsNotExistsException,
-    EdgeIsNotExistsException)
+    EdgeIsNotExistsException,
+    TemporalIndexIsNotExistsException,
+    IndexIsNotExistsException,
+    VersionIsNotExistsException)
 from . cannot_delete_basic_elements_exceptions import (
     CanNotDeleteNodesException,
     CanNotDeleteEdgesException)
@@ -25,3 +28,24 @@ from . validation_exceptions import (
     DuplicationInEdgeIdentifiersException)
 from . wrong_file_extension_exception import (
     WrongFileExtensionException)
+from . index_exceptions import (
+    IndexException,
+    WrongKindOfIndexException,
+    WrongTargetOfIndexException,
+    WrongTypeOfIndexedValueException)
+from . algorithm_exceptions import (
+    AlgorithmException,
+    SourceIsTargetException,
+    WrongAlgorithmParameterException,
+    UnsupportedGraphTypeException)
+from . durability_exceptions import (
+    DurabilityException,
+    CorruptedLogException,
+    DurableGraphIsClosedException)
+from . patch_exceptions import (
+    PatchException,
+    WrongTypeOfGraphInPatchException,
+    PatchConflictException)
+from . versioning_exceptions import (
+    VersioningException,
+    ClockWentBackwardsException)
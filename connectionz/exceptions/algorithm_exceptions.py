@@ -0,0 +1,40 @@
+"""Algorithm exceptions
+
+- AlgorithmException
+    - SourceIsTargetException
+    - WrongAlgorithmParameterException
+    - UnsupportedGraphTypeException
+"""
+
+
+class AlgorithmException(Exception):
+    """Algorithm exception"""
+    def __init__(self, message: str):
+        super().__init__()
+        self._message = f'Algorithm exception! {message}'
+
+    def __str__(self):
+        return self._message
+
+
+class SourceIsTargetException(AlgorithmException):
+    """Source is target exception"""
+    def __init__(self):
+        message = 'Source node and target node must be different nodes!'
+        super().__init__(message=message)
+
+
+class WrongAlgorithmParameterException(AlgorithmException):
+    """Wrong algorithm parameter exception"""
+    def __init__(self, parameter: str, requirement: str):
+        message = f'Wrong value of parameter {parameter}: {requirement}!'
+        super().__init__(message=message)
+
+
+class UnsupportedGraphTypeException(AlgorithmException):
+    """Unsupported graph type exception"""
+    def __init__(self, received: str, required: str):
+        message = (
+            f'Unsupported graph type {received}: algorithm supports only '
+            f'{required}!')
+        super().__init__(message=message)
@@ -0,0 +1,32 @@
+"""Durability exceptions
+
+- DurabilityException
+    - CorruptedLogException
+    - DurableGraphIsClosedException
+"""
+
+
+class DurabilityException(Exception):
+    """Durability exception"""
+    def __init__(self, message: str):
+        super().__init__()
+        self._message = f'Durability exception! {message}'
+
+    def __str__(self):
+        return self._message
+
+
+class CorruptedLogException(DurabilityException):
+    """Corrupted log exception"""
+    def __init__(self, file_path: str, line: int):
+        message = (
+            f'Corrupted record in write-ahead log {file_path} at line {line}: '
+            'only the last record of the last log segment can be incomplete!')
+        super().__init__(message=message)
+
+
+class DurableGraphIsClosedException(DurabilityException):
+    """Durable graph is closed exception"""
+    def __init__(self):
+        message = 'Durable graph is closed!'
+        super().__init__(message=message)
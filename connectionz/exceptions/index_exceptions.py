@@ -0,0 +1,40 @@
+"""Index exceptions
+
+- IndexException
+    - WrongKindOfIndexException
+    - WrongTargetOfIndexException
+    - WrongTypeOfIndexedValueException
+"""
+
+
+class IndexException(Exception):
+    """Index exception"""
+    def __init__(self, message: str):
+        super().__init__()
+        self._message = f'Index exception! {message}'
+
+    def __str__(self):
+        return self._message
+
+
+class WrongKindOfIndexException(IndexException):
+    """Wrong kind of index exception"""
+    def __init__(self):
+        message = 'Wrong kind of index: index kind must be hash or sorted!'
+        super().__init__(message=message)
+
+
+class WrongTargetOfIndexException(IndexException):
+    """Wrong target of index exception"""
+    def __init__(self):
+        message = 'Wrong target of index: index target must be nodes or edges!'
+        super().__init__(message=message)
+
+
+class WrongTypeOfIndexedValueException(IndexException):
+    """Wrong type of indexed value exception"""
+    def __init__(self, attribute: str):
+        message = (
+            f'Wrong type of value of attribute {attribute}: values of sorted '
+            'index must be comparable with each other!')
+        super().__init__(message=message)
@@ -4,6 +4,8 @@
     - NodeIsNotExistsException
     - CoupleIsNotExistsException
     - EdgeIsNotExistsException
+    - TemporalIndexIsNotExistsException
+    - IndexIsNotExistsException
 """
 
 
@@ -34,3 +36,21 @@ class EdgeIsNotExistsException(ObjectIsNotExistsException):
     """Edge is not exists exception"""
     def __init__(self):
         super().__init__('edge')
+
+
+class TemporalIndexIsNotExistsException(ObjectIsNotExistsException):
+    """Temporal index is not exists exception"""
+    def __init__(self):
+        super().__init__('temporal index')
+
+
+class IndexIsNotExistsException(ObjectIsNotExistsException):
+    """Index is not exists exception"""
+    def __init__(self):
+        super().__init__('index')
+
+
+class VersionIsNotExistsException(ObjectIsNotExistsException):
+    """Version is not exists exception"""
+    def __init__(self):
+        super().__init__('version')
@@ -0,0 +1,32 @@
+"""Patch exceptions
+
+- PatchException
+    - WrongTypeOfGraphInPatchException
+    - PatchConflictException
+"""
+
+
+class PatchException(Exception):
+    """Patch exception"""
+    def __init__(self, message: str):
+        super().__init__()
+        self._message = f'Patch exception! {message}'
+
+    def __str__(self):
+        return self._message
+
+
+class WrongTypeOfGraphInPatchException(PatchException):
+    """Wrong type of graph in patch exception"""
+    def __init__(self, received: str, required: str):
+        message = (
+            f'Wrong graph type {received}: patch can be created from and '
+            f'applied to {required} only!')
+        super().__init__(message=message)
+
+
+class PatchConflictException(PatchException):
+    """Patch conflict exception"""
+    def __init__(self, conflict: str):
+        message = f'Patch does not match graph: {conflict}!'
+        super().__init__(message=message)
@@ -0,0 +1,24 @@
+"""Versioning exceptions
+
+- VersioningException
+    - ClockWentBackwardsException
+"""
+
+
+class VersioningException(Exception):
+    """Versioning exception"""
+    def __init__(self, message: str):
+        super().__init__()
+        self._message = f'Versioning exception! {message}'
+
+    def __str__(self):
+        return self._message
+
+
+class ClockWentBackwardsException(VersioningException):
+    """Clock went backwards exception"""
+    def __init__(self, moment, last):
+        message = (
+            f'Clock returned {moment} before time of the last version {last}: '
+            'time of versions must not decrease!')
+        super().__init__(message=message)
@@ -1,4 +1,10 @@
 """Tools init"""
 
-from . export_graph_to_json import export_graph_to_json
-from . import_graph_from_json import import_graph_from_json
+from . export_graph_to_json import export_graph_to_json, export_graph_to_json_async
+from . import_graph_from_json import import_graph_from_json, import_graph_from_json_async
+from . async_edge_batcher import AsyncEdgeBatcher
+from . durable_graph import DurableGraph
+from . instrumentation import (
+    Sink, StatsSink, LoggingSink, SpanSink,
+    enable_instrumentation, disable_instrumentation, instrumentation,
+    check_instrumentation_is_enabled)
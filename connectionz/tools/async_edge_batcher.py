@@ -0,0 +1,74 @@
+"""AsyncEdgeBatcher implementation"""
+
+import asyncio
+from typing import Any
+from connectionz.core.identifier import Identifier
+
+
+class AsyncEdgeBatcher:
+
+    """Coalesces concurrent `add_edge` requests of asyncio tasks into bulk
+    inserts
+
+    Requests are collected into batch, batch is inserted when it reaches
+    `max_batch_size` requests or `max_delay` seconds after its first request.
+    Edges of batch are added in one pass of event loop, so batch of N edges
+    costs one wakeup of inserting task instead of N. Edges are added without
+    recalculation of degree and adjacency, they are rebuilt in one pass on
+    the next lookup (see Graph `add_edge`).
+
+    Batch is inserted in event loop thread, graph must be changed only from
+    event loop thread.
+    """
+
+    def __init__(self, graph, max_batch_size: int = 1000, max_delay: float = 0.001):
+        self.graph = graph
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: list[tuple[tuple, dict[str, Any], asyncio.Future]] = []
+        self._handle = None
+
+    def __len__(self):
+        """Returns the number of pending requests"""
+        return len(self._pending)
+
+    async def add_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None, replace: bool = False,
+            **attributes) -> Identifier:
+        """Adds edge with the next batch (see Graph `add_edge`), returns edge
+        identifier after batch is inserted, raise exception of `add_edge` if
+        edge is not added"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((node_l, node_r, identifier, replace), attributes, future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.max_delay, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Inserts pending requests now (requests of cancelled tasks are
+        skipped)"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        graph = self.graph
+        for (node_l, node_r, identifier, replace), attributes, future in pending:
+            if future.cancelled():
+                continue
+            try:
+                identifier = graph.add_edge(
+                    node_l, node_r, identifier, replace=replace,
+                    recalculate_calculated_attributes=False, **attributes)
+            # any exception of add_edge belongs to the awaiting task and must
+            # not stop insertion of the rest of batch
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                future.set_exception(error)
+            else:
+                future.set_result(identifier)
@@ -0,0 +1,343 @@
+"""Durable graph with write-ahead log and atomic checkpoints
+
+Directory of durable graph contains:
+    - checkpoint.json: graph in JSON export format with sequence number of
+      the last mutation included into checkpoint, replaced atomically
+      (write to temporary file, fsync, rename)
+    - wal-<sequence>.log: segments of append-only write-ahead log, each
+      segment starts with mutation <sequence>
+
+Write-ahead log record is a line `<crc32> <json>`, where json is a list
+[sequence, operation name, arguments, attributes]. Records are buffered and
+written with one fsync per group (group commit): when buffer reaches
+`group_size` records, every `sync_interval` seconds in background thread and
+on `sync`, `checkpoint` and `close`. Concurrent `sync` calls wait for one
+fsync instead of doing their own.
+
+Recovery loads checkpoint and replays records of log segments with sequence
+greater than sequence of checkpoint. Incomplete last record of the last
+segment (crash in the middle of write) is truncated.
+"""
+
+import os
+import json
+import zlib
+from threading import Event, Lock, Thread
+from typing import Any, Iterator
+from connectionz.core.identifier import Identifier
+from connectionz.core.directed_graph import DirectedGraph
+from connectionz.tools.export_graph_to_json import (
+    _convert_attributes_for_json, _graph_to_json_data, _dump_json_atomically)
+from connectionz.tools.import_graph_from_json import _graph_from_json_data
+from connectionz.exceptions.durability_exceptions import (
+    CorruptedLogException,
+    DurableGraphIsClosedException)
+
+
+CHECKPOINT_FILE = 'checkpoint.json'
+
+
+def _encode_attributes(attributes: dict[str, Any]) -> str:
+    """Returns JSON of attributes for record of write-ahead log, raise
+    TypeError if attributes are not serializable"""
+    return json.dumps(_convert_attributes_for_json(attributes), separators=(',', ':'))
+
+
+def _encode_record(sequence: int, name: str, args: tuple, attributes: str) -> str:
+    """Returns line of write-ahead log with encoded attributes (see
+    `_encode_attributes`)"""
+    args = json.dumps(args, separators=(',', ':'))
+    payload = f'[{sequence},{json.dumps(name)},{args},{attributes}]'
+    return f'{zlib.crc32(payload.encode()):08x} {payload}\n'
+
+
+def _decode_record(line: str) -> list:
+    """Returns [sequence, operation name, arguments, attributes] or None if
+    record is incomplete or corrupted"""
+    if not line.endswith('\n') or len(line) < 10 or line[8] != ' ':
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload.encode()):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+class DurableGraph:
+
+    """Wrapper of DirectedGraph or UndirectedGraph that persists mutations
+    (`add_node`, `del_node`, `add_edge`, `del_edge`) to write-ahead log in
+    directory and recovers graph from directory on creation
+
+    Attributes of mutation are encoded before it is applied to graph (mutation
+    with attributes that can not be logged is rejected with TypeError and graph
+    is not changed), mutation is appended to log after it is applied to graph
+    (failed mutation is not logged) and is durable after the next group commit: at most
+    `group_size` records or `sync_interval` seconds of mutations can be lost
+    on crash, use `sync` to wait until all mutations are durable. Checkpoint
+    is taken every `checkpoint_interval` mutations from copy-on-write
+    snapshot of graph, so writes are blocked only while snapshot is taken.
+
+    Attributes are stored as in `export_graph_to_json` (sets and tuples as
+    lists, dates as str). Wrapped graph must not be changed directly.
+    """
+
+    def __init__(
+            self, directory: str, graph_class: type = DirectedGraph,
+            group_size: int = 1000, sync_interval: float = 0.05,
+            checkpoint_interval: int = 100_000):
+        self.directory = directory
+        self.group_size = group_size
+        self.sync_interval = sync_interval
+        self.checkpoint_interval = checkpoint_interval
+        self._lock = Lock()
+        self._commit_lock = Lock()
+        self._checkpoint_lock = Lock()
+        self._buffer: list[str] = []
+        self._closed = False
+
+        os.makedirs(directory, exist_ok=True)
+        self.graph, self._checkpoint_sequence, self._sequence = self._recover(graph_class)
+        self._synced_sequence = self._sequence
+        self._file = self._open_segment(self._sequence + 1)
+
+        self._stop = Event()
+        self._flusher = None
+        if sync_interval:
+            self._flusher = Thread(target=self._flush_periodically, daemon=True)
+            self._flusher.start()
+
+    def __repr__(self):
+        return f'Durable {self.graph!r}'
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last mutation"""
+        return self._sequence
+
+    def _segments(self) -> list[tuple[int, str]]:
+        """Returns sorted tuples (start sequence, path) of log segments"""
+        segments = []
+        for name in os.listdir(self.directory):
+            if name.startswith('wal-') and name.endswith('.log'):
+                segments.append((int(name[4:-4]), os.path.join(self.directory, name)))
+        return sorted(segments)
+
+    def _read_segment(self, path: str, is_last: bool) -> Iterator[list]:
+        """Generates records of segment, truncates incomplete last record of
+        the last segment"""
+        offset = 0
+        with open(path, 'r', encoding='utf-8', newline='\n') as file:
+            for number, line in enumerate(file, start=1):
+                record = _decode_record(line)
+                if record is None:
+                    if not is_last or file.read(1):
+                        raise CorruptedLogException(path, number)
+                    break
+                offset += len(line.encode())
+                yield record
+        if offset != os.path.getsize(path):
+            os.truncate(path, offset)
+
+    def _recover(self, graph_class: type):
+        """Returns graph loaded from checkpoint with replayed log, sequence of
+        checkpoint and sequence of the last mutation"""
+        checkpoint_path = os.path.join(self.directory, CHECKPOINT_FILE)
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            graph = _graph_from_json_data(data)
+            checkpoint_sequence = data['sequence']
+        else:
+            graph = graph_class()
+            checkpoint_sequence = 0
+
+        sequence = checkpoint_sequence
+        segments = self._segments()
+        for position, (_, path) in enumerate(segments):
+            is_last = position == len(segments) - 1
+            for record_sequence, name, args, attributes in self._read_segment(path, is_last):
+                if record_sequence <= sequence:
+                    continue
+                if name == 'add_node':
+                    identifier, replace = args
+                    graph.add_node(identifier, replace=replace, **attributes)
+                else:
+                    getattr(graph, name)(
+                        *args, recalculate_calculated_attributes=False, **attributes)
+                sequence = record_sequence
+
+        return graph, checkpoint_sequence, sequence
+
+    def _open_segment(self, start: int):
+        """Opens log segment that starts with mutation start"""
+        path = os.path.join(self.directory, f'wal-{start:020d}.log')
+        return open(path, 'a', encoding='utf-8', newline='\n')
+
+    def _append(self, name: str, args: tuple, attributes: str) -> int:
+        """Appends record of applied mutation with encoded attributes to
+        buffer (under lock), returns its sequence"""
+        self._sequence += 1
+        self._buffer.append(_encode_record(self._sequence, name, args, attributes))
+        return self._sequence
+
+    def _after_write(self, sequence: int) -> None:
+        """Commits full group and takes scheduled checkpoint"""
+        if len(self._buffer) >= self.group_size:
+            self._commit(sequence)
+        if sequence - self._checkpoint_sequence >= self.checkpoint_interval:
+            with self._checkpoint_lock:
+                # another writer may have taken checkpoint while waiting
+                if sequence - self._checkpoint_sequence < self.checkpoint_interval:
+                    return
+                try:
+                    self._write_checkpoint()
+                except DurableGraphIsClosedException:
+                    # mutation is synced by `close`
+                    pass
+
+    def _commit(self, sequence: int) -> None:
+        """Writes buffered records and syncs log, unless another thread has
+        already synced record with sequence (group commit)"""
+        with self._commit_lock:
+            if self._synced_sequence >= sequence:
+                return
+            with self._lock:
+                lines = self._buffer
+                self._buffer = []
+                last = self._sequence
+            self._file.write(''.join(lines))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._synced_sequence = last
+
+    def _flush_periodically(self) -> None:
+        """Commits buffered records every sync interval"""
+        while not self._stop.wait(self.sync_interval):
+            if self._buffer:
+                self._commit(self._sequence)
+
+    def _checked_open(self) -> None:
+        """Raise DurableGraphIsClosedException if graph is closed"""
+        if self._closed:
+            raise DurableGraphIsClosedException()
+
+    def add_node(
+            self, identifier: Identifier = None, replace: bool = False,
+            **attributes) -> Identifier:
+        """Adds node (see Graph `add_node`) and logs it"""
+        with self._lock:
+            self._checked_open()
+            encoded = _encode_attributes(attributes)
+            identifier = self.graph.add_node(identifier, replace=replace, **attributes)
+            sequence = self._append('add_node', (identifier, replace), encoded)
+        self._after_write(sequence)
+        return identifier
+
+    def del_node(
+            self, identifier: Identifier,
+            recalculate_calculated_attributes: bool = True) -> None:
+        """Removes node (see Graph `del_node`) and logs it"""
+        with self._lock:
+            self._checked_open()
+            self.graph.del_node(
+                identifier,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
+            sequence = self._append('del_node', (identifier,), '{}')
+        self._after_write(sequence)
+
+    def add_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None, replace: bool = False,
+            recalculate_calculated_attributes: bool = True,
+            **attributes) -> Identifier:
+        """Adds edge (see Graph `add_edge`) and logs it"""
+        with self._lock:
+            self._checked_open()
+            encoded = _encode_attributes(attributes)
+            identifier = self.graph.add_edge(
+                node_l, node_r, identifier, replace=replace,
+                recalculate_calculated_attributes=recalculate_calculated_attributes,
+                **attributes)
+            sequence = self._append(
+                'add_edge', (node_l, node_r, identifier, replace), encoded)
+        self._after_write(sequence)
+        return identifier
+
+    def del_edge(
+            self, node_l: Identifier, node_r: Identifier,
+            identifier: Identifier = None,
+            recalculate_calculated_attributes: bool = True) -> None:
+        """Removes edge (see Graph `del_edge`) and logs it"""
+        with self._lock:
+            self._checked_open()
+            self.graph.del_edge(
+                node_l, node_r, identifier,
+                recalculate_calculated_attributes=recalculate_calculated_attributes)
+            sequence = self._append('del_edge', (node_l, node_r, identifier), '{}')
+        self._after_write(sequence)
+
+    def sync(self) -> None:
+        """Waits until all logged mutations are durable"""
+        self._commit(self._sequence)
+
+    def checkpoint(self) -> None:
+        """Writes checkpoint atomically and removes log segments included into
+        checkpoint
+
+        Log is synced and new segment is started while writes are blocked,
+        checkpoint is written from copy-on-write snapshot after writes are
+        unblocked.
+        """
+        with self._checkpoint_lock:
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        """Writes checkpoint (under checkpoint lock, see `checkpoint`)"""
+        with self._commit_lock:
+            with self._lock:
+                self._checked_open()
+                lines = self._buffer
+                self._buffer = []
+                sequence = self._sequence
+                snapshot = self.graph.snapshot()
+                self._file.write(''.join(lines))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = self._open_segment(sequence + 1)
+                self._synced_sequence = sequence
+                self._checkpoint_sequence = sequence
+
+        data = _graph_to_json_data(snapshot)
+        data['sequence'] = sequence
+        _dump_json_atomically(data, os.path.join(self.directory, CHECKPOINT_FILE))
+
+        for start, path in self._segments():
+            if start <= sequence:
+                os.remove(path)
+
+    def close(self) -> None:
+        """Blocks writes, syncs log, stops background sync and closes log"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.sync()
+        with self._commit_lock:
+            with self._lock:
+                self._file.close()
@@ -1,7 +1,10 @@
 """Functions for export graph to JSON"""
 
+import os
 import uuid
 import json
+import asyncio
+from concurrent.futures import Executor
 from datetime import date, datetime
 from connectionz.core.nodes import Nodes
 from connectionz.core.edges import Edges
@@ -10,37 +13,107 @@ from connectionz.exceptions.wrong_file_extension_exception import (
     WrongFileExtensionException)
 
 
+# version of JSON format: files without version are written by versions that
+# stored degree and neighbors in node attributes
+FORMAT_VERSION = 2
+
+
+def _convert_attributes_for_json(attributes: dict) -> dict:
+    converted = {}
+    for attr_key, attr_value in attributes.items():
+        if isinstance(attr_value, (tuple, set)):
+            attr_value = list(attr_value)
+        if isinstance(attr_value, (date, datetime)):
+            attr_value = str(attr_value)
+        converted[attr_key] = attr_value
+    return converted
+
+
 def _convert_nodes_for_json(nodes: Nodes) -> dict:
-    for identifier, attributes in nodes.items():
-        for attr_key, attr_value in attributes.items():
-            if isinstance(attr_value, (tuple, set)):
-                nodes[identifier][attr_key] = list(nodes[identifier][attr_key])
-            if isinstance(attr_value, (date, datetime)):
-                nodes[identifier][attr_key] = str(nodes[identifier][attr_key])
-    return nodes
+    return {
+        identifier: _convert_attributes_for_json(attributes)
+        for identifier, attributes in nodes.items()}
 
 
 def _convert_edges_for_json(edges: Edges, delimiter: str) -> dict:
-    edges = {
-        delimiter.join((node_l, node_r)): multiples
+    return {
+        delimiter.join((node_l, node_r)): {
+            identifier: _convert_attributes_for_json(attributes)
+            for identifier, attributes in multiples.items()}
         for (node_l, node_r), multiples in edges.items()}
-    for couple, multiples in edges.items():
-        for identifier, attributes in multiples.items():
-            for attr_key, attr_value in attributes.items():
-                if isinstance(attr_value, (tuple, set)):
-                    edges[couple][identifier][attr_key] = list(edges[couple][identifier][attr_key])
-                if isinstance(attr_value, (date, datetime)):
-                    edges[couple][identifier][attr_key] = str(edges[couple][identifier][attr_key])
-    return edges
 
 
 def _generate_edges_delimiter() -> str:
     return f'~{uuid.uuid4().hex}~'
 
 
+def _graph_to_json_data(graph: Graph) -> dict:
+    edges_delimiter = _generate_edges_delimiter()
+    return {
+        'format_version': FORMAT_VERSION,
+        'graph_type': graph.check_type(),
+        'edges_delimiter': edges_delimiter,
+        'nodes': _convert_nodes_for_json(graph.nodes),
+        'edges': _convert_edges_for_json(graph.edges, edges_delimiter)
+    }
+
+
+def _dump_json_atomically(data: dict, file_path: str) -> None:
+    """Writes JSON to temporary file in the same directory, syncs it to disk
+    and renames it to file path, so file path contains either the previous or
+    the new complete file"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    temporary_path = f'{file_path}.{uuid.uuid4().hex}.tmp'
+    try:
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, file_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    _sync_directory(directory)
+
+
+def _sync_directory(directory: str) -> None:
+    """Syncs directory entry (rename) to disk where it is supported"""
+    if hasattr(os, 'O_DIRECTORY'):
+        descriptor = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+async def _write_text_atomically_async(
+        text: str, file_path: str, chunk_size: int, executor: Executor) -> None:
+    """Writes text to temporary file by chunks in executor and renames it to
+    file path (see `_dump_json_atomically`)"""
+    loop = asyncio.get_running_loop()
+    directory = os.path.dirname(os.path.abspath(file_path))
+    temporary_path = f'{file_path}.{uuid.uuid4().hex}.tmp'
+    try:
+        file = await loop.run_in_executor(
+            executor, lambda: open(temporary_path, 'w', encoding='utf-8'))
+        try:
+            for start in range(0, len(text), chunk_size):
+                await loop.run_in_executor(
+                    executor, file.write, text[start:start + chunk_size])
+            await loop.run_in_executor(executor, file.flush)
+            await loop.run_in_executor(executor, os.fsync, file.fileno())
+        finally:
+            file.close()
+        await loop.run_in_executor(executor, os.replace, temporary_path, file_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    await loop.run_in_executor(executor, _sync_directory, directory)
+
+
 def export_graph_to_json(graph: Graph, file_path: str) -> None:
     """Export graph to JSON, convert nodes and edges attributes (from set and
-    tuple to list, from date and datetime to str)
+    tuple to list, from date and datetime to str), file is replaced atomically
 
     Parameters
     ----------
@@ -54,17 +127,38 @@ def export_graph_to_json(graph: Graph, file_path: str) -> None:
     if file_extension != 'json':
         raise WrongFileExtensionException(received=file_extension, required='json')
 
-    graph.calc_degree()
-    graph.find_neighbors()
+    _dump_json_atomically(_graph_to_json_data(graph), file_path)
 
-    edges_delimiter = _generate_edges_delimiter()
 
-    data = {
-        'graph_type': graph.check_type(),
-        'edges_delimiter': edges_delimiter,
-        'nodes': _convert_nodes_for_json(graph.nodes),
-        'edges': _convert_edges_for_json(graph.edges, edges_delimiter)
-    }
+async def export_graph_to_json_async(
+        graph: Graph, file_path: str, chunk_size: int = 1 << 20,
+        executor: Executor = None) -> None:
+    """Asynchronous export graph to JSON (see `export_graph_to_json`)
+
+    Graph is exported from its snapshot (see Graph `snapshot`), conversion and
+    JSON encoding run in executor and file is written by chunks in executor,
+    so event loop is not blocked.
+
+    Parameters
+    ----------
+    graph
+        DirectedGraph or UndirectedGraph object
+    file_path
+        Path to JSON file
+    chunk_size, optional
+        Number of characters written by one write
+    executor, optional
+        Executor (None - default executor of event loop)
+    """
+
+    file_extension = file_path.split('.')[-1]
+    if file_extension != 'json':
+        raise WrongFileExtensionException(received=file_extension, required='json')
+
+    snapshot = graph.snapshot()
+
+    def encode() -> str:
+        return json.dumps(_graph_to_json_data(snapshot))
 
-    with open(file_path, 'w', encoding='utf-8') as file:
-        json.dump(data, file)
+    text = await asyncio.get_running_loop().run_in_executor(executor, encode)
+    await _write_text_atomically_async(text, file_path, chunk_size, executor)
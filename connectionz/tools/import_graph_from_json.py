@@ -2,6 +2,8 @@
 
 import sys
 import json
+import asyncio
+from concurrent.futures import Executor
 from connectionz.core.nodes import Nodes
 from connectionz.core.edges import Edges
 from connectionz.core.graph import Graph
@@ -9,11 +11,13 @@ from connectionz.exceptions.wrong_file_extension_exception import (
     WrongFileExtensionException)
 
 
-def _convert_nodes_from_json(nodes: dict) -> Nodes:
-    for identifier, attributes in nodes.items():
-        for attr_key, attr_value in attributes.items():
-            if isinstance(attr_value, (list)) and attr_key == 'neighbors':
-                nodes[identifier][attr_key] = set(nodes[identifier][attr_key])
+def _convert_nodes_from_json(nodes: dict, legacy: bool) -> Nodes:
+    # degree and neighbors written to node attributes by versions without
+    # format version are dropped (they are not node attributes anymore)
+    if legacy:
+        for attributes in nodes.values():
+            attributes.pop('degree', None)
+            attributes.pop('neighbors', None)
     return nodes
 
 
@@ -24,8 +28,25 @@ def _convert_edges_from_json(edges: dict, delimiter: str) -> Edges:
     return edges
 
 
+def _graph_from_json_data(data: dict) -> Graph:
+    graph_class = getattr(sys.modules['connectionz.core'], data['graph_type'])
+    edges = _convert_edges_from_json(data['edges'], data['edges_delimiter'])
+
+    # couples whose edges were all removed are kept without edges
+    empty_couples = [couple for couple, multiples in edges.items() if not multiples]
+
+    graph = graph_class(
+        nodes = _convert_nodes_from_json(data['nodes'], 'format_version' not in data),
+        edges = {couple: multiples for couple, multiples in edges.items() if multiples})
+    for node_l, node_r in empty_couples:
+        identifier = graph.add_edge(node_l, node_r)
+        graph.del_edge(node_l, node_r, identifier)
+
+    return graph
+
+
 def import_graph_from_json(file_path: str) -> Graph:
-    """Import graph from JSON, convert node attribute neighbors from list to set
+    """Import graph from JSON
 
     Parameters
     ----------
@@ -44,8 +65,48 @@ def import_graph_from_json(file_path: str) -> Graph:
     with open(file_path, 'r', encoding='utf-8') as file:
         data = json.load(file)
 
-    graph = getattr(sys.modules['connectionz.core'], data['graph_type'])
+    return _graph_from_json_data(data)
+
+
+
+async def import_graph_from_json_async(
+        file_path: str, chunk_size: int = 1 << 20,
+        executor: Executor = None) -> Graph:
+    """Asynchronous import graph from JSON (see `import_graph_from_json`)
+
+    File is read by chunks in executor, JSON decoding and graph creation run
+    in executor, so event loop is not blocked.
+
+    Parameters
+    ----------
+    file_path
+        Path to JSON file
+    chunk_size, optional
+        Number of characters read by one read
+    executor, optional
+        Executor (None - default executor of event loop)
+
+    Returns
+    -------
+        DirectedGraph or UndirectedGraph object
+    """
+
+    file_extension = file_path.split('.')[-1]
+    if file_extension != 'json':
+        raise WrongFileExtensionException(received=file_extension, required='json')
+
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(
+        executor, lambda: open(file_path, 'r', encoding='utf-8'))
+    chunks = []
+    try:
+        while True:
+            chunk = await loop.run_in_executor(executor, file.read, chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        file.close()
 
-    return graph(
-        nodes = _convert_nodes_from_json(data['nodes']),
-        edges = _convert_edges_from_json(data['edges'], data['edges_delimiter']))
+    return await loop.run_in_executor(
+        executor, lambda: _graph_from_json_data(json.loads(''.join(chunks))))
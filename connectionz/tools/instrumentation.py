@@ -0,0 +1,301 @@
+"""Opt-in instrumentation of Graph methods and tools
+
+Instrumentation wraps selected Graph methods and tool functions only while it
+is enabled: `enable_instrumentation` replaces them with wrappers and
+`disable_instrumentation` restores the original functions, so disabled
+instrumentation costs nothing.
+
+For each call wrapper measures wall time and the number of items processed
+(edges for describe, export, import and adjacency
+rebuild, nodes or edges for validation, 1 for add/del methods) and passes them to sinks:
+    - StatsSink: in-memory call counts, cumulative wall time and items
+    - LoggingSink: callback or logger for each call
+    - SpanSink: OpenTelemetry-style span for each call
+
+Wall time of nested calls (add_node inside add_edge) is included into
+wall time of outer call.
+Wall time of coroutine functions (describe_async, async export and import)
+is measured until coroutine is finished.
+"""
+
+import sys
+import inspect
+import logging
+from time import perf_counter
+from threading import Lock
+from functools import wraps
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Iterator
+from connectionz.core.graph import Graph
+from connectionz.core.directed_graph import DirectedGraph
+from connectionz.core.undirected_graph import UndirectedGraph
+
+
+def _one(_args, _kwargs, _result) -> int:
+    """Counts one item (single mutation)"""
+    return 1
+
+
+def _graph_edges(args, _kwargs, _result) -> int:
+    """Counts couples of graph passed as the first argument"""
+    return len(args[0].edges)
+
+
+def _result_edges(_args, _kwargs, result) -> int:
+    """Counts couples of returned graph"""
+    return len(result.edges)
+
+
+def _validated(args, _kwargs, _result) -> int:
+    """Counts validated nodes or edges passed as the second argument"""
+    return len(args[1]) if args[1] is not None else 0
+
+
+GRAPH_OPERATIONS: dict[str, Callable] = {
+    'add_node': _one,
+    'del_node': _one,
+    'add_edge': _one,
+    'del_edge': _one,
+    '_nodes_validation': _validated,
+    '_edges_validation': _validated,
+    '_build_adjacency': _graph_edges,
+    'get_subgraph': _result_edges,
+    'describe': _graph_edges,
+    'describe_async': _graph_edges,
+    'to_shared_memory': _graph_edges,
+    'diff': _graph_edges,
+}
+
+TOOL_OPERATIONS: dict[str, Callable] = {
+    'export_graph_to_json': _graph_edges,
+    'import_graph_from_json': _result_edges,
+    'export_graph_to_json_async': _graph_edges,
+    'import_graph_from_json_async': _result_edges,
+}
+
+
+class Sink:
+
+    """Base sink of instrumentation
+
+    `start` is called before instrumented call and returns token, `finish`
+    is called after call with the same token (error is None if call
+    succeeded).
+    """
+
+    def start(self, operation: str) -> Any:
+        """Called before instrumented call, returns token (None by default)"""
+
+    def finish(
+            self, operation: str, token: Any, elapsed: float, items: int,
+            error: BaseException = None) -> None:
+        """Called after instrumented call"""
+
+
+class StatsSink(Sink):
+
+    """In-memory statistics
+
+    Statistics representation is a dict with:
+        - operation name
+        - a dict with calls, errors, cumulative wall time (seconds) and items
+    """
+
+    def __init__(self):
+        self.stats: dict[str, dict[str, float]] = {}
+        self._lock = Lock()
+
+    def finish(self, operation, token, elapsed, items, error=None):
+        with self._lock:
+            stats = self.stats.get(operation)
+            if stats is None:
+                stats = self.stats[operation] = {
+                    'calls': 0, 'errors': 0, 'time': 0.0, 'items': 0}
+            stats['calls'] += 1
+            stats['time'] += elapsed
+            stats['items'] += items
+            if error is not None:
+                stats['errors'] += 1
+
+    def report(self) -> list[dict[str, Any]]:
+        """Returns statistics of operations sorted by cumulative wall time
+        descending"""
+        with self._lock:
+            rows = [
+                {'operation': operation, **stats}
+                for operation, stats in self.stats.items()]
+        return sorted(rows, key=lambda row: row['time'], reverse=True)
+
+    def reset(self) -> None:
+        """Removes all statistics"""
+        with self._lock:
+            self.stats = {}
+
+
+class LoggingSink(Sink):
+
+    """Passes each call to callback (operation, elapsed, items, error) or
+    writes it to logger"""
+
+    def __init__(
+            self, callback: Callable[[str, float, int, BaseException], None] = None,
+            logger: logging.Logger = None, level: int = logging.DEBUG):
+        self.callback = callback
+        self.logger = logger or logging.getLogger('connectionz')
+        self.level = level
+
+    def finish(self, operation, token, elapsed, items, error=None):
+        if self.callback is not None:
+            self.callback(operation, elapsed, items, error)
+        else:
+            self.logger.log(
+                self.level, '%s: %.6f s, %d items%s', operation, elapsed, items,
+                '' if error is None else f', error {error!r}')
+
+
+class SpanSink(Sink):
+
+    """Opens span for each call
+
+    `start_span` is a function (operation name) -> context manager, that
+    returns span with method `set_attribute`, for example
+    `tracer.start_as_current_span` of OpenTelemetry tracer.
+    """
+
+    def __init__(self, start_span: Callable[[str], Any]):
+        self.start_span = start_span
+
+    def start(self, operation):
+        stack = ExitStack()
+        return stack, stack.enter_context(self.start_span(operation))
+
+    def finish(self, operation, token, elapsed, items, error=None):
+        stack, span = token
+        if span is not None:
+            span.set_attribute('connectionz.items', items)
+            span.set_attribute('connectionz.elapsed', elapsed)
+        if error is None:
+            stack.close()
+        else:
+            # span records error, error is raised by instrumented call
+            stack.__exit__(type(error), error, error.__traceback__)
+
+
+_sinks: list[Sink] = []
+_originals: list[tuple[Any, str, Any]] = []
+
+
+def _instrumented(function: Callable, operation: str, count_items: Callable) -> Callable:
+    """Returns wrapper that passes wall time and items of each call to sinks
+    (for coroutine function - wall time until coroutine is finished)"""
+
+    def finish(sinks, tokens, start, items, error=None):
+        elapsed = perf_counter() - start
+        for sink, token in zip(sinks, tokens):
+            sink.finish(operation, token, elapsed, items, error)
+
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            sinks = list(_sinks)
+            tokens = [sink.start(operation) for sink in sinks]
+            start = perf_counter()
+            try:
+                result = await function(*args, **kwargs)
+            except BaseException as error:
+                finish(sinks, tokens, start, 0, error)
+                raise
+            finish(sinks, tokens, start, count_items(args, kwargs, result))
+            return result
+
+        return async_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        sinks = list(_sinks)
+        tokens = [sink.start(operation) for sink in sinks]
+        start = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as error:
+            finish(sinks, tokens, start, 0, error)
+            raise
+        finish(sinks, tokens, start, count_items(args, kwargs, result))
+        return result
+
+    return wrapper
+
+
+def _tool_namespaces(name: str) -> Iterator[Any]:
+    """Generates modules that contain tool function"""
+    for module_name in (f'connectionz.tools.{name}', 'connectionz.tools', 'connectionz'):
+        module = sys.modules.get(module_name)
+        if module is not None and callable(getattr(module, name, None)):
+            yield module
+
+
+def _patch(owner: Any, name: str, wrapper: Callable) -> None:
+    """Replaces attribute and remembers original"""
+    _originals.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, wrapper)
+
+
+def check_instrumentation_is_enabled() -> bool:
+    """Checks that instrumentation is enabled"""
+    return bool(_originals)
+
+
+def enable_instrumentation(*sinks: Sink) -> Sink:
+    """Enables instrumentation of Graph methods and tools
+
+    Parameters
+    ----------
+    sinks
+        Sinks of instrumentation (StatsSink is created if sinks are not
+        specified), replace sinks if instrumentation is already enabled
+
+    Returns
+    -------
+        The first sink
+    """
+    if not sinks:
+        sinks = (StatsSink(),)
+    _sinks[:] = sinks
+
+    if check_instrumentation_is_enabled():
+        return sinks[0]
+
+    for graph_class in (Graph, DirectedGraph, UndirectedGraph):
+        for name, count_items in GRAPH_OPERATIONS.items():
+            function = graph_class.__dict__.get(name)
+            if function is not None:
+                _patch(graph_class, name, _instrumented(
+                    function, f'{graph_class.__name__}.{name}', count_items))
+
+    for name, count_items in TOOL_OPERATIONS.items():
+        namespaces = list(_tool_namespaces(name))
+        if namespaces:
+            wrapper = _instrumented(getattr(namespaces[0], name), name, count_items)
+            for module in namespaces:
+                _patch(module, name, wrapper)
+
+    return sinks[0]
+
+
+def disable_instrumentation() -> None:
+    """Restores original Graph methods and tools"""
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    _sinks.clear()
+
+
+@contextmanager
+def instrumentation(*sinks: Sink) -> Iterator[Sink]:
+    """Enables instrumentation inside `with` block (see `enable_instrumentation`)"""
+    sink = enable_instrumentation(*sinks)
+    try:
+        yield sink
+    finally:
+        disable_instrumentation()
@@ -0,0 +1,115 @@
+"""Tests of functions `simple_cycles`, `cycles_through` and
+`temporal_cycles_through`
+
+if (graph is not DirectedGraph):
+    - raise UnsupportedGraphTypeException
+
+if (node not exists):
+    - raise NodeIsNotExistsException
+
+if (max length not more than 0):
+    - raise WrongAlgorithmParameterException
+
+- cycles are generated lazily
+- bounded-length cycles
+- time-respecting cycles follow edges with increasing time
+- couples whose edges were all removed are not followed
+"""
+
+import types
+from datetime import date
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph,
+    simple_cycles, cycles_through, temporal_cycles_through)
+from connectionz.exceptions import (
+    NodeIsNotExistsException,
+    WrongAlgorithmParameterException,
+    UnsupportedGraphTypeException)
+
+
+def _rotated(cycle):
+    """Rotates cycle to start from the smallest node"""
+    position = cycle.index(min(cycle))
+    return tuple(cycle[position:] + cycle[:position])
+
+
+def _money_loops():
+    """Creates graph with cycles of length 1, 2, 3 and 4"""
+    graph = DirectedGraph()
+    for node_l, node_r in [
+            ('A', 'B'), ('B', 'A'), ('B', 'C'), ('C', 'A'),
+            ('C', 'D'), ('D', 'A'), ('E', 'E'), ('E', 'A')]:
+        graph.add_edge(node_l, node_r, recalculate_calculated_attributes=False)
+    return graph
+
+
+class TestsCycles:
+    """Tests of cycles enumeration"""
+
+    def test_exception_unsupported_graph_type(self):
+        """Searching cycles in undirected graph"""
+        with pytest.raises(UnsupportedGraphTypeException):
+            next(simple_cycles(UndirectedGraph(edges=[('A', 'B')])))
+
+    def test_exception_node_is_not_exists(self):
+        """Searching cycles through non-existent node"""
+        with pytest.raises(NodeIsNotExistsException):
+            next(cycles_through(_money_loops(), 'Z'))
+
+    def test_exception_wrong_max_length(self):
+        """Searching cycles with wrong max length"""
+        with pytest.raises(WrongAlgorithmParameterException):
+            next(simple_cycles(_money_loops(), max_length=0))
+
+    def test_simple_cycles(self):
+        """Finding all simple cycles lazily"""
+        cycles = simple_cycles(_money_loops())
+        assert (isinstance(cycles, types.GeneratorType)
+            and sorted(_rotated(cycle) for cycle in cycles) == [
+                ('A', 'B'), ('A', 'B', 'C'), ('A', 'B', 'C', 'D'), ('E',)])
+
+    def test_simple_cycles_bounded(self):
+        """Finding short cycles"""
+        cycles = simple_cycles(_money_loops(), max_length=3)
+        assert sorted(_rotated(cycle) for cycle in cycles) == [
+            ('A', 'B'), ('A', 'B', 'C'), ('E',)]
+
+    def test_cycles_through(self):
+        """Finding cycles through selected node"""
+        cycles = list(cycles_through(_money_loops(), 'C', max_length=3))
+        assert cycles == [['C', 'A', 'B']]
+
+    def test_couples_without_edges(self):
+        """Cycles and loops through removed edges are not found"""
+        graph = DirectedGraph()
+        graph.add_edge('A', 'B', 'p1')
+        graph.add_edge('B', 'A', 'p2')
+        graph.add_edge('A', 'A', 'p3')
+        graph.del_edge('B', 'A', 'p2')
+        graph.del_edge('A', 'A', 'p3')
+        assert (list(simple_cycles(graph)) == []
+            and list(simple_cycles(graph, max_length=2)) == []
+            and list(cycles_through(graph, 'A')) == [])
+
+    def test_temporal_cycles_through(self):
+        """Finding cycles with increasing edge dates"""
+        graph = DirectedGraph()
+        graph.add_edge('A', 'B', 'ab', date=date(2024, 1, 1))
+        graph.add_edge('B', 'C', 'bc-old', date=date(2023, 12, 1))
+        graph.add_edge('B', 'C', 'bc', date=date(2024, 1, 2))
+        graph.add_edge('C', 'A', 'ca', date=date(2024, 1, 3))
+        graph.add_edge('B', 'A', 'ba', date=date(2023, 1, 1))
+        graph.add_edge('B', 'A', 'ba-no-date')
+        cycles = list(temporal_cycles_through(graph, 'A'))
+        assert cycles == [[('A', 'B', 'ab'), ('B', 'C', 'bc'), ('C', 'A', 'ca')]]
+
+    def test_temporal_cycles_through_bounded(self):
+        """Finding short cycles with increasing edge dates"""
+        graph = DirectedGraph()
+        graph.add_edge('A', 'B', 'ab', date='2024-01-01')
+        graph.add_edge('B', 'A', 'ba', date='2024-01-02')
+        graph.add_edge('B', 'C', 'bc', date='2024-01-02')
+        graph.add_edge('C', 'A', 'ca', date='2024-01-03')
+        cycles = list(temporal_cycles_through(graph, 'A', max_length=2))
+        assert cycles == [[('A', 'B', 'ab'), ('B', 'A', 'ba')]]
@@ -0,0 +1,96 @@
+"""Tests of class `LinkPredictor` and function `link_prediction_scores`
+
+if (node not exists):
+    - raise NodeIsNotExistsException
+
+if (unknown method):
+    - raise WrongAlgorithmParameterException
+
+- scores: common_neighbors, jaccard, adamic_adar, resource_allocation,
+  preferential_attachment
+- top k candidates from 2-hop neighborhood (adjacent nodes are excluded)
+- couples whose edges were all removed are not neighbors
+"""
+
+from math import log
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, LinkPredictor, link_prediction_scores)
+from connectionz.exceptions import (
+    NodeIsNotExistsException,
+    WrongAlgorithmParameterException)
+
+
+def _friends():
+    """Creates graph where Ava and Noah have two common friends"""
+    graph = UndirectedGraph()
+    graph.add_edge('Ava', 'Liam', recalculate_calculated_attributes=False)
+    graph.add_edge('Ava', 'Emma', recalculate_calculated_attributes=False)
+    graph.add_edge('Ava', 'Mia', recalculate_calculated_attributes=False)
+    graph.add_edge('Noah', 'Liam', recalculate_calculated_attributes=False)
+    graph.add_edge('Noah', 'Emma', recalculate_calculated_attributes=False)
+    graph.add_edge('Noah', 'Noah', recalculate_calculated_attributes=False)
+    return graph
+
+
+class TestsLinkPredictor:
+    """Tests of link prediction scores"""
+
+    def test_exception_node_is_not_exists(self):
+        """Scoring couple with non-existent node"""
+        predictor = LinkPredictor(_friends())
+        with pytest.raises(NodeIsNotExistsException):
+            predictor.score('Ava', 'Brooklyn')
+
+    def test_exception_wrong_method(self):
+        """Scoring with unknown method"""
+        predictor = LinkPredictor(_friends())
+        with pytest.raises(WrongAlgorithmParameterException):
+            predictor.score('Ava', 'Noah', method='cosine')
+
+    def test_scores(self):
+        """Calculating each score for couple of nodes (loops are ignored)"""
+        predictor = LinkPredictor(_friends())
+        assert (predictor.score('Ava', 'Noah', 'common_neighbors') == 2
+            and predictor.score('Ava', 'Noah', 'jaccard') == 2 / 3
+            and predictor.score('Ava', 'Noah', 'adamic_adar') == 2 / log(2)
+            and predictor.score('Ava', 'Noah', 'resource_allocation') == 1
+            and predictor.score('Ava', 'Noah', 'preferential_attachment') == 6)
+
+    def test_scores_ignore_direction(self):
+        """Neighborhoods of DirectedGraph ignore edge direction"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam')
+        graph.add_edge('Liam', 'Noah')
+        assert link_prediction_scores(graph, [('Ava', 'Noah')], 'common_neighbors') \
+            == [('Ava', 'Noah', 1)]
+
+    def test_couple_without_edges(self):
+        """Couple whose edges were all removed is not a link"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1')
+        graph.add_edge('Liam', 'Noah', 'p2')
+        graph.del_edge('Ava', 'Liam', 'p1')
+        predictor = LinkPredictor(graph)
+        assert (predictor.score('Ava', 'Noah', 'common_neighbors') == 0
+            and predictor.score('Ava', 'Noah', 'preferential_attachment') == 0)
+
+    def test_top_k(self):
+        """Getting best candidates among non-adjacent nodes"""
+        predictor = LinkPredictor(_friends())
+        assert (predictor.top_k('Noah', k=2, method='common_neighbors')
+                == [('Ava', 2)]
+            and dict(predictor.top_k('Liam', k=5, method='jaccard'))
+                == {'Emma': 1.0, 'Mia': 0.5})
+
+    def test_top_k_pruning(self):
+        """Paths through hubs are pruned"""
+        predictor = LinkPredictor(_friends())
+        assert predictor.top_k('Mia', method='common_neighbors', max_intermediate_degree=2) == []
+
+    def test_top_k_all(self):
+        """Getting best candidates for each node"""
+        predictor = LinkPredictor(_friends())
+        candidates = dict(predictor.top_k_all(k=1, method='resource_allocation'))
+        assert (set(candidates) == {'Ava', 'Liam', 'Emma', 'Mia', 'Noah'}
+            and candidates['Ava'] == [('Noah', 1.0)])
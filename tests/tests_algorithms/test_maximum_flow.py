@@ -0,0 +1,130 @@
+"""Tests of functions `maximum_flow` and `minimum_cut`
+
+if (source or target not exists):
+    - raise NodeIsNotExistsException
+
+if (source is target):
+    - raise SourceIsTargetException
+
+- capacity is summed over couple multiples
+- edges without capacity attribute have infinite capacity
+- minimum cut value is equal to maximum flow value
+"""
+
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, FlowNetwork, maximum_flow, minimum_cut)
+from connectionz.exceptions import (
+    NodeIsNotExistsException,
+    SourceIsTargetException)
+
+
+def _classic_network(graph_class):
+    """Creates network from CLRS with maximum flow 23 (for directed graph)"""
+    graph = graph_class()
+    graph.add_edge('s', 'v1', capacity=16)
+    graph.add_edge('s', 'v2', capacity=13)
+    graph.add_edge('v2', 'v1', capacity=4)
+    graph.add_edge('v1', 'v3', capacity=12)
+    graph.add_edge('v3', 'v2', capacity=9)
+    graph.add_edge('v2', 'v4', capacity=14)
+    graph.add_edge('v4', 'v3', capacity=7)
+    graph.add_edge('v3', 't', capacity=20)
+    graph.add_edge('v4', 't', capacity=4)
+    return graph
+
+
+class TestsMaximumFlowDirectedGraph:
+    """Tests of maximum flow and minimum cut in DirectedGraph"""
+
+    def test_exception_node_is_not_exists(self):
+        """Calculating flow from non-existent node"""
+        graph = _classic_network(DirectedGraph)
+        with pytest.raises(NodeIsNotExistsException):
+            maximum_flow(graph, 'Brooklyn', 't')
+
+    def test_exception_source_is_target(self):
+        """Calculating flow from node to itself"""
+        graph = _classic_network(DirectedGraph)
+        with pytest.raises(SourceIsTargetException):
+            maximum_flow(graph, 's', 's')
+
+    def test_maximum_flow(self):
+        """Calculating maximum flow in classic network"""
+        graph = _classic_network(DirectedGraph)
+        assert maximum_flow(graph, 's', 't') == 23
+
+    def test_maximum_flow_sums_multiples(self):
+        """Capacity of couple is summed over multiple edges"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', amount=300)
+        graph.add_edge('Ava', 'Liam', amount=200)
+        graph.add_edge('Liam', 'Noah', amount=1000)
+        assert maximum_flow(graph, 'Ava', 'Noah', capacity='amount') == 500
+
+    def test_maximum_flow_respects_direction(self):
+        """Flow can not go against edge direction"""
+        graph = DirectedGraph()
+        graph.add_edge('Liam', 'Ava', capacity=10)
+        assert maximum_flow(graph, 'Ava', 'Liam') == 0
+
+    def test_maximum_flow_infinite_capacity(self):
+        """Edges without capacity attribute have infinite capacity"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam')
+        graph.add_edge('Liam', 'Noah', capacity=7)
+        graph.add_edge('Ava', 'Noah')
+        assert maximum_flow(graph, 'Ava', 'Noah') == float('inf')
+
+    def test_minimum_cut(self):
+        """Minimum cut value is equal to maximum flow, source and target are
+        separated"""
+        graph = _classic_network(DirectedGraph)
+        cut_value, (source_side, target_side) = minimum_cut(graph, 's', 't')
+        crossing = sum(
+            attributes['capacity']
+            for (node_l, node_r), multiples in graph.edges.items()
+            for attributes in multiples.values()
+            if node_l in source_side and node_r in target_side)
+        assert (cut_value == 23
+            and crossing == 23
+            and 's' in source_side
+            and 't' in target_side
+            and source_side | target_side == set(graph.nodes))
+
+    def test_graph_is_not_modified(self):
+        """Network is built once, graph stays the same"""
+        graph = _classic_network(DirectedGraph)
+        edges_before = {
+            couple: {identifier: dict(attributes)
+                for identifier, attributes in multiples.items()}
+            for couple, multiples in graph.edges.items()}
+        network = FlowNetwork(graph)
+        assert (network.maximum_flow('s', 't') == 23
+            and network.maximum_flow('s', 't') == 23
+            and network.maximum_flow('v1', 't') == 12
+            and graph.edges == edges_before)
+
+
+class TestsMaximumFlowUndirectedGraph:
+    """Tests of maximum flow and minimum cut in UndirectedGraph"""
+
+    def test_maximum_flow_both_directions(self):
+        """Flow goes in both directions of undirected couple"""
+        graph = UndirectedGraph()
+        graph.add_edge('Liam', 'Ava', capacity=10)
+        graph.add_edge('Liam', 'Noah', capacity=4)
+        assert (maximum_flow(graph, 'Ava', 'Noah') == 4
+            and maximum_flow(graph, 'Noah', 'Ava') == 4)
+
+    def test_minimum_cut(self):
+        """Minimum cut separates source and target"""
+        graph = UndirectedGraph()
+        graph.add_edge('Ava', 'Liam', capacity=3)
+        graph.add_edge('Ava', 'Noah', capacity=3)
+        graph.add_edge('Liam', 'Emma', capacity=1)
+        graph.add_edge('Noah', 'Emma', capacity=1)
+        cut_value, (source_side, target_side) = minimum_cut(graph, 'Ava', 'Emma')
+        assert (cut_value == 2
+            and source_side == {'Ava', 'Liam', 'Noah'}
+            and target_side == {'Emma'})
@@ -0,0 +1,93 @@
+"""Tests of class `RandomWalker` and function `generate_random_walks`
+
+if (p or q not more than 0) or (walk length not more than 0):
+    - raise WrongAlgorithmParameterException
+
+- walks follow arcs of graph
+- walks stop at nodes without outgoing arcs
+- walks are reproducible with seed (also in process pool)
+- weights are summed over couple multiples
+"""
+
+from collections import Counter
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, RandomWalker, generate_random_walks)
+from connectionz.exceptions import WrongAlgorithmParameterException
+
+
+def _ring(graph_class, size=6):
+    """Creates ring graph"""
+    graph = graph_class()
+    for position in range(size):
+        graph.add_edge(
+            f'n{position}', f'n{(position + 1) % size}',
+            recalculate_calculated_attributes=False)
+    return graph
+
+
+class TestsRandomWalker:
+    """Tests of random walks"""
+
+    def test_exception_wrong_parameters(self):
+        """Creating walker or walks with wrong parameters"""
+        graph = _ring(UndirectedGraph)
+        with pytest.raises(WrongAlgorithmParameterException):
+            RandomWalker(graph, p=0)
+        with pytest.raises(WrongAlgorithmParameterException):
+            RandomWalker(graph, q=-1)
+        with pytest.raises(WrongAlgorithmParameterException):
+            next(RandomWalker(graph).walks(walk_length=0))
+
+    def test_walks_follow_edges(self):
+        """Each step of walk goes along existing couple"""
+        graph = _ring(UndirectedGraph)
+        walks = generate_random_walks(graph, walk_length=10, walks_per_node=3, seed=7)
+        assert (len(walks) == 18
+            and all(len(walk) == 10 for walk in walks)
+            and all(
+                graph.has_edge(node_l, node_r)
+                for walk in walks for node_l, node_r in zip(walk, walk[1:])))
+
+    def test_directed_walks_stop_at_sink(self):
+        """Walk stops at node without outgoing edges"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam')
+        graph.add_edge('Liam', 'Noah')
+        walks = generate_random_walks(graph, walk_length=5, seed=1)
+        assert sorted(walks) == [['Ava', 'Liam', 'Noah'], ['Liam', 'Noah'], ['Noah']]
+
+    def test_reproducible_with_seed(self):
+        """Walks with the same seed are equal, also in process pool"""
+        graph = _ring(UndirectedGraph)
+        walker = RandomWalker(graph, p=0.5, q=2.0)
+        walks = [
+            list(walk) for batch in walker.walks(8, walks_per_node=4, batch_size=5, seed=42)
+            for walk in batch]
+        walks_again = [
+            list(walk) for batch in walker.walks(8, walks_per_node=4, batch_size=5, seed=42)
+            for walk in batch]
+        walks_pool = [
+            list(walk) for batch in walker.walks(
+                8, walks_per_node=4, batch_size=5, seed=42, processes=2)
+            for walk in batch]
+        assert walks == walks_again == walks_pool
+
+    def test_weights_sum_multiples(self):
+        """Transition probability is proportional to summed weight"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', amount=1)
+        graph.add_edge('Ava', 'Noah', amount=1)
+        graph.add_edge('Ava', 'Noah', amount=2)
+        walks = generate_random_walks(
+            graph, walk_length=2, walks_per_node=4000, weight='amount', seed=3)
+        counter = Counter(walk[1] for walk in walks if walk[0] == 'Ava')
+        assert 2.5 < counter['Noah'] / counter['Liam'] < 3.5
+
+    def test_node2vec_return_parameter(self):
+        """Small p makes returning to previous node more likely"""
+        graph = _ring(UndirectedGraph)
+        walks = generate_random_walks(
+            graph, walk_length=3, walks_per_node=500, p=0.1, q=1.0, seed=5)
+        returned = sum(walk[0] == walk[2] for walk in walks)
+        assert returned / len(walks) > 0.8
@@ -0,0 +1,167 @@
+"""Tests ConcurrentGraph and ReadWriteLock
+
+- reads run in parallel, writes are exclusive
+- waiting writer blocks new readers
+- batch applies writes at once with one recalculation
+- batch is rolled back if one of writes raises exception
+- snapshot is independent and consistent
+- concurrent readers never see graph in the middle of write
+"""
+
+import threading
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, ConcurrentGraph, ReadWriteLock,
+    enable_instrumentation, disable_instrumentation)
+from connectionz.exceptions import NodeIsNotExistsException, EdgeAlreadyExistsException
+
+
+class TestsReadWriteLock:
+    """Tests of ReadWriteLock"""
+
+    def test_parallel_readers(self):
+        """Two readers hold lock at the same time"""
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(2, timeout=5)
+        passed = []
+
+        def reader():
+            with lock.read_locked():
+                barrier.wait()
+                passed.append(True)
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert passed == [True, True]
+
+    def test_writer_is_exclusive(self):
+        """Reader waits for writer, waiting writer blocks new readers"""
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_read()
+        writer = threading.Thread(target=lambda: (
+            lock.acquire_write(), events.append('write'), lock.release_write()))
+        writer.start()
+        while not lock._waiting_writers:
+            pass
+        reader = threading.Thread(target=lambda: (
+            lock.acquire_read(), events.append('read'), lock.release_read()))
+        reader.start()
+        events.append('release')
+        lock.release_read()
+        writer.join()
+        reader.join()
+        assert events == ['release', 'write', 'read']
+
+
+class TestsConcurrentGraph:
+    """Tests of ConcurrentGraph"""
+
+    def test_reads_and_writes(self):
+        """Wrapper passes reads and writes to graph"""
+        graph = ConcurrentGraph(UndirectedGraph())
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        graph.add_node('Emma', age=23)
+        assert (graph.has_edge('Liam', 'Ava', 'p1') and graph.has_node('Emma')
+            and graph.neighbors('Ava') == {'Liam'} and graph.degree('Liam') == 1
+            and graph.get_node('Emma') == {'age': 23}
+            and graph.get_edge('Liam', 'Ava', 'p1') == {'amount': 100}
+            and graph.get_edge('Liam', 'Ava', 'p2') is None
+            and len(graph) == 3)
+        with pytest.raises(NodeIsNotExistsException):
+            graph.degree('Brooklyn')
+        with pytest.raises(EdgeAlreadyExistsException):
+            graph.add_edge('Ava', 'Liam', 'p1')
+
+    def test_batch(self):
+        """Writes are applied at the end of block"""
+        graph = ConcurrentGraph(DirectedGraph())
+        stats = enable_instrumentation()
+        try:
+            with graph.batch() as batch:
+                for number in range(100):
+                    batch.add_edge('Ava', f'client_{number}', amount=number)
+                batch.add_node('Emma', age=23)
+                batch.del_edge('Ava', 'client_0')
+                empty_before_end = not graph.has_node('Ava')
+        finally:
+            disable_instrumentation()
+        assert (empty_before_end and graph.degree('Ava') == 99
+            and len(graph.neighbors('Ava')) == 99 and graph.has_node('Emma')
+            and stats.stats['Graph.add_edge']['calls'] == 100)
+
+    def test_adjacency_is_built_by_writers(self):
+        """Adjacency of graph is built by wrapper and after writes without
+        recalculation, so readers do not build it"""
+        graph = ConcurrentGraph(DirectedGraph(edges=[('Ava', 'Liam')]))
+        built_by_wrapper = graph.graph._adjacency_is_built
+        graph.add_edge('Ava', 'Emma', recalculate_calculated_attributes=False)
+        assert (built_by_wrapper and graph.graph._adjacency_is_built
+            and graph.neighbors('Ava') == {'Liam', 'Emma'})
+
+    def test_batch_discarded(self):
+        """Writes are discarded if block raises exception"""
+        graph = ConcurrentGraph(DirectedGraph())
+        with pytest.raises(ValueError):
+            with graph.batch() as batch:
+                batch.add_edge('Ava', 'Liam')
+                raise ValueError()
+        assert len(graph) == 0
+
+    def test_batch_rolled_back(self):
+        """Graph is restored if write of batch raises exception"""
+        graph = ConcurrentGraph(DirectedGraph())
+        graph.add_edge('Ava', 'Liam', 'p1')
+        wrapped = graph.graph
+        before = wrapped.snapshot()
+        with pytest.raises(EdgeAlreadyExistsException):
+            with graph.batch() as batch:
+                batch.add_edge('Ava', 'Emma', 'p2')
+                batch.del_edge('Ava', 'Liam', 'p1')
+                batch.add_node('Ava', replace=True, age=30)
+                batch.add_edge('Ava', 'Emma', 'p2')
+        assert (graph.graph is wrapped and wrapped == before
+            and not graph.has_node('Emma') and graph.has_edge('Ava', 'Liam', 'p1')
+            and graph.degree('Ava') == 1 and graph.neighbors('Ava') == {'Liam'}
+            and graph.get_node('Ava') == {})
+
+    def test_snapshot(self):
+        """Snapshot is equal to graph and independent of later writes"""
+        graph = ConcurrentGraph(DirectedGraph())
+        graph.add_node('Emma', age=23)
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        snapshot = graph.snapshot()
+        equal = snapshot == graph.graph
+        graph.add_edge('Liam', 'Emma', 'p2')
+        graph.add_edge('Ava', 'Liam', 'p1', replace=True, amount=200)
+        assert (equal and not snapshot.has_edge('Liam', 'Emma')
+            and snapshot.edges[('Ava', 'Liam')]['p1']['amount'] == 100)
+
+    def test_consistent_reads(self):
+        """Readers see degree and neighbors consistent with edges"""
+        graph = ConcurrentGraph(UndirectedGraph())
+        errors = []
+        stop = threading.Event()
+
+        def writer():
+            for number in range(200):
+                graph.add_edge('hub', f'client_{number}')
+            stop.set()
+
+        def reader():
+            while not stop.is_set():
+                with graph.read() as current:
+                    if current.has_node('hub') and \
+                            current.degree('hub') != len(set(current.neighbors('hub'))):
+                        errors.append(current.degree('hub'))
+
+        threads = [threading.Thread(target=writer)] + [
+            threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == [] and graph.degree('hub') == 200
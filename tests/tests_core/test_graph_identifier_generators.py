@@ -0,0 +1,78 @@
+"""Tests identifier generators
+
+- `generate_identifier` (default)
+- `CounterIdentifierGenerator`
+- `RandomIdentifierGenerator`
+
+- generated identifiers are str
+- generated identifiers skip identifiers that already exist in graph
+- counter generator is pickled
+"""
+
+import pickle
+from connectionz import (
+    DirectedGraph, UndirectedGraph, Identifier,
+    CounterIdentifierGenerator, RandomIdentifierGenerator, generate_identifier)
+
+
+class TestsIdentifierGenerators:
+    """Tests of identifier generators"""
+
+    def test_counter(self):
+        """Counter generates monotonic identifiers with prefix"""
+        plain = CounterIdentifierGenerator()
+        prefixed = CounterIdentifierGenerator(prefix='e', start=10)
+        assert ([plain() for _ in range(3)] == ['0', '1', '2']
+            and [prefixed() for _ in range(2)] == ['e10', 'e11'])
+
+    def test_counter_is_picklable(self):
+        """Unpickled counter continues from the next value"""
+        generator = CounterIdentifierGenerator(prefix='e')
+        generator()
+        unpickled = pickle.loads(pickle.dumps(generator))
+        assert unpickled() == generator() == 'e1' and unpickled.counter == 2
+
+    def test_random(self):
+        """Random generator gives unique hex identifiers of fixed length
+        across batches"""
+        generator = RandomIdentifierGenerator(length=12, batch_size=8)
+        identifiers = [generator() for _ in range(100)]
+        assert (all(isinstance(identifier, Identifier) for identifier in identifiers)
+            and all(len(identifier) == 12 for identifier in identifiers)
+            and all(int(identifier, 16) >= 0 for identifier in identifiers)
+            and len(set(identifiers)) == 100)
+
+    def test_odd_length(self):
+        """Random generator supports odd length"""
+        generator = RandomIdentifierGenerator(length=7, batch_size=3)
+        assert all(len(generator()) == 7 for _ in range(10))
+
+
+class TestsGraphIdentifierGenerator:
+    """Tests of graph `identifier_generator`"""
+
+    def test_default(self):
+        """Graph uses uuid identifiers by default"""
+        graph = DirectedGraph()
+        identifier = graph.add_edge('Ava', 'Liam')
+        assert (graph.identifier_generator is generate_identifier
+            and len(identifier) == len(generate_identifier()))
+
+    def test_counter_graph(self):
+        """Generated identifiers of nodes and edges"""
+        graph = UndirectedGraph(
+            edges=[('Ava', 'Liam'), ('Liam', 'Ava')],
+            identifier_generator=CounterIdentifierGenerator(prefix='e'))
+        node = graph.add_node()
+        assert (graph.edges == {('Ava', 'Liam'): {'e0': {}, 'e1': {}}}
+            and node == 'e2')
+
+    def test_skip_existing(self):
+        """Generated identifier skips existing node and edge identifiers"""
+        graph = DirectedGraph(identifier_generator=CounterIdentifierGenerator())
+        graph.add_node('0')
+        graph.add_edge('Ava', 'Liam', '1')
+        graph.add_edge('Ava', 'Liam', '2')
+        node = graph.add_node()
+        edge = graph.add_edge('Ava', 'Liam')
+        assert node == '1' and edge == '3'
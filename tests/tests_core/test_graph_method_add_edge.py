@@ -155,16 +155,16 @@ class TestsDirectedGraphMethodAddEdge:
             and len(graph.edges) == 2
             and ('Daphne', 'Talia') in graph.edges
             and ('Daphne', 'Evie') in graph.edges
-            and graph.nodes['Daphne']['degree'] == 2
-            and graph.nodes['Daphne']['neighbors'] == {'Talia', 'Evie'}
-            and graph.nodes['Talia']['degree'] == 1
-            and graph.nodes['Talia']['neighbors'] == set()
-            and graph.nodes['Evie']['degree'] == 1
-            and graph.nodes['Evie']['neighbors'] == set())
+            and graph.degree('Daphne') == 2
+            and set(graph.neighbors('Daphne')) == {'Talia', 'Evie'}
+            and graph.degree('Talia') == 1
+            and set(graph.neighbors('Talia')) == set()
+            and graph.degree('Evie') == 1
+            and set(graph.neighbors('Evie')) == set())
 
     def test_disable_recalculate_calculated_attributes(self):
-        """Adding edge with disabled automatically recalculation calculated
-        attributes (custom behavior)
+        """Adding edge with disabled recalculation, degree and neighbors
+        are rebuilt from edges on the next lookup
         """
         graph = DirectedGraph(
             nodes=[
@@ -180,12 +180,12 @@ class TestsDirectedGraphMethodAddEdge:
             and len(graph.edges) == 2
             and ('Daphne', 'Talia') in graph.edges
             and ('Daphne', 'Evie') in graph.edges
-            and graph.nodes['Daphne']['degree'] == 1
-            and graph.nodes['Daphne']['neighbors'] == {'Talia'}
-            and graph.nodes['Talia']['degree'] == 1
-            and graph.nodes['Talia']['neighbors'] == set()
-            and graph.nodes['Evie']['degree'] == 0
-            and graph.nodes['Evie']['neighbors'] == set())
+            and graph.degree('Daphne') == 2
+            and set(graph.neighbors('Daphne')) == {'Talia', 'Evie'}
+            and graph.degree('Talia') == 1
+            and set(graph.neighbors('Talia')) == set()
+            and graph.degree('Evie') == 1
+            and set(graph.neighbors('Evie')) == set())
 
 
 class TestsUndirectedGraphMethodAddEdge:
@@ -308,16 +308,16 @@ class TestsUndirectedGraphMethodAddEdge:
             and len(graph.edges) == 2
             and tuple(sorted(('Daphne', 'Talia'))) in graph.edges
             and tuple(sorted(('Daphne', 'Evie'))) in graph.edges
-            and graph.nodes['Daphne']['degree'] == 2
-            and graph.nodes['Daphne']['neighbors'] == {'Talia', 'Evie'}
-            and graph.nodes['Talia']['degree'] == 1
-            and graph.nodes['Talia']['neighbors'] == {'Daphne'}
-            and graph.nodes['Evie']['degree'] == 1
-            and graph.nodes['Evie']['neighbors'] == {'Daphne'})
+            and graph.degree('Daphne') == 2
+            and set(graph.neighbors('Daphne')) == {'Talia', 'Evie'}
+            and graph.degree('Talia') == 1
+            and set(graph.neighbors('Talia')) == {'Daphne'}
+            and graph.degree('Evie') == 1
+            and set(graph.neighbors('Evie')) == {'Daphne'})
 
     def test_disable_recalculate_calculated_attributes(self):
-        """Adding edge with disabled automatically recalculation calculated
-        attributes (custom behavior)
+        """Adding edge with disabled recalculation, degree and neighbors
+        are rebuilt from edges on the next lookup
         """
         graph = UndirectedGraph(
             nodes=[
@@ -333,9 +333,9 @@ class TestsUndirectedGraphMethodAddEdge:
             and len(graph.edges) == 2
             and tuple(sorted(('Daphne', 'Talia'))) in graph.edges
             and tuple(sorted(('Daphne', 'Evie'))) in graph.edges
-            and graph.nodes['Daphne']['degree'] == 1
-            and graph.nodes['Daphne']['neighbors'] == {'Talia'}
-            and graph.nodes['Talia']['degree'] == 1
-            and graph.nodes['Talia']['neighbors'] == {'Daphne'}
-            and graph.nodes['Evie']['degree'] == 0
-            and graph.nodes['Evie']['neighbors'] == set())
+            and graph.degree('Daphne') == 2
+            and set(graph.neighbors('Daphne')) == {'Talia', 'Evie'}
+            and graph.degree('Talia') == 1
+            and set(graph.neighbors('Talia')) == {'Daphne'}
+            and graph.degree('Evie') == 1
+            and set(graph.neighbors('Evie')) == {'Daphne'})
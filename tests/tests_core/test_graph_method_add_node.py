@@ -8,7 +8,7 @@ if (node exists) and (replace is False):
 
 if (node exists) and (replace is True):
     - replace existing node
-    - copying calculated attributes
+    - keep degree and neighbors of node
 
 if (node not exists):
     - create new node with specified identifier
@@ -93,22 +93,20 @@ class TestsDirectedGraphMethodAddNode:
             and graph.nodes['Theodore'].get('age') is None
             and graph.nodes['Theodore'].get('sex') is None)
 
-    def test_replace_existing_node_and_copying_calculated_attributes(self):
+    def test_replace_existing_node_and_keeping_adjacency(self):
         """Replacing already existing node
             - existent node should be replaced by new (if replace=True)
-            - calculated attributes should be copied
+            - degree and neighbors should be kept, node attributes should
+              contain only user attributes
         """
         graph = DirectedGraph()
-        graph.add_node('Naomi', age=18)
-        graph.calc_degree()
-        graph.find_neighbors()
+        graph.add_edge('Naomi', 'Ezra')
         identifier = graph.add_node('Naomi', age=27, replace=True)  # replace existing node
-        assert (len(graph.nodes) == 1
+        assert (len(graph.nodes) == 2
             and identifier in graph.nodes
-            and len(graph.nodes[identifier]) == 3
-            and graph.nodes[identifier].get('age') == 27
-            and graph.nodes[identifier].get('degree') == 0
-            and graph.nodes[identifier].get('neighbors') == set())
+            and graph.nodes[identifier] == {'age': 27}
+            and graph.degree(identifier) == 1
+            and set(graph.neighbors(identifier)) == {'Ezra'})
 
 
 class TestsUndirectedGraphMethodAddNode:
@@ -179,19 +177,17 @@ class TestsUndirectedGraphMethodAddNode:
             and graph.nodes['Theodore'].get('age') is None
             and graph.nodes['Theodore'].get('sex') is None)
 
-    def test_replace_existing_node_and_copying_calculated_attributes(self):
+    def test_replace_existing_node_and_keeping_adjacency(self):
         """Replacing already existing node
             - existent node should be replaced by new (if replace=True)
-            - calculated attributes should be copied
+            - degree and neighbors should be kept, node attributes should
+              contain only user attributes
         """
         graph = UndirectedGraph()
-        graph.add_node('Naomi', age=18)
-        graph.calc_degree()
-        graph.find_neighbors()
+        graph.add_edge('Naomi', 'Ezra')
         identifier = graph.add_node('Naomi', age=27, replace=True)  # replace existing node
-        assert (len(graph.nodes) == 1
+        assert (len(graph.nodes) == 2
             and identifier in graph.nodes
-            and len(graph.nodes[identifier]) == 3
-            and graph.nodes[identifier].get('age') == 27
-            and graph.nodes[identifier].get('degree') == 0
-            and graph.nodes[identifier].get('neighbors') == set())
+            and graph.nodes[identifier] == {'age': 27}
+            and graph.degree(identifier) == 1
+            and set(graph.neighbors(identifier)) == {'Ezra'})
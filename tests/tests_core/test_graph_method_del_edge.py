@@ -115,16 +115,16 @@ class TestsDirectedGraphMethodDelEdge:
             and 'Amina' in graph.nodes
             and len(graph.edges) == 1
             and ('Steven', 'Nicole') in graph.edges
-            and graph.nodes['Steven']['degree'] == 1
-            and graph.nodes['Steven']['neighbors'] == {'Nicole'}
-            and graph.nodes['Nicole']['degree'] == 1
-            and graph.nodes['Nicole']['neighbors'] == set()
-            and graph.nodes['Amina']['degree'] == 0
-            and graph.nodes['Amina']['neighbors'] == set())
+            and graph.degree('Steven') == 1
+            and set(graph.neighbors('Steven')) == {'Nicole'}
+            and graph.degree('Nicole') == 1
+            and set(graph.neighbors('Nicole')) == set()
+            and graph.degree('Amina') == 0
+            and set(graph.neighbors('Amina')) == set())
 
     def test_disable_recalculate_calculated_attributes(self):
-        """Deleting edge with disabled automatically recalculation calculated
-        attributes (custom behavior)
+        """Deleting edge with disabled recalculation, degree and neighbors
+        are rebuilt from edges on the next lookup
         """
         graph = DirectedGraph(
             nodes=[
@@ -141,12 +141,12 @@ class TestsDirectedGraphMethodDelEdge:
             and 'Amina' in graph.nodes
             and len(graph.edges) == 1
             and ('Steven', 'Nicole') in graph.edges
-            and graph.nodes['Steven']['degree'] == 2
-            and graph.nodes['Steven']['neighbors'] == {'Amina', 'Nicole'}
-            and graph.nodes['Nicole']['degree'] == 1
-            and graph.nodes['Nicole']['neighbors'] == set()
-            and graph.nodes['Amina']['degree'] == 1
-            and graph.nodes['Amina']['neighbors'] == set())
+            and graph.degree('Steven') == 1
+            and set(graph.neighbors('Steven')) == {'Nicole'}
+            and graph.degree('Nicole') == 1
+            and set(graph.neighbors('Nicole')) == set()
+            and graph.degree('Amina') == 0
+            and set(graph.neighbors('Amina')) == set())
 
 
 class TestsUndirectedGraphMethodDelEdge:
@@ -234,16 +234,16 @@ class TestsUndirectedGraphMethodDelEdge:
             and 'Amina' in graph.nodes
             and len(graph.edges) == 1
             and tuple(sorted(('Steven', 'Nicole'))) in graph.edges
-            and graph.nodes['Steven']['degree'] == 1
-            and graph.nodes['Steven']['neighbors'] == {'Nicole'}
-            and graph.nodes['Nicole']['degree'] == 1
-            and graph.nodes['Nicole']['neighbors'] == {'Steven'}
-            and graph.nodes['Amina']['degree'] == 0
-            and graph.nodes['Amina']['neighbors'] == set())
+            and graph.degree('Steven') == 1
+            and set(graph.neighbors('Steven')) == {'Nicole'}
+            and graph.degree('Nicole') == 1
+            and set(graph.neighbors('Nicole')) == {'Steven'}
+            and graph.degree('Amina') == 0
+            and set(graph.neighbors('Amina')) == set())
 
     def test_disable_recalculate_calculated_attributes(self):
-        """Deleting edge with disabled automatically recalculation calculated
-        attributes (custom behavior)
+        """Deleting edge with disabled recalculation, degree and neighbors
+        are rebuilt from edges on the next lookup
         """
         graph = UndirectedGraph(
             nodes=[
@@ -260,9 +260,9 @@ class TestsUndirectedGraphMethodDelEdge:
             and 'Amina' in graph.nodes
             and len(graph.edges) == 1
             and tuple(sorted(('Steven', 'Nicole'))) in graph.edges
-            and graph.nodes['Steven']['degree'] == 2
-            and graph.nodes['Steven']['neighbors'] == {'Amina', 'Nicole'}
-            and graph.nodes['Nicole']['degree'] == 1
-            and graph.nodes['Nicole']['neighbors'] == {'Steven'}
-            and graph.nodes['Amina']['degree'] == 1
-            and graph.nodes['Amina']['neighbors'] == {'Steven'})
+            and graph.degree('Steven') == 1
+            and set(graph.neighbors('Steven')) == {'Nicole'}
+            and graph.degree('Nicole') == 1
+            and set(graph.neighbors('Nicole')) == {'Steven'}
+            and graph.degree('Amina') == 0
+            and set(graph.neighbors('Amina')) == set())
@@ -73,14 +73,14 @@ class TestsDirectedGraphMethodDelNode:
             and 'Eliana' in graph.nodes
             and len(graph.edges) == 1
             and ('Riley', 'Eliana') in graph.edges
-            and graph.nodes['Riley']['degree'] == 1
-            and graph.nodes['Riley']['neighbors'] == {'Eliana'}
-            and graph.nodes['Eliana']['degree'] == 1
-            and graph.nodes['Eliana']['neighbors'] == set())
+            and graph.degree('Riley') == 1
+            and set(graph.neighbors('Riley')) == {'Eliana'}
+            and graph.degree('Eliana') == 1
+            and set(graph.neighbors('Eliana')) == set())
 
     def test_disable_recalculate_calculated_attributes(self):
-        """Deleting selected node with disabled automatically recalculation
-        calculated attributes (custom behavior)
+        """Deleting selected node with disabled recalculation, degree and neighbors
+        are rebuilt from edges on the next lookup
         """
         graph = DirectedGraph(
             nodes=[
@@ -96,10 +96,10 @@ class TestsDirectedGraphMethodDelNode:
             and 'Eliana' in graph.nodes
             and len(graph.edges) == 1
             and ('Riley', 'Eliana') in graph.edges
-            and graph.nodes['Riley']['degree'] == 2
-            and graph.nodes['Riley']['neighbors'] == {'Eliana', 'Layla'}
-            and graph.nodes['Eliana']['degree'] == 1
-            and graph.nodes['Eliana']['neighbors'] == set())
+            and graph.degree('Riley') == 1
+            and set(graph.neighbors('Riley')) == {'Eliana'}
+            and graph.degree('Eliana') == 1
+            and set(graph.neighbors('Eliana')) == set())
 
 
 class TestsUndirectedGraphMethodDelNode:
@@ -156,14 +156,14 @@ class TestsUndirectedGraphMethodDelNode:
             and 'Eliana' in graph.nodes
             and len(graph.edges) == 1
             and tuple(sorted(('Riley', 'Eliana'))) in graph.edges
-            and graph.nodes['Riley']['degree'] == 1
-            and graph.nodes['Riley']['neighbors'] == {'Eliana'}
-            and graph.nodes['Eliana']['degree'] == 1
-            and graph.nodes['Eliana']['neighbors'] == {'Riley'})
+            and graph.degree('Riley') == 1
+            and set(graph.neighbors('Riley')) == {'Eliana'}
+            and graph.degree('Eliana') == 1
+            and set(graph.neighbors('Eliana')) == {'Riley'})
 
     def test_disable_recalculate_calculated_attributes(self):
-        """Deleting selected node with disabled automatically recalculation
-        calculated attributes (custom behavior)
+        """Deleting selected node with disabled recalculation, degree and neighbors
+        are rebuilt from edges on the next lookup
         """
         graph = UndirectedGraph(
             nodes=[
@@ -179,7 +179,7 @@ class TestsUndirectedGraphMethodDelNode:
             and 'Eliana' in graph.nodes
             and len(graph.edges) == 1
             and tuple(sorted(('Riley', 'Eliana'))) in graph.edges
-            and graph.nodes['Riley']['degree'] == 2
-            and graph.nodes['Riley']['neighbors'] == {'Eliana', 'Layla'}
-            and graph.nodes['Eliana']['degree'] == 1
-            and graph.nodes['Eliana']['neighbors'] == {'Riley'})
+            and graph.degree('Riley') == 1
+            and set(graph.neighbors('Riley')) == {'Eliana'}
+            and graph.degree('Eliana') == 1
+            and set(graph.neighbors('Eliana')) == {'Riley'})
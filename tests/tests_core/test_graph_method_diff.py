@@ -0,0 +1,143 @@
+"""Tests DirectedGraph and UndirectedGraph methods `diff` and `apply_patch`
+
+- patch contains only changed nodes, couples, edges and attributes
+- applied patch makes graph equal to other graph
+- patch is serialized to JSON and restored without loss of attribute types
+- patch does not change with later changes of other graph
+- raise WrongTypeOfGraphInPatchException for different graph types
+- raise PatchConflictException and keep graph if patch does not match graph
+"""
+
+from datetime import date, datetime, timezone
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, GraphPatch,
+    WrongTypeOfGraphInPatchException,
+    PatchConflictException)
+
+
+def _graph(graph_class):
+    """Creates graph with nodes, couples and multiple edges"""
+    graph = graph_class()
+    graph.add_node('Emma', age=23, sex=False)
+    graph.add_node('Olivia')
+    graph.add_edge('Ava', 'Liam', 'p1', amount=100, currency='USD')
+    graph.add_edge('Ava', 'Liam', 'p2', amount=200)
+    graph.add_edge('Liam', 'Noah', 'p3', amount=300)
+    graph.add_edge('Noah', 'Olivia', 'p4', amount=400)
+    return graph
+
+
+def _changed(graph):
+    """Returns changed snapshot of graph"""
+    changed = graph.snapshot()
+    changed.add_node('Emma', age=24, replace=True)
+    changed.add_node('Mia', tags=['a', 'b'])
+    changed.del_node('Olivia')
+    changed.add_edge('Ava', 'Liam', 'p1', replace=True, amount=150)
+    changed.del_edge('Ava', 'Liam', 'p2')
+    changed.add_edge('Liam', 'Noah', 'p5', amount=500)
+    changed.add_edge('Emma', 'Mia', 'p6')
+    changed.del_edge('Emma', 'Mia', 'p6')
+    return changed
+
+
+class TestsGraphMethodDiff:
+    """Tests of DirectedGraph and UndirectedGraph methods `diff` and
+    `apply_patch`"""
+
+    def test_diff(self):
+        """Patch contains only changes, attributes change contains only
+        changed and removed attributes"""
+        graph = _graph(DirectedGraph)
+        patch = graph.diff(_changed(graph))
+        assert (patch.added_nodes == {'Mia': {'tags': ['a', 'b']}}
+            and patch.removed_nodes == ['Olivia']
+            and patch.changed_nodes == {'Emma': ({'age': 24}, ['sex'])}
+            and patch.added_couples == [('Emma', 'Mia')]
+            and patch.removed_couples == [('Noah', 'Olivia')]
+            and patch.added_edges == {('Liam', 'Noah'): {'p5': {'amount': 500}}}
+            and patch.removed_edges == {('Ava', 'Liam'): ['p2']}
+            and patch.changed_edges == {('Ava', 'Liam'): {'p1': ({'amount': 150}, ['currency'])}}
+            and len(patch) == 8
+            and len(graph.diff(graph.snapshot())) == 0)
+
+    def test_apply_patch(self):
+        """Applied patch makes graph equal to other graph, adjacency is
+        updated"""
+        for graph_class in (DirectedGraph, UndirectedGraph):
+            for recalculate in (True, False):
+                graph = _graph(graph_class)
+                changed = _changed(graph)
+                graph.apply_patch(
+                    graph.diff(changed), recalculate_calculated_attributes=recalculate)
+                assert (graph == changed
+                    and all(graph.degree(node) == changed.degree(node) for node in graph.nodes)
+                    and set(graph.neighbors('Liam')) == set(changed.neighbors('Liam')))
+
+    def test_json(self):
+        """Patch restored from JSON is equal to patch and can be applied to
+        another copy of graph"""
+        for graph_class in (DirectedGraph, UndirectedGraph):
+            graph = _graph(graph_class)
+            changed = _changed(graph)
+            patch = graph.diff(changed)
+            restored = GraphPatch.from_json(patch.to_json())
+            replica = _graph(graph_class)
+            replica.apply_patch(restored)
+            assert restored == patch and replica == changed
+
+    def test_json_keeps_attribute_types(self):
+        """Tuples, sets, dates, datetimes and dicts with non-str keys or with
+        tag key are restored with their types"""
+        graph = DirectedGraph()
+        graph.add_node('Ava', born=date(2001, 1, 1))
+        changed = graph.snapshot()
+        changed.add_node('Ava', born=date(2001, 1, 2), tags=('a', 'b'), replace=True)
+        changed.add_edge('Ava', 'Liam', 'p1',
+            time=datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            members={'Ava', 'Liam'}, limits={1: [2, (3,)]}, raw={'$': 'dict', 'v': []})
+        patch = graph.diff(changed)
+        restored = GraphPatch.from_json(patch.to_json())
+        graph.apply_patch(restored)
+        attributes = graph.edges[('Ava', 'Liam')]['p1']
+        assert (restored == patch
+            and graph == changed
+            and graph.nodes['Ava']['tags'] == ('a', 'b')
+            and isinstance(attributes['members'], set)
+            and attributes['time'].tzinfo is not None)
+
+    def test_patch_keeps_copies_of_attributes(self):
+        """Changes of other graph after diff do not change patch"""
+        graph = DirectedGraph()
+        changed = graph.snapshot()
+        changed.add_edge('Ava', 'Liam', 'p1', amount=100)
+        patch = graph.diff(changed)
+        changed.nodes['Ava']['age'] = 23
+        changed.edges[('Ava', 'Liam')]['p1']['amount'] = 200
+        assert (patch.added_nodes == {'Ava': {}, 'Liam': {}}
+            and patch.added_edges == {('Ava', 'Liam'): {'p1': {'amount': 100}}})
+
+    def test_exception_wrong_type_of_graph(self):
+        """Diff and patch of graphs of different types
+            - expected raise WrongTypeOfGraphInPatchException
+        """
+        graph = _graph(DirectedGraph)
+        patch = graph.diff(_changed(graph))
+        with pytest.raises(WrongTypeOfGraphInPatchException):
+            graph.diff(_graph(UndirectedGraph))
+        with pytest.raises(WrongTypeOfGraphInPatchException):
+            _graph(UndirectedGraph).apply_patch(patch)
+
+    def test_exception_patch_conflict(self):
+        """Applying patch that does not match graph
+            - graph should not be changed
+            - expected raise PatchConflictException
+        """
+        graph = _graph(DirectedGraph)
+        patch = graph.diff(_changed(graph))
+        graph.del_edge('Ava', 'Liam', 'p2')
+        expected = graph.copy()
+        with pytest.raises(PatchConflictException):
+            graph.apply_patch(patch)  # removed edge is not exists
+        assert graph == expected
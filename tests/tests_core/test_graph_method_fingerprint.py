@@ -0,0 +1,91 @@
+"""Tests DirectedGraph and UndirectedGraph method `fingerprint`
+
+- equal graphs have equal fingerprints (independent of insertion order)
+- fingerprint changes with nodes, couples, edge identifiers and attributes
+- fingerprint is updated on each mutation (equal to fingerprint of new graph)
+- `__eq__` does not trust stale fingerprints
+"""
+
+import pickle
+from connectionz import DirectedGraph, UndirectedGraph
+
+
+def _graph(graph_class, reverse=False):
+    """Creates graph, edges are added in reversed order if reverse is True"""
+    edges = [
+        ('Ava', 'Liam', 'p1', {'amount': 100, 'tags': ['a', 'b']}),
+        ('Liam', 'Noah', 'p2', {'amount': 200, 'members': {'Ava', 'Liam'}}),
+        ('Noah', 'Noah', 'p3', {'amount': 300, 'details': {'currency': 'USD'}}),
+    ]
+    graph = graph_class()
+    graph.add_node('Emma', age=23)
+    for node_l, node_r, identifier, attributes in (edges[::-1] if reverse else edges):
+        graph.add_edge(node_l, node_r, identifier, **attributes)
+    return graph
+
+
+class TestsGraphMethodFingerprint:
+    """Tests of DirectedGraph and UndirectedGraph method `fingerprint`"""
+
+    def test_equal_graphs(self):
+        """Equal graphs have equal fingerprints, insertion order and equal
+        numbers of different types (1 and 1.0) do not matter"""
+        first = _graph(DirectedGraph)
+        second = _graph(DirectedGraph, reverse=True)
+        first.add_node('Olivia', score=1)
+        second.add_node('Olivia', score=1.0)
+        assert first == second and first.fingerprint() == second.fingerprint()
+
+    def test_different_graphs(self):
+        """Fingerprint depends on graph type, nodes, couples, edge
+        identifiers and attributes"""
+        fingerprint = _graph(DirectedGraph).fingerprint()
+        changes = [
+            lambda graph: graph.add_node('Emma', age=24, replace=True),
+            lambda graph: graph.add_node('Olivia'),
+            lambda graph: graph.add_edge('Ava', 'Liam', 'p1', replace=True, amount=100, tags=['b', 'a']),
+            lambda graph: graph.add_edge('Ava', 'Liam', 'p4'),
+            lambda graph: graph.del_edge('Liam', 'Noah', 'p2'),
+        ]
+        changed = []
+        for change in changes:
+            graph = _graph(DirectedGraph)
+            change(graph)
+            changed.append(graph.fingerprint())
+        assert (fingerprint not in changed
+            and len(set(changed)) == len(changes)
+            and _graph(UndirectedGraph).fingerprint() != fingerprint)
+
+    def test_incremental_update(self):
+        """Fingerprint updated on mutations is equal to fingerprint computed
+        for the same graph from scratch"""
+        for graph_class in (DirectedGraph, UndirectedGraph):
+            graph = _graph(graph_class)
+            graph.fingerprint()
+            graph.add_edge('Emma', 'Ava', 'p5', amount=500)
+            graph.del_edge('Liam', 'Noah', 'p2')
+            graph.del_node('Noah')
+            graph.add_node('Ava', age=30, replace=True)
+            graph.add_edge('Ava', 'Liam', 'p1', replace=True, amount=150)
+            rebuilt = pickle.loads(pickle.dumps(graph))
+            assert graph.fingerprint() == rebuilt.fingerprint() and graph == rebuilt
+
+    def test_snapshot(self):
+        """Snapshot has fingerprint of graph and updates it independently"""
+        graph = _graph(UndirectedGraph)
+        fingerprint = graph.fingerprint()
+        snapshot = graph.snapshot()
+        snapshot.add_edge('Emma', 'Ava', 'p5')
+        assert (graph.fingerprint() == fingerprint
+            and snapshot.fingerprint() != fingerprint)
+
+    def test_eq_ignores_stale_fingerprint(self):
+        """Graphs with equal dicts are equal even if fingerprint of one graph
+        is stale (attribute dict changed in place)"""
+        first = _graph(DirectedGraph)
+        second = _graph(DirectedGraph)
+        second.add_node('Emma', age=24, replace=True)
+        first.fingerprint()
+        second.fingerprint()
+        second.nodes['Emma']['age'] = 23
+        assert first.nodes == second.nodes and first == second
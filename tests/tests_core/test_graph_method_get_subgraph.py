@@ -48,10 +48,10 @@ class TestsDirectedGraphMethodGetSubgraph:
         graph.add_edge('Adrian', 'Milani', '2024-12-18', amount=1200)
         graph.add_edge('Presley', 'Adrian', '2024-11-03', amount=2100)
         subgraph = graph.get_subgraph(['Milani', 'Adrian'])
-        assert (subgraph.nodes['Milani']['degree'] == 1
-            and subgraph.nodes['Milani']['neighbors'] == set()
-            and subgraph.nodes['Adrian']['degree'] == 1
-            and subgraph.nodes['Adrian']['neighbors'] == {'Milani'})
+        assert (subgraph.degree('Milani') == 1
+            and set(subgraph.neighbors('Milani')) == set()
+            and subgraph.degree('Adrian') == 1
+            and set(subgraph.neighbors('Adrian')) == {'Milani'})
 
 
 class TestsUndirectedGraphMethodGetSubgraph:
@@ -99,7 +99,7 @@ class TestsUndirectedGraphMethodGetSubgraph:
         graph.add_edge('Adrian', 'Milani', '2024-12-18', amount=1200)
         graph.add_edge('Presley', 'Adrian', '2024-11-03', amount=2100)
         subgraph = graph.get_subgraph(['Milani', 'Adrian'])
-        assert (subgraph.nodes['Milani']['degree'] == 1
-            and subgraph.nodes['Milani']['neighbors'] == {'Adrian'}
-            and subgraph.nodes['Adrian']['degree'] == 1
-            and subgraph.nodes['Adrian']['neighbors'] == {'Milani'})
+        assert (subgraph.degree('Milani') == 1
+            and set(subgraph.neighbors('Milani')) == {'Adrian'}
+            and subgraph.degree('Adrian') == 1
+            and set(subgraph.neighbors('Adrian')) == {'Milani'})
@@ -105,3 +105,33 @@ class TestsUndirectedGraphMethodHasEdge:
         graph.add_edge('Jonathan', 'Alina', '0bac3283bf')
         result = graph.has_edge('Jonathan', 'Alina', '60fa4fa6bf')
         assert result is False
+
+
+class TestsUndirectedGraphCoupleRepresentation:
+    """Tests of UndirectedGraph couple representation (swap and interning)"""
+
+    def test_swap(self):
+        """Couple is sorted without interning for new couples"""
+        graph = UndirectedGraph()
+        assert (graph._couple_representation(('Jonathan', 'Alina')) == ('Alina', 'Jonathan')
+            and graph._couple_representation(('Alina', 'Alina')) == ('Alina', 'Alina'))
+
+    def test_interned(self):
+        """Both orientations of existing couple return key of edges"""
+        graph = UndirectedGraph()
+        graph.add_edge('Jonathan', 'Alina', '0bac3283bf')
+        key = next(iter(graph.edges))
+        assert (graph._couple_representation(('Jonathan', 'Alina')) is key
+            and graph._couple_representation(('Alina', 'Jonathan')) is key
+            and graph.couple_representation('Alina', 'Jonathan') is key
+            and graph.has_edge('Jonathan', 'Alina', '0bac3283bf'))
+
+    def test_interned_removed(self):
+        """Interned couples are removed with couple and with all edges"""
+        graph = UndirectedGraph()
+        graph.add_edge('Jonathan', 'Alina', '0bac3283bf')
+        graph.add_edge('Robert', 'Sienna', '60fa4fa6bf')
+        graph.del_edge('Alina', 'Jonathan')
+        after_del_edge = set(graph._couples) == {('Robert', 'Sienna'), ('Sienna', 'Robert')}
+        graph.clear_edges()
+        assert after_del_edge and graph._couples == {}
@@ -0,0 +1,89 @@
+"""Tests DirectedGraph and UndirectedGraph methods
+
+- `memory_usage`
+- `memory_report`
+
+- deep breakdown contains each component and total
+- sampled estimate is close to full measurement
+- indexes are measured on samples
+- report is sorted by saving
+"""
+
+import random
+from connectionz import DirectedGraph, UndirectedGraph
+
+
+def _random_graph(graph_class, number_of_edges=3_000):
+    """Creates random graph with attributes"""
+    generator = random.Random(39)
+    graph = graph_class()
+    for _ in range(number_of_edges):
+        graph.add_edge(
+            f'client_{generator.randrange(500)}', f'client_{generator.randrange(500)}',
+            amount=generator.randrange(1000))
+    return graph
+
+
+class TestsGraphMethodMemoryUsage:
+    """Tests of DirectedGraph and UndirectedGraph method `memory_usage`"""
+
+    def test_shallow(self):
+        """Only nodes and edges dicts are measured"""
+        usage = DirectedGraph(edges=[('Ava', 'Liam')]).memory_usage(deep=False)
+        assert (usage['total'] == usage['nodes_dict'] + usage['edges_dict'] > 0
+            and usage['attributes'] == usage['derived'] == 0)
+
+    def test_deep(self):
+        """All components are measured and sum up to total"""
+        usage = _random_graph(UndirectedGraph).memory_usage()
+        components = {key: value for key, value in usage.items() if key != 'total'}
+        assert (all(value > 0 for value in components.values())
+            and sum(components.values()) == usage['total'])
+
+    def test_derived(self):
+        """Derived structures are degree and adjacency, node attributes are
+        not derived"""
+        graph = _random_graph(DirectedGraph)
+        before = graph.memory_usage()['derived']
+        for attributes in graph.nodes.values():
+            attributes['age'] = 30
+        after = graph.memory_usage()
+        assert before == after['derived'] > 0 and after['attributes'] > 0
+
+    def test_sampling(self):
+        """Sampled estimate is close to full measurement"""
+        graph = _random_graph(DirectedGraph)
+        full = graph.memory_usage()
+        sampled = graph.memory_usage(sample_size=200)
+        assert abs(sampled['total'] - full['total']) / full['total'] < 0.1
+
+    def test_sampling_of_indexes(self, monkeypatch):
+        """Sampled estimate of graph with index of many buckets is close to
+        full measurement"""
+        monkeypatch.setattr('connectionz.core.indexes.SortedIndex.bucket_size', 50)
+        graph = _random_graph(DirectedGraph)
+        graph.create_index('amount', target='edges', kind='sorted')
+        full = graph.memory_usage(sample_size=100_000)
+        sampled = graph.memory_usage(sample_size=200)
+        assert (sampled['internal'] > 0
+            and abs(sampled['internal'] - full['internal']) / full['internal'] < 0.3
+            and abs(sampled['total'] - full['total']) / full['total'] < 0.1)
+
+
+class TestsGraphMethodMemoryReport:
+    """Tests of DirectedGraph and UndirectedGraph method `memory_report`"""
+
+    def test_report(self):
+        """Each representation is estimated, rows are sorted by saving"""
+        report = _random_graph(DirectedGraph).memory_report()
+        savings = [row['saving'] for row in report]
+        assert ({row['representation'] for row in report} == {
+                'counter identifiers', 'CSR adjacency', 'columnar attributes'}
+            and savings == sorted(savings, reverse=True)
+            and all(0 <= row['share'] < 1 for row in report))
+
+    def test_empty_graph(self):
+        """Savings of empty graph are not more than its size"""
+        graph = UndirectedGraph()
+        total = graph.memory_usage()['total']
+        assert all(0 <= row['saving'] <= total for row in graph.memory_report())
@@ -0,0 +1,111 @@
+"""Tests DirectedGraph and UndirectedGraph pickling"""
+
+import pickle
+from connectionz import (
+    DirectedGraph, UndirectedGraph, CounterIdentifierGenerator)
+
+
+def _graph(graph_class):
+    graph = graph_class(nodes=['Emma'], identifier_generator=CounterIdentifierGenerator('e'))
+    graph.add_node('Ava', age=23)
+    graph.add_edge('Ava', 'Liam', 'p1', amount=100, date='2024-03-08')
+    graph.add_edge('Liam', 'Ava', 'p2', amount=200, date='2024-07-23')
+    graph.add_edge('Liam', 'Noah', 'p3', amount=300, date='2024-04-16')
+    graph.add_edge('Noah', 'Noah', 'p4', amount=400, date='2024-05-01')
+    return graph
+
+
+class TestsDirectedGraphPickle:
+    """Tests of DirectedGraph pickling"""
+
+    def test_pickled_graph_is_equal(self):
+        """Unpickled graph is equal to graph with all protocols"""
+        graph = _graph(DirectedGraph)
+        assert all(
+            pickle.loads(pickle.dumps(graph, protocol)) == graph
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1))
+
+    def test_adjacency_is_rebuilt(self):
+        """Adjacency is rebuilt on load"""
+        unpickled = pickle.loads(pickle.dumps(_graph(DirectedGraph)))
+        assert (unpickled.out_degree('Liam') == 2
+            and unpickled.in_degree('Ava') == 1
+            and set(unpickled.successors('Liam')) == {'Ava', 'Noah'}
+            and set(unpickled.predecessors('Noah')) == {'Liam', 'Noah'}
+            and unpickled.degree('Noah') == 3
+            and set(unpickled.neighbors('Liam')) == {'Ava', 'Noah'})
+
+    def test_calculated_attributes_are_not_pickled(self):
+        """State does not contain calculated attributes"""
+        state = _graph(DirectedGraph).__getstate__()
+        assert all(
+            'degree' not in attributes and 'neighbors' not in attributes
+            for attributes in state['node_attributes'])
+
+    def test_out_of_band_buffers(self):
+        """Arrays of structure are pickled as out-of-band buffers with
+        protocol 5"""
+        graph = _graph(DirectedGraph)
+        buffers = []
+        data = pickle.dumps(graph, protocol=5, buffer_callback=buffers.append)
+        assert (len(buffers) == 2
+            and pickle.loads(data, buffers=buffers) == graph)
+
+    def test_indexes_are_rebuilt(self):
+        """Indexes and temporal index are rebuilt on load"""
+        graph = _graph(DirectedGraph)
+        graph.create_index('age')
+        graph.create_index('amount', target='edges', kind='sorted')
+        graph.create_temporal_index()
+        unpickled = pickle.loads(pickle.dumps(graph))
+        assert (unpickled.find_nodes(age=23) == {'Ava': graph.nodes['Ava']}
+            and unpickled.find_edges(amount__gte=300) == graph.find_edges(amount__gte=300)
+            and unpickled.get_edges_by_time('2024-04-01', '2024-05-31')
+                == graph.get_edges_by_time('2024-04-01', '2024-05-31'))
+
+    def test_identifier_generator_is_pickled(self):
+        """Unpickled graph continues identifier generator"""
+        graph = _graph(DirectedGraph)
+        graph.add_edge('Ava', 'Emma')
+        unpickled = pickle.loads(pickle.dumps(graph))
+        assert unpickled.add_edge('Ava', 'Emma') == graph.add_edge('Ava', 'Emma') == 'e1'
+
+    def test_not_picklable_identifier_generator(self):
+        """Graph with lambda generator is pickled, unpickled graph uses the
+        default generator"""
+        generator = CounterIdentifierGenerator('e')
+        graph = DirectedGraph(identifier_generator=lambda: generator())
+        graph.add_edge('Ava', 'Emma')
+        unpickled = pickle.loads(pickle.dumps(graph))
+        assert (unpickled == graph
+            and len(unpickled.add_edge('Ava', 'Emma')) == 32)
+
+    def test_empty_couple(self):
+        """Couple without edges is kept"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1')
+        graph.del_edge('Ava', 'Liam', 'p1')
+        unpickled = pickle.loads(pickle.dumps(graph))
+        assert (unpickled == graph
+            and unpickled.has_edge('Ava', 'Liam')
+            and unpickled.out_degree('Ava') == 0)
+
+
+class TestsUndirectedGraphPickle:
+    """Tests of UndirectedGraph pickling"""
+
+    def test_pickled_graph_is_equal(self):
+        """Unpickled graph is equal to graph with all protocols"""
+        graph = _graph(UndirectedGraph)
+        assert all(
+            pickle.loads(pickle.dumps(graph, protocol)) == graph
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1))
+
+    def test_couples_are_interned(self):
+        """Both orientations of couple are resolved after load"""
+        unpickled = pickle.loads(pickle.dumps(_graph(UndirectedGraph)))
+        unpickled.del_edge('Liam', 'Ava', 'p1')
+        assert (unpickled.has_edge('Ava', 'Liam', 'p2')
+            and not unpickled.has_edge('Liam', 'Ava', 'p1')
+            and unpickled.degree('Ava') == 1
+            and set(unpickled.neighbors('Noah')) == {'Liam', 'Noah'})
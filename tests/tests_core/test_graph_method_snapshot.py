@@ -0,0 +1,185 @@
+"""Tests DirectedGraph and UndirectedGraph methods `snapshot` and `copy`"""
+
+import copy as copy_module
+from connectionz import DirectedGraph, UndirectedGraph
+
+
+class TestsDirectedGraphMethodSnapshot:
+    """Tests of DirectedGraph method `snapshot`"""
+
+    def test_snapshot_is_equal(self):
+        """Snapshot is equal to graph and has the same type"""
+        graph = DirectedGraph(nodes=['Emma'])
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        graph.add_edge('Liam', 'Ava', 'p2', amount=200)
+        snapshot = graph.snapshot()
+        assert (snapshot == graph
+            and snapshot is not graph
+            and isinstance(snapshot, DirectedGraph))
+
+    def test_snapshot_shares_unchanged_dicts(self):
+        """Snapshot shares multiples and attribute dicts with graph"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        snapshot = graph.snapshot()
+        assert (snapshot.nodes is not graph.nodes
+            and snapshot.edges is not graph.edges
+            and snapshot.nodes['Ava'] is graph.nodes['Ava']
+            and snapshot.edges[('Ava', 'Liam')] is graph.edges[('Ava', 'Liam')])
+
+    def test_graph_changes_are_not_visible_in_snapshot(self):
+        """Changes of graph after snapshot do not change snapshot"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        graph.add_edge('Liam', 'Emma', 'p2', amount=200)
+        snapshot = graph.snapshot()
+        graph.add_edge('Ava', 'Liam', 'p3', amount=300)
+        graph.add_edge('Ava', 'Liam', 'p1', replace=True, amount=150)
+        graph.del_edge('Liam', 'Emma')
+        graph.add_node('Noah', age=30)
+        assert (set(snapshot.edges[('Ava', 'Liam')]) == {'p1'}
+            and snapshot.edges[('Ava', 'Liam')]['p1'] == {'amount': 100}
+            and snapshot.has_edge('Liam', 'Emma', 'p2')
+            and 'Noah' not in snapshot.nodes
+            and snapshot.degree('Ava') == 1
+            and set(snapshot.neighbors('Liam')) == {'Emma'}
+            and snapshot.out_degree('Ava') == 1
+            and set(snapshot.successors('Liam')) == {'Emma'}
+            and graph.degree('Ava') == 2
+            and set(graph.neighbors('Liam')) == set()
+            and graph.out_degree('Ava') == 2
+            and set(graph.successors('Liam')) == set())
+
+    def test_snapshot_changes_are_not_visible_in_graph(self):
+        """Changes of snapshot do not change graph"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        snapshot = graph.snapshot()
+        snapshot.add_edge('Ava', 'Liam', 'p2', amount=300)
+        snapshot.del_node('Liam')
+        assert (set(graph.edges[('Ava', 'Liam')]) == {'p1'}
+            and 'Liam' in graph.nodes
+            and set(graph.neighbors('Ava')) == {'Liam'}
+            and graph.out_degree('Ava') == 1
+            and graph.in_degree('Liam') == 1
+            and 'Liam' not in snapshot.nodes
+            and snapshot.degree('Ava') == 0)
+
+    def test_unchanged_dicts_stay_shared(self):
+        """Only changed multiples are copied, node attribute dicts are not
+        changed by adding edge"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        graph.add_edge('Emma', 'Noah', 'p2', amount=200)
+        snapshot = graph.snapshot()
+        snapshot.add_edge('Ava', 'Liam', 'p3', amount=300)
+        assert (snapshot.edges[('Emma', 'Noah')] is graph.edges[('Emma', 'Noah')]
+            and snapshot.nodes['Emma'] is graph.nodes['Emma']
+            and snapshot.edges[('Ava', 'Liam')] is not graph.edges[('Ava', 'Liam')]
+            and snapshot.nodes['Ava'] is graph.nodes['Ava'])
+
+    def test_snapshot_of_snapshot(self):
+        """Snapshots of snapshot are independent of each other"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1')
+        first = graph.snapshot()
+        second = first.snapshot()
+        first.add_edge('Ava', 'Liam', 'p2')
+        second.del_edge('Ava', 'Liam', 'p1')
+        assert (set(graph.edges[('Ava', 'Liam')]) == {'p1'}
+            and set(first.edges[('Ava', 'Liam')]) == {'p1', 'p2'}
+            and set(second.edges[('Ava', 'Liam')]) == set()
+            and graph.out_degree('Ava') == 1
+            and first.out_degree('Ava') == 2
+            and second.out_degree('Ava') == 0)
+
+    def test_snapshot_indexes_are_independent(self):
+        """Indexes of snapshot are copied and kept in sync with snapshot"""
+        graph = DirectedGraph()
+        graph.add_node('Ava', city='Rome')
+        graph.create_index('city')
+        graph.add_edge('Ava', 'Liam', 'p1', date='2024-01-01')
+        graph.create_temporal_index()
+        snapshot = graph.snapshot()
+        snapshot.add_node('Emma', city='Rome')
+        snapshot.add_edge('Emma', 'Ava', 'p2', date='2024-02-01')
+        assert (set(graph.find_nodes(city='Rome')) == {'Ava'}
+            and set(snapshot.find_nodes(city='Rome')) == {'Ava', 'Emma'}
+            and len(graph.get_edges_by_time()) == 1
+            and len(snapshot.get_edges_by_time()) == 2)
+
+    def test_copy(self):
+        """Copy is equal and independent of graph"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        copy = graph.copy()
+        equal = copy == graph
+        copy.add_edge('Liam', 'Ava', 'p2')
+        assert (equal
+            and not graph.has_edge('Liam', 'Ava')
+            and copy.has_edge('Liam', 'Ava'))
+
+    def test_copy_module(self):
+        """Function `copy.copy` returns snapshot of graph"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        snapshot = copy_module.copy(graph)
+        snapshot.add_edge('Ava', 'Liam', 'p2')
+        assert (len(graph.edges[('Ava', 'Liam')]) == 1
+            and snapshot.degree('Ava') == 2
+            and graph.degree('Ava') == 1)
+
+
+class TestsUndirectedGraphMethodSnapshot:
+    """Tests of UndirectedGraph method `snapshot`"""
+
+    def test_snapshot_is_equal(self):
+        """Snapshot is equal to graph and has the same type"""
+        graph = UndirectedGraph(nodes=['Emma'])
+        graph.add_edge('Liam', 'Ava', 'p1', amount=100)
+        snapshot = graph.snapshot()
+        assert (snapshot == graph
+            and isinstance(snapshot, UndirectedGraph)
+            and snapshot.has_edge('Ava', 'Liam'))
+
+    def test_graph_changes_are_not_visible_in_snapshot(self):
+        """Changes of graph after snapshot do not change snapshot"""
+        graph = UndirectedGraph()
+        graph.add_edge('Liam', 'Ava', 'p1', amount=100)
+        snapshot = graph.snapshot()
+        graph.add_edge('Ava', 'Liam', 'p2', amount=200)
+        graph.del_edge('Liam', 'Ava', 'p1')
+        graph.add_edge('Emma', 'Ava', 'p3')
+        assert (set(snapshot.edges[('Ava', 'Liam')]) == {'p1'}
+            and not snapshot.has_edge('Ava', 'Emma')
+            and snapshot.degree('Ava') == 1
+            and set(snapshot.neighbors('Ava')) == {'Liam'}
+            and set(graph.edges[('Ava', 'Liam')]) == {'p2'}
+            and graph.degree('Ava') == 2
+            and set(graph.neighbors('Ava')) == {'Liam', 'Emma'})
+
+    def test_snapshot_changes_are_not_visible_in_graph(self):
+        """Changes of snapshot do not change graph"""
+        graph = UndirectedGraph()
+        graph.add_edge('Liam', 'Ava', 'p1', amount=100)
+        snapshot = graph.snapshot()
+        snapshot.del_edge('Ava', 'Liam')
+        snapshot.add_edge('Liam', 'Ava', 'p2')
+        assert (set(graph.edges[('Ava', 'Liam')]) == {'p1'}
+            and set(snapshot.edges[('Ava', 'Liam')]) == {'p2'}
+            and graph.has_edge('Liam', 'Ava', 'p1'))
+
+    def test_deep_copy(self):
+        """Attribute dicts of deep copy can be changed in place without
+        changing graph, deep copy is changed by graph methods independently"""
+        graph = UndirectedGraph()
+        graph.add_node('Ava', age=23)
+        graph.add_edge('Liam', 'Ava', 'p1', amount=100)
+        copy = graph.copy(deep=True)
+        copy.nodes['Ava']['age'] = 24
+        copy.edges[('Ava', 'Liam')]['p1']['amount'] = 200
+        copy.add_edge('Ava', 'Liam', 'p2')
+        assert (graph.nodes['Ava'] == {'age': 23}
+            and graph.edges == {('Ava', 'Liam'): {'p1': {'amount': 100}}}
+            and copy.degree('Ava') == 2
+            and graph.degree('Ava') == 1)
@@ -0,0 +1,107 @@
+"""Tests DirectedGraph and UndirectedGraph method `subgraph_view`
+
+- node-induced, node-filtered and edge-filtered views
+- view does not copy and follows parent mutations
+- view is read-only
+- degree and neighbors are calculated lazily
+- `copy` materializes view as independent graph
+"""
+
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph, SubgraphView
+from connectionz.exceptions import NodeIsNotExistsException
+
+
+def _payments(graph_class):
+    """Creates graph with payments"""
+    graph = graph_class()
+    graph.add_node('Ava', age=23)
+    graph.add_node('Liam', age=31)
+    graph.add_edge('Juliana', 'Roman', 'p1', amount=1700)
+    graph.add_edge('Adrian', 'Diana', 'p2', amount=2400)
+    graph.add_edge('Adrian', 'Milani', 'p3', amount=1200)
+    graph.add_edge('Adrian', 'Milani', 'p4', amount=5200)
+    graph.add_edge('Presley', 'Adrian', 'p5', amount=2100)
+    graph.add_edge('Ava', 'Liam', 'p6', amount=900)
+    return graph
+
+
+class TestsDirectedGraphMethodSubgraphView:
+    """Tests of DirectedGraph method `subgraph_view`"""
+
+    def test_node_induced_view(self):
+        """View with selected nodes and edges between them"""
+        graph = _payments(DirectedGraph)
+        view = graph.subgraph_view(['Milani', 'Adrian', 'Presley', 'Brooklyn'])
+        assert (isinstance(view, SubgraphView)
+            and set(view.nodes) == {'Milani', 'Adrian', 'Presley'}
+            and set(view.edges) == {('Adrian', 'Milani'), ('Presley', 'Adrian')}
+            and set(view.edges[('Adrian', 'Milani')]) == {'p3', 'p4'}
+            and view.has_edge('Presley', 'Adrian', 'p5')
+            and not view.has_edge('Adrian', 'Diana')
+            and not view.has_node('Brooklyn'))
+
+    def test_predicate_views(self):
+        """Views with node filter and edge filter"""
+        graph = _payments(DirectedGraph)
+        view = graph.subgraph_view(
+            node_filter=lambda identifier, attributes: 'age' not in attributes,
+            edge_filter=lambda node_l, node_r, identifier, attributes:
+                attributes['amount'] >= 2000)
+        assert (set(view.nodes) == set(graph.nodes) - {'Ava', 'Liam'}
+            and dict((couple, set(multiples)) for couple, multiples in view.edges.items())
+                == {('Adrian', 'Diana'): {'p2'}, ('Adrian', 'Milani'): {'p4'},
+                    ('Presley', 'Adrian'): {'p5'}}
+            and ('Juliana', 'Roman') not in view.edges)
+
+    def test_view_is_read_only_and_not_copied(self):
+        """View exposes parent attributes without copying and can not change them"""
+        graph = _payments(DirectedGraph)
+        view = graph.subgraph_view(['Ava', 'Liam'])
+        with pytest.raises(TypeError):
+            view.nodes['Ava']['age'] = 33
+        with pytest.raises(TypeError):
+            view.edges[('Ava', 'Liam')]['p6']['amount'] = 0
+        graph.nodes['Ava']['age'] = 24
+        assert view.nodes['Ava']['age'] == 24
+
+    def test_lazy_degree_and_neighbors(self):
+        """Degree and neighbors are calculated in view and follow parent"""
+        graph = _payments(DirectedGraph)
+        view = graph.subgraph_view(['Milani', 'Adrian', 'Presley'])
+        assert (view.degree('Adrian') == 3
+            and view.neighbors('Adrian') == {'Milani'}
+            and view.neighbors('Presley') == {'Adrian'})
+        graph.del_edge('Adrian', 'Milani', 'p3')
+        assert view.degree('Adrian') == 2
+        with pytest.raises(NodeIsNotExistsException):
+            view.degree('Diana')
+
+    def test_copy(self):
+        """Materializing view as independent graph"""
+        graph = _payments(DirectedGraph)
+        subgraph = graph.subgraph_view(['Milani', 'Adrian']).copy()
+        subgraph.add_edge('Milani', 'Adrian', 'p7')
+        assert (isinstance(subgraph, DirectedGraph)
+            and set(subgraph.nodes) == {'Milani', 'Adrian'}
+            and subgraph.degree('Adrian') == 3
+            and not graph.has_edge('Milani', 'Adrian'))
+
+
+class TestsUndirectedGraphMethodSubgraphView:
+    """Tests of UndirectedGraph method `subgraph_view`"""
+
+    def test_node_induced_view(self):
+        """View with selected nodes uses couple representation"""
+        graph = _payments(UndirectedGraph)
+        view = graph.subgraph_view(['Milani', 'Adrian', 'Presley'])
+        assert (set(view.edges) == {('Adrian', 'Milani'), ('Adrian', 'Presley')}
+            and view.has_edge('Milani', 'Adrian')
+            and view.degree('Adrian') == 3
+            and view.neighbors('Milani') == {'Adrian'})
+
+    def test_copy_equals_get_subgraph(self):
+        """Materialized view equals subgraph"""
+        graph = _payments(UndirectedGraph)
+        selected = ['Milani', 'Adrian', 'Diana']
+        assert graph.subgraph_view(selected).copy() == graph.get_subgraph(selected)
@@ -1,6 +1,7 @@
 """Tests DirectedGraph and UndirectedGraph methods
 
 - `check_type`
+- `check_is_directed`
 - `check_is_complete`
 - `check_is_pseudo`
 - `check_is_multi`
@@ -23,6 +24,20 @@ class TestsGraphMethodCheckType:
         assert graph.check_type() == 'UndirectedGraph'
 
 
+class TestsGraphMethodCheckIsDirected:
+    """Tests of DirectedGraph and UndirectedGraph method `check_is_directed`"""
+
+    def test_directed_graph(self):
+        """Checks that DirectedGraph object is directed"""
+        graph = DirectedGraph()
+        assert graph.check_is_directed() is True
+
+    def test_undirected_graph(self):
+        """Checks that UndirectedGraph object is not directed"""
+        graph = UndirectedGraph()
+        assert graph.check_is_directed() is False
+
+
 class TestsDirectedGraphMethodCheckIsComplete:
     """Tests of DirectedGraph method `check_is_complete`"""
 
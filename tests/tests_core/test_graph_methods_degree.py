@@ -1,67 +1,91 @@
-"""Tests DirectedGraph and UndirectedGraph methods
+"""Tests DirectedGraph and UndirectedGraph method `degree`
 
-- `clear_degree`
-- `calc_degree`
+if (node not exists):
+    - raise NodeIsNotExistsException
+
+- degree is maintained when edges are added and removed
+- loop is counted twice
 """
 
-from connectionz import DirectedGraph, UndirectedGraph
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph, NodeIsNotExistsException
 
 
 class TestsDirectedGraphMethodDegree:
-    """Tests of DirectedGraph methods `clear_degree` and `calc_degree`"""
+    """Tests of DirectedGraph method `degree`"""
+
+    def test_degree(self):
+        """Degree of all nodes in graph"""
+        graph = DirectedGraph()
+        graph.add_edge('Logan', 'Violet')
+        graph.add_edge('Jacob', 'Grace')
+        graph.add_edge('Jacob', 'Riley')
+        graph.add_node('Mia')
+        assert (graph.degree('Logan') == 1
+            and graph.degree('Violet') == 1
+            and graph.degree('Jacob') == 2
+            and graph.degree('Grace') == 1
+            and graph.degree('Riley') == 1
+            and graph.degree('Mia') == 0)
+
+    def test_degree_after_deleting(self):
+        """Degree is updated after deleting edge and node"""
+        graph = DirectedGraph()
+        graph.add_edge('Jacob', 'Grace', 'e1')
+        graph.add_edge('Jacob', 'Grace', 'e2')
+        graph.add_edge('Riley', 'Jacob', 'e3')
+        graph.del_edge('Jacob', 'Grace', 'e1')
+        graph.del_node('Riley')
+        assert graph.degree('Jacob') == 1 and graph.degree('Grace') == 1
 
-    def test_clear_degree(self):
-        """Setting degree value to 0 for all nodes in graph"""
+    def test_loop(self):
+        """Loop is counted twice"""
         graph = DirectedGraph()
-        graph.add_edge('Logan', 'Violet', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Grace', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Riley', recalculate_calculated_attributes=False)
-        graph.clear_degree()
-        assert (graph.nodes['Logan']['degree'] == 0
-            and graph.nodes['Violet']['degree'] == 0
-            and graph.nodes['Jacob']['degree'] == 0
-            and graph.nodes['Grace']['degree'] == 0
-            and graph.nodes['Riley']['degree'] == 0)
+        graph.add_edge('Logan', 'Logan')
+        assert graph.degree('Logan') == 2
 
-    def test_calc_degree(self):
-        """Calculating degree value for all nodes in graph"""
+    def test_exception_node_is_not_exists(self):
+        """Expected raise NodeIsNotExistsException"""
         graph = DirectedGraph()
-        graph.add_edge('Logan', 'Violet', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Grace', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Riley', recalculate_calculated_attributes=False)
-        graph.calc_degree()
-        assert (graph.nodes['Logan']['degree'] == 1
-            and graph.nodes['Violet']['degree'] == 1
-            and graph.nodes['Jacob']['degree'] == 2
-            and graph.nodes['Grace']['degree'] == 1
-            and graph.nodes['Riley']['degree'] == 1)
+        with pytest.raises(NodeIsNotExistsException):
+            graph.degree('Logan')
 
 
 class TestsUndirectedGraphMethodDegree:
-    """Tests of UndirectedGraph methods `clear_degree` and `calc_degree`"""
+    """Tests of UndirectedGraph method `degree`"""
+
+    def test_degree(self):
+        """Degree of all nodes in graph"""
+        graph = UndirectedGraph()
+        graph.add_edge('Logan', 'Violet')
+        graph.add_edge('Jacob', 'Grace')
+        graph.add_edge('Jacob', 'Riley')
+        graph.add_node('Mia')
+        assert (graph.degree('Logan') == 1
+            and graph.degree('Violet') == 1
+            and graph.degree('Jacob') == 2
+            and graph.degree('Grace') == 1
+            and graph.degree('Riley') == 1
+            and graph.degree('Mia') == 0)
+
+    def test_degree_after_deleting(self):
+        """Degree is updated after deleting edge and node"""
+        graph = UndirectedGraph()
+        graph.add_edge('Jacob', 'Grace', 'e1')
+        graph.add_edge('Jacob', 'Grace', 'e2')
+        graph.add_edge('Riley', 'Jacob', 'e3')
+        graph.del_edge('Jacob', 'Grace', 'e1')
+        graph.del_node('Riley')
+        assert graph.degree('Jacob') == 1 and graph.degree('Grace') == 1
 
-    def test_clear_degree(self):
-        """Setting degree value to 0 for all nodes in graph"""
+    def test_loop(self):
+        """Loop is counted twice"""
         graph = UndirectedGraph()
-        graph.add_edge('Logan', 'Violet', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Grace', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Riley', recalculate_calculated_attributes=False)
-        graph.clear_degree()
-        assert (graph.nodes['Logan']['degree'] == 0
-            and graph.nodes['Violet']['degree'] == 0
-            and graph.nodes['Jacob']['degree'] == 0
-            and graph.nodes['Grace']['degree'] == 0
-            and graph.nodes['Riley']['degree'] == 0)
+        graph.add_edge('Logan', 'Logan')
+        assert graph.degree('Logan') == 2
 
-    def test_calc_degree(self):
-        """Calculating degree value for all nodes in graph"""
+    def test_exception_node_is_not_exists(self):
+        """Expected raise NodeIsNotExistsException"""
         graph = UndirectedGraph()
-        graph.add_edge('Logan', 'Violet', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Grace', recalculate_calculated_attributes=False)
-        graph.add_edge('Jacob', 'Riley', recalculate_calculated_attributes=False)
-        graph.calc_degree()
-        assert (graph.nodes['Logan']['degree'] == 1
-            and graph.nodes['Violet']['degree'] == 1
-            and graph.nodes['Jacob']['degree'] == 2
-            and graph.nodes['Grace']['degree'] == 1
-            and graph.nodes['Riley']['degree'] == 1)
+        with pytest.raises(NodeIsNotExistsException):
+            graph.degree('Logan')
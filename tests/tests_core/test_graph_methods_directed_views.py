@@ -0,0 +1,120 @@
+"""Tests DirectedGraph methods
+
+- `reverse_view`
+- `to_undirected_view`
+
+- views are created without copying and follow parent mutations
+- views are read-only
+- predecessors and successors queries
+- undirected view merges multiples of (a, b) and (b, a)
+"""
+
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph, ReverseView, UndirectedView
+from connectionz.exceptions import NodeIsNotExistsException
+
+
+def _payments():
+    """Creates graph with payments in both directions"""
+    graph = DirectedGraph(nodes=['Emma'])
+    graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+    graph.add_edge('Ava', 'Liam', 'p2', amount=200)
+    graph.add_edge('Liam', 'Ava', 'p3', amount=300)
+    graph.add_edge('Noah', 'Liam', 'p4', amount=400)
+    graph.add_edge('Noah', 'Noah', 'p5', amount=500)
+    return graph
+
+
+class TestsDirectedGraphMethodReverseView:
+    """Tests of DirectedGraph method `reverse_view`"""
+
+    def test_reversed_couples(self):
+        """Couples are reversed, multiples are the same"""
+        graph = _payments()
+        view = graph.reverse_view()
+        assert (isinstance(view, ReverseView)
+            and set(view.edges) == {
+                ('Liam', 'Ava'), ('Ava', 'Liam'), ('Liam', 'Noah'), ('Noah', 'Noah')}
+            and set(view.edges[('Liam', 'Ava')]) == {'p1', 'p2'}
+            and view.has_edge('Liam', 'Noah', 'p4')
+            and not view.has_edge('Noah', 'Liam')
+            and len(view) == 4)
+
+    def test_successors_and_predecessors(self):
+        """Successors of view are predecessors of graph"""
+        graph = _payments()
+        view = graph.reverse_view()
+        assert (view.successors('Liam') == {'Ava', 'Noah'}
+            and view.predecessors('Liam') == {'Ava'}
+            and view.neighbors('Emma') == frozenset()
+            and view.degree('Liam') == 4)
+        with pytest.raises(NodeIsNotExistsException):
+            view.successors('Brooklyn')
+
+    def test_follows_parent_and_read_only(self):
+        """View follows parent mutations and can not change attributes"""
+        graph = _payments()
+        view = graph.reverse_view()
+        assert view.predecessors('Emma') == frozenset()
+        graph.add_edge('Emma', 'Ava', 'p6')
+        assert (view.successors('Ava') == {'Emma', 'Liam'}
+            and view.has_edge('Ava', 'Emma', 'p6'))
+        with pytest.raises(TypeError):
+            view.edges[('Ava', 'Emma')]['p6']['amount'] = 1
+
+    def test_copy(self):
+        """Reversed copy reversed twice equals graph"""
+        graph = _payments()
+        assert graph.reverse_view().copy().reverse_view().copy() == graph
+
+
+class TestsDirectedGraphMethodToUndirectedView:
+    """Tests of DirectedGraph method `to_undirected_view`"""
+
+    def test_merged_couples(self):
+        """Couples (a, b) and (b, a) are merged into sorted couple"""
+        graph = _payments()
+        view = graph.to_undirected_view()
+        assert (isinstance(view, UndirectedView)
+            and set(view.edges) == {('Ava', 'Liam'), ('Liam', 'Noah'), ('Noah', 'Noah')}
+            and set(view.edges[('Liam', 'Ava')]) == {'p1', 'p2', 'p3'}
+            and view.edges[('Ava', 'Liam')]['p3']['amount'] == 300
+            and view.has_edge('Liam', 'Noah', 'p4')
+            and view.check_is_directed() is False)
+
+    def test_neighbors_and_degree(self):
+        """Neighbors in any direction, degree as in graph `degree`"""
+        graph = _payments()
+        view = graph.to_undirected_view()
+        assert (view.neighbors('Liam') == {'Ava', 'Noah'}
+            and view.neighbors('Noah') == {'Liam', 'Noah'}
+            and view.degree('Noah') == 3
+            and view.degree('Liam') == graph.degree('Liam'))
+
+    def test_copy(self):
+        """Materialized view equals UndirectedGraph built from the same edges"""
+        graph = _payments()
+        expected = UndirectedGraph(
+            nodes=['Emma'],
+            edges={
+                ('Ava', 'Liam'): {'p1': {'amount': 100}, 'p2': {'amount': 200}},
+                ('Liam', 'Ava'): {'p3': {'amount': 300}},
+                ('Noah', 'Liam'): {'p4': {'amount': 400}},
+                ('Noah', 'Noah'): {'p5': {'amount': 500}}})
+        assert graph.to_undirected_view().copy() == expected
+
+    def test_colliding_identifiers(self):
+        """Edges of couples (a, b) and (b, a) with the same identifier are
+        both in view and in copy"""
+        graph = DirectedGraph()
+        graph.add_edge('Ava', 'Liam', '2024-05-16', amount=100)
+        graph.add_edge('Liam', 'Ava', '2024-05-16', amount=200)
+        view = graph.to_undirected_view()
+        multiples = view.edges[('Ava', 'Liam')]
+        copy = view.copy()
+        assert (set(multiples) == {'2024-05-16', '2024-05-16@Liam->Ava'}
+            and len(multiples) == view.degree('Ava') == 2
+            and multiples['2024-05-16@Liam->Ava']['amount'] == 200
+            and view.has_edge('Liam', 'Ava', '2024-05-16@Liam->Ava')
+            and copy.degree('Ava') == 2)
+
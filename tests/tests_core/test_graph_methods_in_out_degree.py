@@ -0,0 +1,102 @@
+"""Tests DirectedGraph methods
+
+- `out_degree`
+- `in_degree`
+- `successors`
+- `predecessors`
+
+if (node not exists):
+    - raise NodeIsNotExistsException
+
+- adjacency is kept in sync on add_edge, del_edge, del_node, clear_edges
+- adjacency is the same as recalculated from edges
+"""
+
+import random
+import pytest
+from connectionz import DirectedGraph
+from connectionz.exceptions import NodeIsNotExistsException
+
+
+def _payments():
+    """Creates graph with payments"""
+    graph = DirectedGraph(nodes=['Emma'])
+    graph.add_edge('Ava', 'Liam', 'p1')
+    graph.add_edge('Ava', 'Liam', 'p2')
+    graph.add_edge('Ava', 'Noah', 'p3')
+    graph.add_edge('Liam', 'Ava', 'p4')
+    graph.add_edge('Noah', 'Noah', 'p5')
+    return graph
+
+
+class TestsDirectedGraphMethodsInOutDegree:
+    """Tests of DirectedGraph methods `out_degree`, `in_degree`,
+    `successors`, `predecessors`"""
+
+    def test_lookups(self):
+        """Degrees and adjacent nodes of each node"""
+        graph = _payments()
+        assert (graph.out_degree('Ava') == 3 and graph.in_degree('Ava') == 1
+            and graph.out_degree('Liam') == 1 and graph.in_degree('Liam') == 2
+            and graph.out_degree('Noah') == 1 and graph.in_degree('Noah') == 2
+            and graph.out_degree('Emma') == 0 and graph.in_degree('Emma') == 0
+            and graph.successors('Ava') == {'Liam', 'Noah'}
+            and graph.predecessors('Noah') == {'Ava', 'Noah'}
+            and graph.successors('Emma') == set()
+            and all(
+                graph.out_degree(node) + graph.in_degree(node) == graph.degree(node)
+                for node in ['Ava', 'Liam', 'Noah']))
+
+    def test_node_not_exists(self):
+        """Lookup of non-existing node"""
+        graph = _payments()
+        with pytest.raises(NodeIsNotExistsException):
+            graph.in_degree('Brooklyn')
+        with pytest.raises(NodeIsNotExistsException):
+            graph.predecessors('Brooklyn')
+
+    def test_mutations(self):
+        """Adjacency follows del_edge, del_node and clear_edges"""
+        graph = _payments()
+        graph.del_edge('Ava', 'Liam', 'p1')
+        after_del_edge = (
+            graph.successors('Ava') == {'Liam', 'Noah'} and graph.in_degree('Liam') == 1)
+        graph.del_edge('Ava', 'Liam', 'p2')
+        after_del_couple = (
+            graph.successors('Ava') == {'Noah'} and graph.predecessors('Liam') == set())
+        graph.del_node('Noah')
+        after_del_node = (
+            graph.successors('Ava') == set() and graph.out_degree('Ava') == 0)
+        graph.clear_edges()
+        after_clear = graph.out_degree('Liam') == 0 and graph.predecessors('Ava') == set()
+        assert after_del_edge and after_del_couple and after_del_node and after_clear
+
+    def test_random_mutations(self):
+        """Adjacency is the same as recalculated from edges"""
+        generator = random.Random(34)
+        graph = DirectedGraph()
+        nodes = [f'n{number}' for number in range(8)]
+        for step in range(400):
+            node_l, node_r = generator.choice(nodes), generator.choice(nodes)
+            if generator.random() < 0.6:
+                graph.add_edge(
+                    node_l, node_r, str(generator.randrange(3)), replace=True,
+                    recalculate_calculated_attributes=False)
+            elif graph.has_edge(node_l, node_r):
+                identifier = generator.choice([None, *graph.edges[(node_l, node_r)]])
+                graph.del_edge(
+                    node_l, node_r, identifier, recalculate_calculated_attributes=False)
+            elif step % 50 == 0 and graph.has_node(node_l):
+                graph.del_node(node_l, recalculate_calculated_attributes=False)
+        assert all(
+            graph.out_degree(node) == sum(
+                len(multiples) for (tail, _), multiples in graph.edges.items() if tail == node)
+            and graph.in_degree(node) == sum(
+                len(multiples) for (_, head), multiples in graph.edges.items() if head == node)
+            and graph.successors(node) == {
+                head for (tail, head), multiples in graph.edges.items()
+                if tail == node and multiples}
+            and graph.predecessors(node) == {
+                tail for (tail, head), multiples in graph.edges.items()
+                if head == node and multiples}
+            for node in graph.nodes)
@@ -0,0 +1,156 @@
+"""Tests DirectedGraph and UndirectedGraph methods
+
+- `create_index`
+- `drop_index`
+- `find_nodes`
+- `find_edges`
+
+if (wrong kind of index):
+    - raise WrongKindOfIndexException
+
+if (wrong target of index):
+    - raise WrongTargetOfIndexException
+
+if (value is not comparable with values of sorted index):
+    - raise WrongTypeOfIndexedValueException, graph is not changed
+
+if (index not exists):
+    - raise IndexIsNotExistsException
+
+- results are the same with and without indexes
+- indexes are kept in sync on add_node (replace), del_node, add_edge, del_edge
+"""
+
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph
+from connectionz.exceptions import (
+    WrongKindOfIndexException,
+    WrongTargetOfIndexException,
+    WrongTypeOfIndexedValueException,
+    IndexIsNotExistsException)
+
+
+def _clients(graph_class):
+    """Creates graph with clients and payments"""
+    graph = graph_class()
+    graph.add_node('Ava', age=23, city='Voronezh')
+    graph.add_node('Liam', age=31, city='Lipetsk')
+    graph.add_node('Noah', age=45, city='Voronezh')
+    graph.add_node('Emma', city='Ryazan')
+    graph.add_edge('Ava', 'Liam', 'p1', amount=9000)
+    graph.add_edge('Ava', 'Liam', 'p2', amount=15000)
+    graph.add_edge('Noah', 'Emma', 'p3', amount=10000, currency='RUB')
+    graph.add_edge('Emma', 'Liam', 'p4')
+    return graph
+
+
+class TestsDirectedGraphMethodsIndexes:
+    """Tests of DirectedGraph secondary indexes"""
+
+    def test_exceptions(self):
+        """Creating and dropping wrong indexes"""
+        graph = _clients(DirectedGraph)
+        with pytest.raises(WrongKindOfIndexException):
+            graph.create_index('age', kind='bitmap')
+        with pytest.raises(WrongTargetOfIndexException):
+            graph.create_index('age', target='couples')
+        with pytest.raises(IndexIsNotExistsException):
+            graph.drop_index('age')
+
+    @pytest.mark.parametrize('kind', [None, 'hash', 'sorted'])
+    def test_find_nodes(self, kind):
+        """Finding nodes by equality and range conditions"""
+        graph = _clients(DirectedGraph)
+        if kind is not None:
+            graph.create_index('age', kind=kind)
+            graph.create_index('city', kind=kind)
+        assert (set(graph.find_nodes(city='Voronezh')) == {'Ava', 'Noah'}
+            and set(graph.find_nodes(age__gt=30)) == {'Liam', 'Noah'}
+            and set(graph.find_nodes(age__gte=31, age__lt=45)) == {'Liam'}
+            and set(graph.find_nodes(city='Voronezh', age__lte=23)) == {'Ava'}
+            and graph.find_nodes(city='Moscow') == {}
+            and graph.find_nodes(age='thirty') == {})
+
+    @pytest.mark.parametrize('kind', [None, 'hash', 'sorted'])
+    def test_find_edges(self, kind):
+        """Finding edges by equality and range conditions"""
+        graph = _clients(DirectedGraph)
+        if kind is not None:
+            graph.create_index('amount', target='edges', kind=kind)
+        assert (graph.find_edges(amount__gte=10000) == {
+                ('Ava', 'Liam'): {'p2': {'amount': 15000}},
+                ('Noah', 'Emma'): {'p3': {'amount': 10000, 'currency': 'RUB'}}}
+            and graph.find_edges(amount=9000) == {('Ava', 'Liam'): {'p1': {'amount': 9000}}}
+            and set(graph.find_edges(amount__lt=20000, currency='RUB')) == {('Noah', 'Emma')})
+
+    def test_indexes_in_sync_with_mutations(self):
+        """Indexes follow graph mutations"""
+        graph = _clients(DirectedGraph)
+        graph.create_index('age', kind='sorted')
+        graph.create_index('city')
+        graph.create_index('amount', target='edges', kind='sorted')
+        graph.add_node('Ava', age=52, city='Moscow', replace=True)
+        graph.del_node('Noah')
+        graph.add_edge('Liam', 'Ava', 'p5', amount=12000)
+        graph.del_edge('Ava', 'Liam', 'p2')
+        assert (set(graph.find_nodes(age__gt=30)) == {'Liam', 'Ava'}
+            and graph.find_nodes(city='Voronezh') == {}
+            and set(graph.find_nodes(city='Moscow')) == {'Ava'}
+            and graph.find_edges(amount__gte=10000) == {
+                ('Liam', 'Ava'): {'p5': {'amount': 12000}}})
+        graph.clear_nodes()
+        assert graph.find_nodes(city='Moscow') == {} and graph.find_edges(amount=12000) == {}
+
+    def test_exception_wrong_type_of_indexed_value(self):
+        """Adding node or edge with value not comparable with values of sorted
+        index
+            - node and edge should not be added or replaced
+            - expected raise WrongTypeOfIndexedValueException
+        """
+        graph = _clients(DirectedGraph)
+        graph.create_index('age', kind='sorted')
+        graph.create_index('amount', target='edges', kind='sorted')
+        expected = graph.copy()
+        with pytest.raises(WrongTypeOfIndexedValueException):
+            graph.add_node('Mia', age=None)
+        with pytest.raises(WrongTypeOfIndexedValueException):
+            graph.add_node('Ava', age='23', replace=True)
+        with pytest.raises(WrongTypeOfIndexedValueException):
+            graph.add_edge('Mia', 'Ava', 'p5', amount='100')
+        assert (graph == expected
+            and set(graph.find_nodes(age__gt=0)) == {'Ava', 'Liam', 'Noah'}
+            and len(graph.find_edges(amount__gt=0)) == 2)
+
+    def test_sorted_index_with_many_buckets(self, monkeypatch):
+        """Sorted index split into buckets follows mutations"""
+        monkeypatch.setattr('connectionz.core.indexes.SortedIndex.bucket_size', 2)
+        graph = DirectedGraph()
+        graph.create_index('amount', target='edges', kind='sorted')
+        for number in range(20):
+            graph.add_edge('Ava', 'Liam', f'p{number}', amount=number % 7)
+        for number in range(0, 20, 3):
+            graph.del_edge('Ava', 'Liam', f'p{number}')
+        expected = {
+            f'p{number}' for number in range(20)
+            if number % 3 and 2 <= number % 7 < 5}
+        assert (set(graph.find_edges(amount__gte=2, amount__lt=5)[('Ava', 'Liam')]) == expected
+            and len(graph._edge_indexes['amount']) == 13)
+
+    def test_drop_index(self):
+        """Finding after dropping index falls back to full scan"""
+        graph = _clients(DirectedGraph)
+        graph.create_index('city')
+        graph.drop_index('city')
+        assert set(graph.find_nodes(city='Voronezh')) == {'Ava', 'Noah'}
+
+
+class TestsUndirectedGraphMethodsIndexes:
+    """Tests of UndirectedGraph secondary indexes"""
+
+    def test_find_edges(self):
+        """Finding edges uses couple representation"""
+        graph = _clients(UndirectedGraph)
+        graph.create_index('amount', target='edges', kind='sorted')
+        graph.add_edge('Liam', 'Ava', 'p5', amount=12000)
+        assert graph.find_edges(amount__gt=10000) == {
+            ('Ava', 'Liam'): {'p2': {'amount': 15000}, 'p5': {'amount': 12000}}}
@@ -1,67 +1,138 @@
-"""Tests DirectedGraph and UndirectedGraph methods
+"""Tests DirectedGraph and UndirectedGraph method `neighbors`
 
-- `clear_neighbors`
-- `find_neighbors`
+if (node not exists):
+    - raise NodeIsNotExistsException
+
+- neighbors of DirectedGraph are successors of node
+- neighbors of UndirectedGraph are in both directions
+- neighbors are maintained when edges are added and removed
+- neighbors are built lazily on the first lookup after construction and
+  after changes with recalculate_calculated_attributes=False
 """
 
-from connectionz import DirectedGraph, UndirectedGraph
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph, NodeIsNotExistsException
 
 
 class TestsDirectedGraphMethodNeighbors:
-    """Tests of DirectedGraph methods `clear_neighbors` and `find_neighbors`"""
+    """Tests of DirectedGraph method `neighbors`"""
 
-    def test_clear_neighbors(self):
-        """Setting neighbors value to empty set for all nodes in graph"""
+    def test_neighbors(self):
+        """Neighbors of all nodes in graph"""
         graph = DirectedGraph()
-        graph.add_edge('Christopher', 'Eva', recalculate_calculated_attributes=False)
-        graph.add_edge('Santiago', 'Caroline', recalculate_calculated_attributes=False)
-        graph.add_edge('Santiago', 'Everly', recalculate_calculated_attributes=False)
-        graph.clear_neighbors()
-        assert (graph.nodes['Christopher']['neighbors'] == set()
-            and graph.nodes['Eva']['neighbors'] == set()
-            and graph.nodes['Santiago']['neighbors'] == set()
-            and graph.nodes['Caroline']['neighbors'] == set()
-            and graph.nodes['Everly']['neighbors'] == set())
-
-    def test_find_neighbors(self):
-        """Finding neighbors for all nodes in graph"""
+        graph.add_edge('Christopher', 'Eva')
+        graph.add_edge('Santiago', 'Caroline')
+        graph.add_edge('Santiago', 'Everly')
+        assert (set(graph.neighbors('Christopher')) == {'Eva'}
+            and set(graph.neighbors('Eva')) == set()
+            and set(graph.neighbors('Santiago')) == {'Caroline', 'Everly'}
+            and set(graph.neighbors('Caroline')) == set()
+            and set(graph.neighbors('Everly')) == set())
+
+    def test_neighbors_after_deleting(self):
+        """Node is not neighbor after deleting all edges between nodes"""
+        graph = DirectedGraph()
+        graph.add_edge('Santiago', 'Caroline', 'e1')
+        graph.add_edge('Santiago', 'Caroline', 'e2')
+        graph.add_edge('Santiago', 'Everly', 'e3')
+        graph.del_edge('Santiago', 'Caroline', 'e1')
+        graph.del_edge('Santiago', 'Caroline', 'e2')
+        assert (set(graph.neighbors('Santiago')) == {'Everly'}
+            and set(graph.neighbors('Everly')) == set())
+
+    def test_exception_node_is_not_exists(self):
+        """Expected raise NodeIsNotExistsException"""
         graph = DirectedGraph()
-        graph.add_edge('Christopher', 'Eva', recalculate_calculated_attributes=False)
-        graph.add_edge('Santiago', 'Caroline', recalculate_calculated_attributes=False)
+        with pytest.raises(NodeIsNotExistsException):
+            graph.neighbors('Christopher')
+
+    def test_lazy_construction(self):
+        """Neighbors are not built by constructor, they are built on the
+        first lookup"""
+        graph = DirectedGraph(edges=[('Santiago', 'Caroline'), ('Santiago', 'Everly')])
+        is_built = graph._adjacency_is_built
+        neighbors = set(graph.neighbors('Everly'))
+        assert not is_built and neighbors == set() and graph._adjacency_is_built
+
+    def test_bulk_changes(self):
+        """Changes without recalculation drop neighbors, the next lookup
+        rebuilds them"""
+        graph = DirectedGraph(edges=[('Santiago', 'Caroline')])
+        graph.neighbors('Santiago')
         graph.add_edge('Santiago', 'Everly', recalculate_calculated_attributes=False)
-        graph.find_neighbors()
-        assert (graph.nodes['Christopher']['neighbors'] == {'Eva'}
-            and graph.nodes['Eva']['neighbors'] == set()
-            and graph.nodes['Santiago']['neighbors'] == {'Caroline', 'Everly'}
-            and graph.nodes['Caroline']['neighbors'] == set()
-            and graph.nodes['Everly']['neighbors'] == set())
+        graph.del_edge('Santiago', 'Caroline', recalculate_calculated_attributes=False)
+        is_built = graph._adjacency_is_built
+        assert (not is_built
+            and set(graph.neighbors('Santiago')) == {'Everly'}
+            and set(graph.neighbors('Everly')) == set()
+            and graph.degree('Caroline') == 0)
+
+    def test_lazy_snapshot(self):
+        """Snapshot of graph without neighbors builds its own neighbors"""
+        graph = DirectedGraph(edges=[('Santiago', 'Caroline')])
+        snapshot = graph.snapshot()
+        snapshot.add_edge('Santiago', 'Everly')
+        assert (set(snapshot.neighbors('Santiago')) == {'Caroline', 'Everly'}
+            and set(graph.neighbors('Santiago')) == {'Caroline'})
 
 
 class TestsUndirectedGraphMethodNeighbors:
-    """Tests of UndirectedGraph methods `clear_neighbors` and `find_neighbors`"""
+    """Tests of UndirectedGraph method `neighbors`"""
 
-    def test_clear_neighbors(self):
-        """Setting neighbors value to empty set for all nodes in graph"""
+    def test_neighbors(self):
+        """Neighbors of all nodes in graph"""
         graph = UndirectedGraph()
-        graph.add_edge('Christopher', 'Eva', recalculate_calculated_attributes=False)
-        graph.add_edge('Santiago', 'Caroline', recalculate_calculated_attributes=False)
-        graph.add_edge('Santiago', 'Everly', recalculate_calculated_attributes=False)
-        graph.clear_neighbors()
-        assert (graph.nodes['Christopher']['neighbors'] == set()
-            and graph.nodes['Eva']['neighbors'] == set()
-            and graph.nodes['Santiago']['neighbors'] == set()
-            and graph.nodes['Caroline']['neighbors'] == set()
-            and graph.nodes['Everly']['neighbors'] == set())
-
-    def test_find_neighbors(self):
-        """Finding neighbors for all nodes in graph"""
+        graph.add_edge('Christopher', 'Eva')
+        graph.add_edge('Santiago', 'Caroline')
+        graph.add_edge('Santiago', 'Everly')
+        assert (set(graph.neighbors('Christopher')) == {'Eva'}
+            and set(graph.neighbors('Eva')) == {'Christopher'}
+            and set(graph.neighbors('Santiago')) == {'Caroline', 'Everly'}
+            and set(graph.neighbors('Caroline')) == {'Santiago'}
+            and set(graph.neighbors('Everly')) == {'Santiago'})
+
+    def test_neighbors_after_deleting(self):
+        """Node is not neighbor after deleting all edges between nodes"""
+        graph = UndirectedGraph()
+        graph.add_edge('Santiago', 'Caroline', 'e1')
+        graph.add_edge('Santiago', 'Caroline', 'e2')
+        graph.add_edge('Santiago', 'Everly', 'e3')
+        graph.del_edge('Santiago', 'Caroline', 'e1')
+        graph.del_edge('Santiago', 'Caroline', 'e2')
+        assert (set(graph.neighbors('Santiago')) == {'Everly'}
+            and set(graph.neighbors('Everly')) == {'Santiago'})
+
+    def test_exception_node_is_not_exists(self):
+        """Expected raise NodeIsNotExistsException"""
         graph = UndirectedGraph()
-        graph.add_edge('Christopher', 'Eva', recalculate_calculated_attributes=False)
-        graph.add_edge('Santiago', 'Caroline', recalculate_calculated_attributes=False)
+        with pytest.raises(NodeIsNotExistsException):
+            graph.neighbors('Christopher')
+
+    def test_lazy_construction(self):
+        """Neighbors are not built by constructor, they are built on the
+        first lookup"""
+        graph = UndirectedGraph(edges=[('Santiago', 'Caroline'), ('Santiago', 'Everly')])
+        is_built = graph._adjacency_is_built
+        neighbors = set(graph.neighbors('Everly'))
+        assert not is_built and neighbors == {'Santiago'} and graph._adjacency_is_built
+
+    def test_bulk_changes(self):
+        """Changes without recalculation drop neighbors, the next lookup
+        rebuilds them"""
+        graph = UndirectedGraph(edges=[('Santiago', 'Caroline')])
+        graph.neighbors('Santiago')
         graph.add_edge('Santiago', 'Everly', recalculate_calculated_attributes=False)
-        graph.find_neighbors()
-        assert (graph.nodes['Christopher']['neighbors'] == {'Eva'}
-            and graph.nodes['Eva']['neighbors'] == {'Christopher'}
-            and graph.nodes['Santiago']['neighbors'] == {'Caroline', 'Everly'}
-            and graph.nodes['Caroline']['neighbors'] == {'Santiago'}
-            and graph.nodes['Everly']['neighbors'] == {'Santiago'})
+        graph.del_edge('Santiago', 'Caroline', recalculate_calculated_attributes=False)
+        is_built = graph._adjacency_is_built
+        assert (not is_built
+            and set(graph.neighbors('Santiago')) == {'Everly'}
+            and set(graph.neighbors('Everly')) == {'Santiago'}
+            and graph.degree('Caroline') == 0)
+
+    def test_lazy_snapshot(self):
+        """Snapshot of graph without neighbors builds its own neighbors"""
+        graph = UndirectedGraph(edges=[('Santiago', 'Caroline')])
+        snapshot = graph.snapshot()
+        snapshot.add_edge('Santiago', 'Everly')
+        assert (set(snapshot.neighbors('Santiago')) == {'Caroline', 'Everly'}
+            and set(graph.neighbors('Santiago')) == {'Caroline'})
@@ -0,0 +1,140 @@
+"""Tests DirectedGraph and UndirectedGraph methods
+
+- `create_temporal_index`
+- `drop_temporal_index`
+- `get_edges_by_time`
+- `get_subgraph_by_time`
+- `get_time_windows`
+
+if (temporal index not created):
+    - raise TemporalIndexIsNotExistsException
+
+if (time value is not comparable with indexed values):
+    - raise WrongTypeOfIndexedValueException, graph is not changed
+
+- index is kept in sync on add_edge, del_edge, del_node and clear_edges
+- edges without time attribute are not indexed
+"""
+
+from datetime import date, timedelta
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph
+from connectionz.exceptions import (
+    TemporalIndexIsNotExistsException,
+    WrongTypeOfIndexedValueException)
+
+
+def _payments(graph_class):
+    """Creates graph with payments in January 2024"""
+    graph = graph_class()
+    graph.add_edge('Ava', 'Liam', 'p1', date=date(2024, 1, 1), amount=100)
+    graph.add_edge('Ava', 'Liam', 'p2', date=date(2024, 1, 5), amount=200)
+    graph.add_edge('Liam', 'Noah', 'p3', date=date(2024, 1, 3), amount=300)
+    graph.add_edge('Noah', 'Emma', 'p4', date=date(2024, 1, 9), amount=400)
+    graph.add_edge('Noah', 'Emma', 'p5', amount=500)  # without date
+    return graph
+
+
+class TestsDirectedGraphMethodsTemporalIndex:
+    """Tests of DirectedGraph temporal index methods"""
+
+    def test_exception_temporal_index_is_not_exists(self):
+        """Querying by time without temporal index"""
+        graph = _payments(DirectedGraph)
+        with pytest.raises(TemporalIndexIsNotExistsException):
+            graph.get_edges_by_time(date(2024, 1, 1), date(2024, 1, 2))
+        graph.create_temporal_index()
+        graph.drop_temporal_index()
+        with pytest.raises(TemporalIndexIsNotExistsException):
+            graph.get_subgraph_by_time(date(2024, 1, 1), date(2024, 1, 2))
+
+    def test_get_edges_by_time(self):
+        """Getting edges in time range (bounds are included)"""
+        graph = _payments(DirectedGraph)
+        graph.create_temporal_index()
+        assert (graph.get_edges_by_time(date(2024, 1, 3), date(2024, 1, 5)) == {
+                ('Liam', 'Noah'): {'p3': {'date': date(2024, 1, 3), 'amount': 300}},
+                ('Ava', 'Liam'): {'p2': {'date': date(2024, 1, 5), 'amount': 200}}}
+            and len(graph.get_edges_by_time()[('Ava', 'Liam')]) == 2
+            and ('Noah', 'Emma') not in graph.get_edges_by_time(end=date(2024, 1, 8)))
+
+    def test_get_subgraph_by_time(self):
+        """Getting subgraph with edges in time range and incident nodes"""
+        graph = _payments(DirectedGraph)
+        graph.add_node('Ava', age=23, replace=True)
+        graph.create_temporal_index()
+        subgraph = graph.get_subgraph_by_time(start=date(2024, 1, 5))
+        assert (set(subgraph.nodes) == {'Ava', 'Liam', 'Noah', 'Emma'}
+            and subgraph.nodes['Ava']['age'] == 23
+            and subgraph.edges == {
+                ('Ava', 'Liam'): {'p2': {'date': date(2024, 1, 5), 'amount': 200}},
+                ('Noah', 'Emma'): {'p4': {'date': date(2024, 1, 9), 'amount': 400}}}
+            and subgraph.degree('Noah') == 1)
+
+    def test_exception_wrong_type_of_indexed_value(self):
+        """Adding edge with time value not comparable with indexed values
+            - edge and its nodes should not be added
+            - expected raise WrongTypeOfIndexedValueException
+        """
+        graph = _payments(DirectedGraph)
+        graph.create_temporal_index()
+        expected = graph.copy()
+        for value in ('2024-02-01', None):
+            with pytest.raises(WrongTypeOfIndexedValueException):
+                graph.add_edge('Olivia', 'Mia', 'p6', date=value)
+        assert (graph == expected
+            and ('Olivia', 'Mia') not in graph.edges
+            and len(graph.get_edges_by_time()) == 3)
+
+    def test_index_in_sync_with_mutations(self):
+        """Index follows add_edge (also with replace), del_edge and del_node"""
+        graph = _payments(DirectedGraph)
+        graph.create_temporal_index()
+        graph.add_edge('Emma', 'Ava', 'p6', date=date(2024, 1, 2))
+        graph.add_edge('Ava', 'Liam', 'p1', date=date(2024, 1, 7), replace=True)
+        graph.del_edge('Ava', 'Liam', 'p2')
+        graph.del_node('Noah')
+        assert graph.get_edges_by_time() == {
+            ('Emma', 'Ava'): {'p6': {'date': date(2024, 1, 2)}},
+            ('Ava', 'Liam'): {'p1': {'date': date(2024, 1, 7)}}}
+        graph.clear_edges()
+        assert graph.get_edges_by_time() == {}
+
+    def test_get_time_windows(self):
+        """Getting sliding-window snapshots"""
+        graph = _payments(DirectedGraph)
+        graph.create_temporal_index()
+        windows = [
+            (window_start, sorted(
+                identifier for multiples in subgraph.edges.values()
+                for identifier in multiples))
+            for window_start, subgraph in graph.get_time_windows(
+                window=timedelta(days=4), step=timedelta(days=2))]
+        assert windows == [
+            (date(2024, 1, 1), ['p1', 'p3']),
+            (date(2024, 1, 3), ['p2', 'p3']),
+            (date(2024, 1, 5), ['p2']),
+            (date(2024, 1, 7), ['p4']),
+            (date(2024, 1, 9), ['p4'])]
+
+
+class TestsUndirectedGraphMethodsTemporalIndex:
+    """Tests of UndirectedGraph temporal index methods"""
+
+    def test_get_edges_by_time(self):
+        """Getting edges in time range uses couple representation"""
+        graph = _payments(UndirectedGraph)
+        graph.create_temporal_index()
+        graph.add_edge('Liam', 'Ava', 'p6', date=date(2024, 1, 4))
+        assert graph.get_edges_by_time(date(2024, 1, 4), date(2024, 1, 5)) == {
+            ('Ava', 'Liam'): {
+                'p6': {'date': date(2024, 1, 4)},
+                'p2': {'date': date(2024, 1, 5), 'amount': 200}}}
+
+    def test_get_subgraph_by_time(self):
+        """Getting subgraph with edges in time range"""
+        graph = _payments(UndirectedGraph)
+        graph.create_temporal_index()
+        subgraph = graph.get_subgraph_by_time(date(2024, 1, 1), date(2024, 1, 3))
+        assert (set(subgraph.nodes) == {'Ava', 'Liam', 'Noah'}
+            and set(subgraph.neighbors('Liam')) == {'Ava', 'Noah'})
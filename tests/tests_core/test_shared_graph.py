@@ -0,0 +1,110 @@
+"""Tests of SharedGraph"""
+
+import math
+import pickle
+from multiprocessing import get_context
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, SharedGraph, NodeIsNotExistsException)
+
+
+def _directed_graph():
+    graph = DirectedGraph(nodes=['Emma'])
+    graph.add_node('Ava', age=23, name='Ava Smith')
+    graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+    graph.add_edge('Ava', 'Liam', 'p2', amount=200.5)
+    graph.add_edge('Liam', 'Noah', 'p3', amount=300, currency='USD')
+    return graph
+
+
+def _successors_in_worker(shared_graph):
+    with shared_graph:
+        return shared_graph.successors('Ava'), sum(shared_graph.edge_attribute('amount'))
+
+
+class TestsSharedGraph:
+    """Tests of SharedGraph"""
+
+    def test_structure(self):
+        """Shared graph has nodes, couples, edges and degree of graph"""
+        graph = _directed_graph()
+        with graph.to_shared_memory() as shared_graph:
+            assert (list(shared_graph.node_identifiers()) == list(graph.nodes)
+                and shared_graph.number_of_couples == 2
+                and shared_graph.number_of_edges == 3
+                and shared_graph.couple(0) == ('Ava', 'Liam')
+                and [shared_graph.edge_identifier(edge)
+                    for edge in shared_graph.couple_edges(0)] == ['p1', 'p2']
+                and all(shared_graph.degree(node) == graph.degree(node)
+                    for node in graph.nodes))
+
+    def test_directed_adjacency(self):
+        """Successors and predecessors of DirectedGraph"""
+        with _directed_graph().to_shared_memory() as shared_graph:
+            assert (shared_graph.check_is_directed()
+                and shared_graph.successors('Ava') == ['Liam']
+                and shared_graph.predecessors('Ava') == []
+                and shared_graph.predecessors('Noah') == ['Liam']
+                and shared_graph.neighbors('Liam') == ['Noah'])
+
+    def test_undirected_adjacency(self):
+        """Neighbors of UndirectedGraph are in both directions"""
+        graph = UndirectedGraph()
+        graph.add_edge('Ava', 'Liam', 'p1')
+        graph.add_edge('Noah', 'Liam', 'p2')
+        graph.add_edge('Noah', 'Noah', 'p3')
+        with graph.to_shared_memory() as shared_graph:
+            assert (not shared_graph.check_is_directed()
+                and sorted(shared_graph.neighbors('Liam')) == ['Ava', 'Noah']
+                and sorted(shared_graph.neighbors('Noah')) == ['Liam', 'Noah']
+                and shared_graph.degree('Noah') == graph.degree('Noah'))
+
+    def test_numeric_attributes(self):
+        """Only numeric attributes are exported as float columns, missing
+        values are NaN"""
+        with _directed_graph().to_shared_memory() as shared_graph:
+            age = shared_graph.node_attribute('age')
+            assert (shared_graph.node_attributes == ['age']
+                and shared_graph.edge_attributes == ['amount']
+                and list(shared_graph.edge_attribute('amount')) == [100, 200.5, 300]
+                and age[shared_graph.node_index('Ava')] == 23
+                and math.isnan(age[shared_graph.node_index('Emma')]))
+
+    def test_views_are_read_only(self):
+        """Sections are read-only views"""
+        with _directed_graph().to_shared_memory() as shared_graph:
+            with pytest.raises(TypeError):
+                shared_graph.edge_attribute('amount')[0] = 0
+
+    def test_node_is_not_exists(self):
+        """Raise NodeIsNotExistsException for missing node"""
+        with _directed_graph().to_shared_memory() as shared_graph:
+            with pytest.raises(NodeIsNotExistsException):
+                shared_graph.successors('Olivia')
+
+    def test_attach(self):
+        """Attached shared graph reads block of owner"""
+        with _directed_graph().to_shared_memory() as shared_graph:
+            attached = SharedGraph.attach(shared_graph.name)
+            successors = attached.successors('Ava')
+            attached.close()
+            copied = pickle.loads(pickle.dumps(shared_graph))
+            is_owner = copied.owner
+            copied.close()
+            assert successors == ['Liam'] and not is_owner
+
+    def test_worker_processes(self):
+        """Worker processes receive shared graph by name"""
+        with _directed_graph().to_shared_memory() as shared_graph:
+            with get_context('spawn').Pool(2) as pool:
+                results = pool.map(_successors_in_worker, [shared_graph] * 2)
+        assert results == [(['Liam'], 600.5)] * 2
+
+    def test_unlink(self):
+        """Block is removed by owner"""
+        shared_graph = _directed_graph().to_shared_memory()
+        name = shared_graph.name
+        shared_graph.close()
+        shared_graph.unlink()
+        with pytest.raises(FileNotFoundError):
+            SharedGraph.attach(name)
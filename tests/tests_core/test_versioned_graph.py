@@ -0,0 +1,140 @@
+"""Tests of VersionedGraph"""
+
+from datetime import timezone
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, VersionedGraph, SubgraphView,
+    VersionIsNotExistsException, ClockWentBackwardsException)
+
+
+class Clock:
+    """Clock that returns 0, 10, 20, ..."""
+
+    def __init__(self):
+        self.moment = -10
+
+    def __call__(self):
+        self.moment += 10
+        return self.moment
+
+
+class TestsVersionedGraph:
+    """Tests of VersionedGraph"""
+
+    def test_mutations_create_versions(self):
+        """Each mutation creates the next version"""
+        graph = VersionedGraph(DirectedGraph())
+        graph.add_node('Emma', age=23)
+        identifier = graph.add_edge('Ava', 'Liam', amount=100)
+        graph.del_edge('Ava', 'Liam', identifier)
+        graph.del_node('Emma')
+        assert (graph.version == 4
+            and [name for _, _, name, _, _ in graph.history()] == [
+                'add_node', 'add_edge', 'del_edge', 'del_node'])
+
+    def test_failed_mutation_does_not_create_version(self):
+        """Mutation that raises exception does not create version"""
+        graph = VersionedGraph(DirectedGraph())
+        graph.add_edge('Ava', 'Liam', 'p1')
+        with pytest.raises(Exception):
+            graph.add_edge('Ava', 'Liam', 'p1')
+        assert graph.version == 1
+
+    def test_as_of(self):
+        """View of version is graph in state of version"""
+        graph = VersionedGraph(DirectedGraph(nodes=['Emma']), checkpoint_interval=3)
+        for number in range(10):
+            graph.add_edge('Ava', f'client_{number}', f'p{number}', amount=number)
+        graph.del_node('client_0')
+        view = graph.as_of(5)
+        assert (isinstance(view, SubgraphView)
+            and set(view.edges) == {('Ava', f'client_{number}') for number in range(5)}
+            and view.degree('Ava') == 5
+            and 'Emma' in view.nodes
+            and graph.as_of(0).edges == {}
+            and len(graph.as_of(graph.version).edges) == 9)
+
+    def test_as_of_is_equal_to_graph_at_version(self):
+        """Reconstructed graph is equal to graph at each version"""
+        graph = VersionedGraph(UndirectedGraph(nodes=['Emma']), checkpoint_interval=4)
+        expected = [graph.graph.copy()]
+        for number in range(6):
+            graph.add_edge('Ava', 'Liam', f'p{number}', amount=number)
+            expected.append(graph.graph.copy())
+        graph.del_edge('Liam', 'Ava', 'p2')
+        expected.append(graph.graph.copy())
+        graph.add_edge('Ava', 'Liam', 'p0', replace=True, amount=100)
+        expected.append(graph.graph.copy())
+        assert all(
+            graph.as_of(version).copy() == expected[version]
+            for version in range(graph.version + 1))
+
+    def test_as_of_is_independent_of_later_mutations(self):
+        """View of version does not follow later mutations"""
+        graph = VersionedGraph(DirectedGraph())
+        graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+        view = graph.as_of(1)
+        graph.add_edge('Ava', 'Liam', 'p1', replace=True, amount=200)
+        graph.del_node('Liam')
+        assert (view.has_edge('Ava', 'Liam', 'p1')
+            and view.edges[('Ava', 'Liam')]['p1']['amount'] == 100)
+
+    def test_checkpoints(self):
+        """Checkpoints are taken every checkpoint interval versions"""
+        graph = VersionedGraph(DirectedGraph(), checkpoint_interval=3)
+        for number in range(7):
+            graph.add_edge('Ava', 'Liam', f'p{number}')
+        graph.checkpoint()
+        assert graph._checkpoint_versions == [0, 3, 6, 7]
+
+    def test_generated_identifiers_are_recorded(self):
+        """Generated identifiers are replayed as they were generated"""
+        graph = VersionedGraph(DirectedGraph())
+        node = graph.add_node(age=23)
+        edge = graph.add_edge(node, 'Liam')
+        view = graph.as_of(2)
+        assert view.has_node(node) and view.has_edge(node, 'Liam', edge)
+
+    def test_as_of_time(self):
+        """View at moment is view of the latest version created before moment"""
+        graph = VersionedGraph(DirectedGraph(), clock=Clock())
+        graph.add_edge('Ava', 'Liam', 'p1')
+        graph.add_edge('Ava', 'Emma', 'p2')
+        graph.add_edge('Ava', 'Noah', 'p3')
+        assert (graph.version_at(25) == 2
+            and graph.version_at(30) == 3
+            and graph.time_of(1) == 10
+            and set(graph.as_of_time(15).edges) == {('Ava', 'Liam')})
+
+    def test_version_is_not_exists(self):
+        """Raise VersionIsNotExistsException for version out of history"""
+        graph = VersionedGraph(DirectedGraph(), clock=Clock())
+        graph.add_edge('Ava', 'Liam', 'p1')
+        with pytest.raises(VersionIsNotExistsException):
+            graph.as_of(2)
+        with pytest.raises(VersionIsNotExistsException):
+            graph.version_at(-1)
+
+    def test_default_clock(self):
+        """Default clock returns non-decreasing UTC times"""
+        graph = VersionedGraph(DirectedGraph())
+        for number in range(100):
+            graph.add_edge('Ava', 'Liam', f'p{number}')
+        times = [graph.time_of(version) for version in range(graph.version + 1)]
+        assert (times == sorted(times)
+            and times[0].tzinfo == timezone.utc
+            and graph.version_at(times[-1]) == graph.version)
+
+    def test_exception_clock_went_backwards(self):
+        """Clock returns time before time of the last version
+            - graph and history should not be changed
+            - expected raise ClockWentBackwardsException
+        """
+        moments = iter([0, 10, 5])
+        graph = VersionedGraph(DirectedGraph(), clock=lambda: next(moments))
+        graph.add_edge('Ava', 'Liam', 'p1')
+        with pytest.raises(ClockWentBackwardsException):
+            graph.add_edge('Ava', 'Emma', 'p2')
+        assert (graph.version == 1
+            and not graph.graph.has_node('Emma')
+            and graph.version_at(10) == 1)
@@ -0,0 +1,125 @@
+"""Tests of async tools and AsyncEdgeBatcher"""
+
+import os
+import asyncio
+from datetime import date
+import pytest
+from connectionz import (
+    DirectedGraph, UndirectedGraph, AsyncEdgeBatcher, StatsSink, instrumentation,
+    export_graph_to_json, export_graph_to_json_async, import_graph_from_json_async)
+from connectionz.exceptions import (
+    WrongFileExtensionException,
+    EdgeAlreadyExistsException)
+
+
+def _graph():
+    graph = DirectedGraph(nodes=['Emma'])
+    graph.add_edge('Ava', 'Liam', 'p1', amount=100, date=date(2024, 5, 16))
+    graph.add_edge('Liam', 'Ava', 'p2', amount=200, tags=('gift',))
+    return graph
+
+
+class TestsAsyncJSON:
+    """Tests of async export and import"""
+
+    def test_export_is_equal_to_sync_export(self, tmp_path):
+        """Async export writes the same graph as sync export"""
+        graph = _graph()
+        export_graph_to_json(graph, str(tmp_path / 'sync.json'))
+        asyncio.run(export_graph_to_json_async(
+            graph, str(tmp_path / 'async.json'), chunk_size=16))
+        with open(tmp_path / 'sync.json', encoding='utf-8') as file:
+            expected = file.read()
+        with open(tmp_path / 'async.json', encoding='utf-8') as file:
+            exported = file.read()
+        # edges delimiters are random
+        assert (len(exported) == len(expected)
+            and sorted(os.listdir(tmp_path)) == ['async.json', 'sync.json'])
+
+    def test_round_trip(self, tmp_path):
+        """Graph imported asynchronously is equal to exported graph"""
+        graph = UndirectedGraph(nodes=['Emma'])
+        graph.add_edge('Liam', 'Ava', 'p1', amount=100)
+        graph.add_edge('Ava', 'Liam', 'p2', amount=200)
+
+        async def round_trip():
+            await export_graph_to_json_async(graph, str(tmp_path / 'graph.json'))
+            return await import_graph_from_json_async(
+                str(tmp_path / 'graph.json'), chunk_size=7)
+
+        imported = asyncio.run(round_trip())
+        assert isinstance(imported, UndirectedGraph) and imported == graph
+
+    def test_export_does_not_change_graph(self, tmp_path):
+        """Async export does not convert attributes of graph"""
+        graph = _graph()
+        asyncio.run(export_graph_to_json_async(graph, str(tmp_path / 'graph.json')))
+        assert (graph.edges[('Liam', 'Ava')]['p2']['tags'] == ('gift',)
+            and set(graph.neighbors('Ava')) == {'Liam'})
+
+    def test_exception_wrong_file_extension(self, tmp_path):
+        """Trying export and import with wrong extension"""
+        with pytest.raises(WrongFileExtensionException):
+            asyncio.run(export_graph_to_json_async(_graph(), str(tmp_path / 'graph.ololo')))
+        with pytest.raises(WrongFileExtensionException):
+            asyncio.run(import_graph_from_json_async(str(tmp_path / 'graph.ololo')))
+
+    def test_instrumentation(self, tmp_path):
+        """Async tools are instrumented until coroutine is finished"""
+        import connectionz
+        with instrumentation(StatsSink()) as stats:
+            asyncio.run(connectionz.export_graph_to_json_async(
+                _graph(), str(tmp_path / 'graph.json')))
+            asyncio.run(_graph().describe_async())
+        assert (stats.stats['export_graph_to_json_async']['items'] == 2
+            and stats.stats['Graph.describe_async']['calls'] == 1)
+
+
+class TestsGraphMethodDescribeAsync:
+    """Tests of Graph method `describe_async`"""
+
+    def test_describe_async(self):
+        """Async description is equal to description"""
+        graph = _graph()
+        assert asyncio.run(graph.describe_async()) == graph.describe()
+
+
+class TestsAsyncEdgeBatcher:
+    """Tests of AsyncEdgeBatcher"""
+
+    def test_concurrent_requests_are_coalesced(self):
+        """Concurrent requests are inserted by batches"""
+        graph = DirectedGraph()
+        batcher = AsyncEdgeBatcher(graph, max_batch_size=10)
+        batches = []
+        flush = batcher.flush
+        batcher.flush = lambda: batches.append(len(batcher)) or flush()
+
+        async def insert():
+            return await asyncio.gather(*(
+                batcher.add_edge('Ava', f'client_{number}', amount=number)
+                for number in range(25)))
+
+        identifiers = asyncio.run(insert())
+        assert (len(set(identifiers)) == 25
+            and batches == [10, 10, 5]
+            and graph.degree('Ava') == 25
+            and len(set(graph.neighbors('Ava'))) == 25)
+
+    def test_failed_request(self):
+        """Failed request raises exception, other requests of batch are added"""
+        graph = DirectedGraph()
+        batcher = AsyncEdgeBatcher(graph)
+
+        async def insert():
+            return await asyncio.gather(
+                batcher.add_edge('Ava', 'Liam', 'p1'),
+                batcher.add_edge('Ava', 'Liam', 'p1'),
+                batcher.add_edge('Ava', 'Emma', 'p2'),
+                return_exceptions=True)
+
+        results = asyncio.run(insert())
+        assert (results[0] == 'p1'
+            and isinstance(results[1], EdgeAlreadyExistsException)
+            and results[2] == 'p2'
+            and len(batcher) == 0)
@@ -0,0 +1,168 @@
+"""Tests of DurableGraph"""
+
+import os
+from decimal import Decimal
+from threading import Thread
+from time import sleep
+import pytest
+from connectionz import DirectedGraph, UndirectedGraph, DurableGraph
+from connectionz.exceptions import (
+    CorruptedLogException,
+    DurableGraphIsClosedException,
+    EdgeAlreadyExistsException)
+
+
+def _segments(directory):
+    return sorted(name for name in os.listdir(directory) if name.startswith('wal-'))
+
+
+class TestsDurableGraph:
+    """Tests of DurableGraph"""
+
+    def test_recovery_after_close(self, tmp_path):
+        """Graph is recovered from log after close"""
+        with DurableGraph(tmp_path) as graph:
+            graph.add_node('Emma', age=23)
+            graph.add_edge('Ava', 'Liam', 'p1', amount=100)
+            graph.add_edge('Ava', 'Liam', 'p2', amount=200)
+            graph.del_edge('Ava', 'Liam', 'p1')
+            graph.add_edge('Liam', 'Noah', 'p3')
+            graph.del_node('Noah')
+            expected = graph.graph.copy()
+        with DurableGraph(tmp_path) as recovered:
+            assert (recovered.graph == expected
+                and recovered.sequence == 6
+                and recovered.graph.degree('Ava') == 1)
+
+    def test_undirected_graph(self, tmp_path):
+        """UndirectedGraph is recovered from checkpoint and log"""
+        with DurableGraph(tmp_path, graph_class=UndirectedGraph) as graph:
+            graph.add_edge('Liam', 'Ava', 'p1', amount=100)
+            graph.checkpoint()
+            graph.add_edge('Ava', 'Liam', 'p2', amount=200)
+            expected = graph.graph.copy()
+        with DurableGraph(tmp_path) as recovered:
+            assert (isinstance(recovered.graph, UndirectedGraph)
+                and recovered.graph == expected)
+
+    def test_group_commit(self, tmp_path):
+        """Records are written to log by groups"""
+        graph = DurableGraph(tmp_path, group_size=3, sync_interval=0)
+        path = os.path.join(tmp_path, _segments(tmp_path)[0])
+        graph.add_edge('Ava', 'Liam', 'p1')
+        graph.add_edge('Ava', 'Liam', 'p2')
+        size_before_group = os.path.getsize(path)
+        graph.add_edge('Ava', 'Liam', 'p3')
+        size_after_group = os.path.getsize(path)
+        graph.add_edge('Ava', 'Liam', 'p4')
+        graph.sync()
+        size_after_sync = os.path.getsize(path)
+        graph.close()
+        assert (size_before_group == 0
+            and 0 < size_after_group < size_after_sync)
+
+    def test_failed_mutation_is_not_logged(self, tmp_path):
+        """Mutation that raises exception is not logged"""
+        with DurableGraph(tmp_path) as graph:
+            graph.add_edge('Ava', 'Liam', 'p1')
+            with pytest.raises(EdgeAlreadyExistsException):
+                graph.add_edge('Ava', 'Liam', 'p1')
+        with DurableGraph(tmp_path) as recovered:
+            assert recovered.sequence == 1
+
+    def test_mutation_with_not_serializable_attributes(self, tmp_path):
+        """Mutation with attributes that can not be logged raises TypeError
+        and does not change graph and sequence"""
+        with DurableGraph(tmp_path) as graph:
+            graph.add_edge('Ava', 'Liam', 'p1')
+            with pytest.raises(TypeError):
+                graph.add_edge('Ava', 'Noah', 'p2', amount=Decimal('1.5'))
+            graph.add_node('Emma')
+            expected = graph.graph.copy()
+            sequence = graph.sequence
+        with DurableGraph(tmp_path) as recovered:
+            assert (not expected.has_node('Noah')
+                and sequence == 2
+                and recovered.graph == expected
+                and recovered.sequence == 2)
+
+    def test_concurrent_writers_take_one_checkpoint(self, tmp_path):
+        """Writers that reach checkpoint interval at the same time take one
+        checkpoint"""
+        graph = DurableGraph(tmp_path, sync_interval=0, checkpoint_interval=2)
+        checkpoints = []
+        write_checkpoint = graph._write_checkpoint
+        graph._write_checkpoint = lambda: checkpoints.append(write_checkpoint())
+        with graph._checkpoint_lock:  # writers wait for running checkpoint
+            threads = [
+                Thread(target=graph.add_edge, args=('Ava', f'client_{number}'))
+                for number in range(4)]
+            for thread in threads:
+                thread.start()
+            while graph.sequence < 4:
+                sleep(0.001)
+        for thread in threads:
+            thread.join()
+        graph.close()
+        assert len(checkpoints) == 1 and graph._checkpoint_sequence == 4
+
+    def test_incomplete_last_record_is_truncated(self, tmp_path):
+        """Incomplete last record (crash in the middle of write) is dropped"""
+        with DurableGraph(tmp_path) as graph:
+            graph.add_edge('Ava', 'Liam', 'p1')
+        path = os.path.join(tmp_path, _segments(tmp_path)[-1])
+        size = os.path.getsize(path)
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write('1a2b3c4d [2,"add_edge",["Ava","No')
+        with DurableGraph(tmp_path) as recovered:
+            recovered.add_edge('Ava', 'Emma', 'p2')
+        with DurableGraph(tmp_path) as recovered_again:
+            assert (recovered_again.graph.has_edge('Ava', 'Liam', 'p1')
+                and recovered_again.graph.has_edge('Ava', 'Emma', 'p2')
+                and not recovered_again.graph.has_node('Noah')
+                and os.path.getsize(path) == size)
+
+    def test_corrupted_record(self, tmp_path):
+        """Raise CorruptedLogException if record in the middle of log is
+        corrupted"""
+        with DurableGraph(tmp_path) as graph:
+            graph.add_edge('Ava', 'Liam', 'p1')
+            graph.add_edge('Ava', 'Emma', 'p2')
+        path = os.path.join(tmp_path, _segments(tmp_path)[-1])
+        with open(path, 'r', encoding='utf-8') as file:
+            lines = file.readlines()
+        with open(path, 'w', encoding='utf-8') as file:
+            file.writelines([lines[0].replace('Liam', 'Lian'), lines[1]])
+        with pytest.raises(CorruptedLogException):
+            DurableGraph(tmp_path)
+
+    def test_checkpoint(self, tmp_path):
+        """Checkpoint replaces log segments, recovery loads checkpoint and
+        replays log tail"""
+        with DurableGraph(tmp_path, checkpoint_interval=3) as graph:
+            for number in range(7):
+                graph.add_edge('Ava', f'client_{number}', f'p{number}', amount=number)
+            graph.del_edge('Ava', 'client_0', 'p0')
+            expected = graph.graph.copy()
+            segments = _segments(tmp_path)
+        with DurableGraph(tmp_path) as recovered:
+            assert (os.path.exists(os.path.join(tmp_path, 'checkpoint.json'))
+                and segments == ['wal-00000000000000000007.log']
+                and recovered.graph == expected
+                and recovered.graph.has_edge('Ava', 'client_0')
+                and recovered.sequence == 8)
+
+    def test_checkpoint_keeps_degree_attribute(self, tmp_path):
+        """Node attributes degree and neighbors are recovered from checkpoint"""
+        with DurableGraph(tmp_path) as graph:
+            graph.add_node('Ava', degree=5, neighbors=['Liam'])
+            graph.checkpoint()
+        with DurableGraph(tmp_path) as recovered:
+            assert recovered.graph.nodes['Ava'] == {'degree': 5, 'neighbors': ['Liam']}
+
+    def test_closed_graph(self, tmp_path):
+        """Raise DurableGraphIsClosedException on write after close"""
+        graph = DurableGraph(tmp_path)
+        graph.close()
+        with pytest.raises(DurableGraphIsClosedException):
+            graph.add_edge('Ava', 'Liam')
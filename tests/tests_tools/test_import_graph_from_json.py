@@ -1,6 +1,7 @@
 """Tests of function `import_graph_from_json`"""
 
 import os
+import json
 import pytest
 from connectionz import (
     DirectedGraph, UndirectedGraph,
@@ -38,6 +39,44 @@ class TestsImportGraphFromJSON:
             graph = import_graph_from_json(file_path='./graph.ololo')
         assert 'graph' not in globals() and 'graph' not in locals()
 
+    def test_couple_without_edges(self, tmp_path):
+        """Importing couple whose edges were all removed"""
+        graph = DirectedGraph()
+        graph.add_edge('Orlando', 'Aria', 'p1')
+        graph.add_edge('Aria', 'Orlando', 'p2')
+        graph.del_edge('Orlando', 'Aria', 'p1')
+        export_graph_to_json(graph=graph, file_path=str(tmp_path / 'graph.json'))
+        imported = import_graph_from_json(file_path=str(tmp_path / 'graph.json'))
+        assert (imported == graph
+            and imported.edges[('Orlando', 'Aria')] == {}
+            and os.listdir(tmp_path) == ['graph.json'])
+
+    def test_degree_and_neighbors_attributes(self, tmp_path):
+        """Node attributes degree and neighbors are imported as ordinary
+        attributes"""
+        graph = DirectedGraph()
+        graph.add_node('Aria', degree=5, neighbors=['Orlando'])
+        graph.add_edge('Orlando', 'Aria')
+        export_graph_to_json(graph=graph, file_path=str(tmp_path / 'graph.json'))
+        imported = import_graph_from_json(file_path=str(tmp_path / 'graph.json'))
+        assert imported == graph and imported.nodes['Aria']['degree'] == 5
+
+    def test_legacy_degree_and_neighbors(self, tmp_path):
+        """Degree and neighbors written to node attributes by previous
+        versions (file without format version) are not imported"""
+        data = {
+            'graph_type': 'DirectedGraph',
+            'edges_delimiter': '~',
+            'nodes': {
+                'Aria': {'age': 23, 'degree': 1, 'neighbors': []},
+                'Orlando': {'degree': 1, 'neighbors': ['Aria']}},
+            'edges': {'Orlando~Aria': {'p1': {}}}}
+        with open(tmp_path / 'graph.json', 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+        imported = import_graph_from_json(file_path=str(tmp_path / 'graph.json'))
+        assert (imported.nodes == {'Aria': {'age': 23}, 'Orlando': {}}
+            and imported.degree('Aria') == 1)
+
 
 class TestsImportDirectedGraphFromJSON:
     """Tests of importing DirectedGraph from JSON file"""
@@ -54,8 +93,8 @@ class TestsImportDirectedGraphFromJSON:
     def test_convert_neighbors_to_set(self):
         """Converting nodes attribute "neighbors" from list to set"""
         graph = import_graph_from_json(file_path='./graph.json')
-        assert (graph.nodes['Aria']['neighbors'] == set()
-            and graph.nodes['Orlando']['neighbors'] == {'Aria'})
+        assert (set(graph.neighbors('Aria')) == set()
+            and set(graph.neighbors('Orlando')) == {'Aria'})
 
 
 class TestsImportUndirectedGraphFromJSON:
@@ -73,5 +112,5 @@ class TestsImportUndirectedGraphFromJSON:
     def test_convert_neighbors_to_set(self):
         """Converting nodes attribute "neighbors" from list to set"""
         graph = import_graph_from_json(file_path='./graph.json')
-        assert (graph.nodes['Aria']['neighbors'] == {'Orlando'}
-            and graph.nodes['Orlando']['neighbors'] == {'Aria'})
+        assert (set(graph.neighbors('Aria')) == {'Orlando'}
+            and set(graph.neighbors('Orlando')) == {'Aria'})
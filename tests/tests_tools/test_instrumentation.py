@@ -0,0 +1,122 @@
+"""Tests of instrumentation
+
+- `enable_instrumentation`
+- `disable_instrumentation`
+- `instrumentation`
+
+- disabled instrumentation restores original methods and functions
+- sinks get call counts, wall time and items
+"""
+
+import logging
+import connectionz
+import connectionz.tools
+from connectionz import (
+    DirectedGraph, UndirectedGraph, Graph, StatsSink, LoggingSink, SpanSink,
+    enable_instrumentation, disable_instrumentation, instrumentation,
+    check_instrumentation_is_enabled, export_graph_to_json)
+from connectionz.exceptions import NodeIsNotExistsException
+
+
+class _Span:
+    """OpenTelemetry-style span"""
+
+    def __init__(self, name, spans):
+        self.name = name
+        self.attributes = {}
+        self.spans = spans
+
+    def __enter__(self):
+        self.spans.append(self)
+        return self
+
+    def __exit__(self, *error):
+        self.attributes['closed'] = error[0] is None or error[0].__name__
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class TestsInstrumentation:
+    """Tests of instrumentation"""
+
+    def test_disabled(self):
+        """Instrumentation wraps methods only while enabled"""
+        original = Graph.add_edge
+        with instrumentation():
+            enabled = (
+                check_instrumentation_is_enabled()
+                and DirectedGraph.add_edge is not original
+                and DirectedGraph.add_edge.__name__ == 'add_edge')
+        assert (enabled and not check_instrumentation_is_enabled()
+            and DirectedGraph.add_edge is original
+            and connectionz.export_graph_to_json is export_graph_to_json
+            and connectionz.tools.export_graph_to_json is export_graph_to_json)
+
+    def test_stats(self):
+        """Calls and items of construction and add_edge"""
+        with instrumentation(StatsSink()) as stats:
+            graph = DirectedGraph(edges=[('Ava', 'Liam'), ('Liam', 'Noah')])
+            graph.add_edge('Noah', 'Ava')
+            graph.add_edge('Noah', 'Emma', recalculate_calculated_attributes=False)
+        report = {row['operation']: row for row in stats.report()}
+        assert (report['Graph.add_edge']['calls'] == 4
+            and report['Graph.add_edge']['items'] == 4
+            and report['Graph._edges_validation']['calls'] == 1
+            and report['Graph._edges_validation']['items'] == 2
+            and report['Graph._edges_validation']['time'] > 0
+            and 'Graph.get_subgraph' not in report)
+
+    def test_adjacency_rebuild(self):
+        """Lazy rebuild of degree and adjacency is counted"""
+        graph = DirectedGraph(edges=[('Ava', 'Liam'), ('Liam', 'Noah')])
+        with instrumentation() as stats:
+            graph.degree('Ava')
+            graph.add_edge('Noah', 'Ava', recalculate_calculated_attributes=False)
+            graph.degree('Ava')
+            graph.degree('Liam')
+        row = stats.stats['DirectedGraph._build_adjacency']
+        assert row['calls'] == 2 and row['items'] == 5
+
+    def test_tools_and_errors(self, tmp_path):
+        """Export is instrumented in all namespaces, errors are counted"""
+        graph = UndirectedGraph(edges=[('Ava', 'Liam')])
+        with instrumentation() as stats:
+            connectionz.export_graph_to_json(graph, str(tmp_path / 'graph.json'))
+            try:
+                graph.del_node('Brooklyn')
+            except NodeIsNotExistsException:
+                pass
+        assert (stats.stats['export_graph_to_json']['items'] == 1
+            and stats.stats['Graph.del_node']['errors'] == 1)
+
+    def test_logging_and_span_sinks(self):
+        """Callback gets each call, span is opened and closed"""
+        calls = []
+        spans = []
+        with instrumentation(
+                LoggingSink(callback=lambda *call: calls.append(call)),
+                SpanSink(lambda name: _Span(name, spans))):
+            UndirectedGraph().add_edge('Ava', 'Liam')
+        operations = [call[0] for call in calls]
+        add_edge_span = next(span for span in spans if span.name == 'Graph.add_edge')
+        assert (operations[-1] == 'Graph.add_edge'
+            and 'Graph._edges_validation' in operations
+            and len(calls) == len(spans)
+            and add_edge_span.attributes['connectionz.items'] == 1
+            and all(span.attributes['closed'] is True for span in spans))
+
+    def test_logger(self, caplog):
+        """Logging sink writes to logger"""
+        with caplog.at_level(logging.DEBUG, logger='connectionz'):
+            enable_instrumentation(LoggingSink())
+            DirectedGraph().add_node('Ava')
+            disable_instrumentation()
+        assert 'Graph.add_node' in caplog.text
+
+    def test_graph_class_not_changed(self):
+        """Abstract Graph is not affected by enabling and disabling"""
+        abstract = Graph.__abstractmethods__
+        with instrumentation():
+            pass
+        assert Graph.__abstractmethods__ == abstract